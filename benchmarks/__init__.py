@@ -0,0 +1,6 @@
+###############################################################
+#
+# Benchmarks of the data hub on synthetic yaml-db trees
+# MBD @ RWTH, October 2026
+#
+################################################################
@@ -0,0 +1,156 @@
+###############################################################
+#
+# Runner of the benchmarks: python -m benchmarks
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# imports from system libraries if necessary
+import argparse
+import contextlib
+import importlib
+import inspect
+import itertools
+import json
+import math
+import os
+import pkgutil
+import re
+import statistics
+import sys
+import time
+import warnings
+
+from . import generator
+
+REPEAT = 5  # number of timed samples per benchmark
+MIN_TIME = 0.01  # minimum duration of a sample in s, fast benchmarks are called several times per sample
+MAX_NUMBER = 1000  # maximum number of calls per sample
+THRESHOLD = 1.5  # a benchmark regressed if it is slower than the baseline by this factor
+
+
+def discover(pattern: str = None):
+    """
+    Function to find the benchmarks in the modules bench_*.py of this package. Like in asv, a benchmark is a method
+    time_* of a class with the optional attributes params and param_names and the optional methods setup and teardown,
+    which get the parameters as arguments; a NotImplementedError in setup skips the benchmark.
+    :param pattern: regular expression, only benchmarks whose names contain a match are returned. Default is None.
+    :return: a list of (name, class, method name, parameters)
+    """
+    benchmarks = []
+    package = os.path.dirname(__file__)
+    for module_info in pkgutil.iter_modules([package]):
+        if not module_info.name.startswith('bench_'):
+            continue
+        module = importlib.import_module(f'{__package__}.{module_info.name}')
+        for class_name, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module.__name__:
+                continue
+            param_names = getattr(cls, 'param_names', [])
+            params = getattr(cls, 'params', [])
+            combinations = list(itertools.product(*params) if len(param_names) > 1 else
+                                itertools.product(params) if param_names else [()])
+            for method_name in sorted(name for name in dir(cls) if name.startswith('time_')):
+                for combination in combinations:
+                    arguments = ', '.join(f'{name}={value}' for name, value in zip(param_names, combination))
+                    name = f'{module_info.name}.{class_name}.{method_name}({arguments})'
+                    if pattern is None or re.search(pattern, name):
+                        benchmarks.append((name, cls, method_name, combination))
+    return benchmarks
+
+
+def run(cls, method_name: str = None, params=(), repeat: int = REPEAT, min_time: float = MIN_TIME):
+    """
+    Function to time a benchmark. setup and teardown are called around every sample; every sample starts with one
+    untimed call, so caches filled by the benchmark itself are warm.
+    :return: the median time per call in s or None if the benchmark is skipped
+    """
+    samples = []
+    number = None
+    for i in range(repeat):
+        benchmark = cls()
+        try:
+            if hasattr(benchmark, 'setup'):
+                benchmark.setup(*params)
+        except NotImplementedError:
+            return None
+        try:
+            method = getattr(benchmark, method_name)
+            start = time.perf_counter()
+            method(*params)
+            duration = time.perf_counter() - start
+            if number is None:  # calibrated once with the untimed call of the first sample
+                number = min(MAX_NUMBER, max(1, math.ceil(min_time / max(duration, 1e-9))))
+            start = time.perf_counter()
+            for j in range(number):
+                method(*params)
+            samples.append((time.perf_counter() - start) / number)
+        finally:
+            if hasattr(benchmark, 'teardown'):
+                benchmark.teardown(*params)
+    return statistics.median(samples)
+
+
+def _format_time(seconds):
+    if seconds is None:
+        return 'skipped'
+    for unit, factor in (('s', 1.), ('ms', 1e-3), ('us', 1e-6)):
+        if seconds >= factor:
+            return f'{seconds / factor:.3g} {unit}'
+    return f'{seconds / 1e-9:.3g} ns'
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Run the benchmarks of the data hub on '
+                                                                              'synthetic yaml-db trees.')
+    parser.add_argument('pattern', nargs='?', help='regular expression to select benchmarks by name')
+    parser.add_argument('--repeat', type=int, default=REPEAT, help=f'number of samples (default {REPEAT})')
+    parser.add_argument('--min-time', type=float, default=MIN_TIME,
+                        help=f'minimum duration of a sample in s (default {MIN_TIME})')
+    parser.add_argument('--quick', action='store_true', help='one sample with one call per benchmark')
+    parser.add_argument('--data-dir', help=f'folder of the generated trees (default ${generator.DATA_DIR_ENV} or a '
+                                           f'folder in the temporary directory)')
+    parser.add_argument('--save', help='write the results to a JSON file, e.g. as baseline')
+    parser.add_argument('--compare', help='compare with the results of a JSON file written by --save')
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help=f'factor by which a benchmark is slower than the baseline to fail (default {THRESHOLD})')
+    args = parser.parse_args(argv)
+    if args.data_dir:
+        os.environ[generator.DATA_DIR_ENV] = args.data_dir
+    if args.quick:
+        args.repeat, args.min_time = 1, 0.
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+
+    results = {}
+    regressions = []
+    for name, cls, method_name, params in discover(args.pattern):
+        # messages (e.g. of load_props) and warnings are not shown between the results
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull), warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            seconds = run(cls, method_name, params, repeat=args.repeat, min_time=args.min_time)
+        results[name] = seconds
+        line = f'{name:<100} {_format_time(seconds):>10}'
+        if baseline.get(name) and seconds is not None:
+            ratio = seconds / baseline[name]
+            line += f' {ratio:6.2f}x'
+            if ratio > args.threshold:
+                regressions.append(name)
+                line += ' REGRESSION'
+        print(line, flush=True)
+
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump(results, file, indent=1)
+    if regressions:
+        print(f'{len(regressions)} benchmarks are slower than the baseline by more than a factor {args.threshold}:')
+        print('\n'.join(regressions))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
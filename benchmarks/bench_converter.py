@@ -0,0 +1,92 @@
+###############################################################
+#
+# Benchmarks of the Converter class
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# imports from system libraries if necessary
+import os
+import shutil
+import tempfile
+
+from data_hub.library.tool.Converter import Converter
+from .generator import synthetic_db, write_converter_file
+
+
+class ReadFile:
+    """
+    Reading a .txt file at once and chunk by chunk.
+    """
+    params = [10000, 1000000]
+    param_names = ['n_rows']
+
+    def setup(self, n_rows):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.directory.name, 'data.txt')
+        write_converter_file(self.file_name, n_rows=n_rows)
+
+    def teardown(self, n_rows):
+        self.directory.cleanup()
+
+    def time_load_file(self, n_rows):
+        Converter().load_file(self.file_name)
+
+    def time_iter_file(self, n_rows):
+        for chunk in Converter().iter_file(self.file_name):
+            pass
+
+
+class CreateYaml:
+    """
+    Creating the value dictionaries of a loaded file and writing a tabulated property (1D and coordinates as keys), and
+    writing the property directly from the .txt file, which is read chunk by chunk.
+    """
+    params = ([1000, 100000], ['yaml', 'npz'])
+    param_names = ['n_rows', 'storage']
+
+    def setup(self, n_rows, storage):
+        self.directory = tempfile.TemporaryDirectory()
+        self.txt_file = os.path.join(self.directory.name, 'data.txt')
+        write_converter_file(self.txt_file, n_rows=n_rows)
+        self.data, names = Converter().load_file(self.txt_file)
+        self.save_file_name = os.path.join(self.directory.name, 'table.yaml')
+
+    def teardown(self, n_rows, storage):
+        self.directory.cleanup()
+
+    def time_create_yaml_1d(self, n_rows, storage):
+        converter = Converter()
+        value = converter.create_value_dict_1d(key_list=self.data[:, 0], value_list=self.data[:, 1])
+        converter.create_yaml(self.save_file_name, 'density', value=value, unit_str='kg/m^3', variable='depth',
+                              storage=storage)
+
+    def time_create_yaml_2d(self, n_rows, storage):
+        converter = Converter()
+        value = converter.create_value_dict_2d(key_tuple=(self.data[:, 0], self.data[:, 1], self.data[:, 2]),
+                                               value_list=self.data[:, 3])
+        converter.create_yaml(self.save_file_name, 'temperature', value=value, unit_str='K', variable='position',
+                              storage=storage)
+
+    def time_create_yaml_from_file(self, n_rows, storage):
+        Converter.create_yaml(self.save_file_name, 'temperature', txt_file=self.txt_file, key_columns=(0, 1, 2),
+                              value_column=3, unit_str='K', variable='position', storage=storage)
+
+
+class Merge:
+    """
+    Merging two YAML files of the synthetic yaml-db.
+    """
+    params = [100, 10000]
+    param_names = ['table_length']
+
+    def setup(self, table_length):
+        self.directory = tempfile.TemporaryDirectory()
+        file_list = synthetic_db(n_files=2, n_props=12, table_length=table_length, tuple_tables=1)
+        self.file1, self.file2 = [shutil.copy(file_name, self.directory.name) for file_name in file_list]
+
+    def teardown(self, table_length):
+        self.directory.cleanup()
+
+    def time_merge(self, table_length):
+        Converter.merge(self.file1, self.file2, overwrite=True)
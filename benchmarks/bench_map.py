@@ -0,0 +1,89 @@
+###############################################################
+#
+# Benchmarks of the Map class
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# imports from system libraries if necessary
+import functools
+import os
+import tempfile
+
+from data_hub.library.map.Map import Map
+from data_hub.library.regimes.Loader import load_regimes
+from .generator import synthetic_db
+
+
+@functools.lru_cache(maxsize=None)
+def _locations(n_locations):
+    # small files with a location each, loaded once per process
+    file_list = synthetic_db(n_files=n_locations, n_props=3, table_length=10, n_folders=4)
+    return list(load_regimes(file_list, workers=1).values())
+
+
+class LoadMap:
+    """
+    Adding the locations to a Folium map in the render modes of Map.
+    """
+    params = ([10, 1000], Map.RENDER_MODES)
+    param_names = ['n_locations', 'render_mode']
+
+    def setup(self, n_locations, render_mode):
+        self.locations = _locations(n_locations)
+
+    def time_load_map(self, n_locations, render_mode):
+        Map(self.locations, render_mode=render_mode).load_map()
+
+
+class ShowMap:
+    """
+    Writing the HTML file of a Folium map.
+    """
+    params = ([10, 1000], Map.RENDER_MODES)
+    param_names = ['n_locations', 'render_mode']
+
+    def setup(self, n_locations, render_mode):
+        self.locations = _locations(n_locations)
+        self.directory = tempfile.TemporaryDirectory()
+
+    def teardown(self, n_locations, render_mode):
+        self.directory.cleanup()
+
+    def time_show_map(self, n_locations, render_mode):
+        location_map = Map(self.locations, render_mode=render_mode)
+        location_map.load_map()
+        location_map.show_map(filename_html=os.path.join(self.directory.name, 'map.html'))
+
+
+class ShowMapCartopy:
+    """
+    Writing the PNG file of the 'AzimuthalEquidistant' projection, with a new base map (cold) and with the cached one
+    (warm). Skipped if the base map cannot be rendered, e.g. without the Natural Earth data of Cartopy.
+    """
+    params = [10, 1000]
+    param_names = ['n_locations']
+
+    def setup(self, n_locations):
+        self.locations = _locations(n_locations)
+        self.directory = tempfile.TemporaryDirectory()
+        try:
+            self._show_map()
+        except Exception as error:  # e.g. the coastlines cannot be downloaded
+            self.directory.cleanup()
+            raise NotImplementedError(f'The base map cannot be rendered: {error}')
+
+    def teardown(self, n_locations):
+        self.directory.cleanup()
+
+    def _show_map(self):
+        location_map = Map(self.locations, projection='AzimuthalEquidistant')
+        location_map.load_map()
+        location_map.show_map(filename_png=os.path.join(self.directory.name, 'map.png'))
+
+    def time_show_map_cold(self, n_locations):
+        Map.BASE_MAP_CACHE.clear()
+        self._show_map()
+
+    def time_show_map_warm(self, n_locations):
+        self._show_map()
@@ -0,0 +1,167 @@
+###############################################################
+#
+# Benchmarks of the Regime class
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# Python imports
+import matplotlib
+import numpy as np
+
+from data_hub.library.regimes.Regime import Regime
+from .generator import TABLE_RANGE, synthetic_db
+
+matplotlib.use('Agg')  # figures are only created, not shown
+
+N_PROPS = 12  # prop_0 is a scalar, prop_1 a table and prop_2 an expression (see generator.PROPERTY_TYPES)
+
+
+def _load(table_length, **kwargs):
+    file_name = synthetic_db(n_files=1, n_props=N_PROPS, table_length=table_length, **kwargs)[0]
+    return Regime(file_name=file_name), file_name
+
+
+class LoadProps:
+    """
+    Loading a YAML file with and without the binary cache.
+    """
+    params = ([100, 10000], [False, True])
+    param_names = ['table_length', 'use_cache']
+
+    def setup(self, table_length, use_cache):
+        self.file_name = synthetic_db(n_files=1, n_props=N_PROPS, table_length=table_length, tuple_tables=1)[0]
+        Regime().load_props(self.file_name, use_cache=use_cache)  # writes the binary cache
+
+    def time_load_props(self, table_length, use_cache):
+        Regime().load_props(self.file_name, use_cache=use_cache)
+
+
+class LoadProfiles:
+    """
+    Loading a YAML file with properties_distribution, i.e. with its 2D profile file.
+    """
+    params = ([1000, 100000], [False, True])
+    param_names = ['profile_points', 'memmap']
+
+    def setup(self, profile_points, memmap):
+        self.file_name = synthetic_db(n_files=1, n_props=3, table_length=10, profile_files=1,
+                                      profile_points=profile_points)[0]
+        self.regime = Regime(file_name=self.file_name)
+        self.regime.load_profile_data(memmap=memmap)  # writes the binary file
+
+    def time_load_profile_data(self, profile_points, memmap):
+        self.regime.load_profile_data(memmap=memmap)
+
+
+class Interpolation:
+    """
+    Interpolating tables, with a new interpolation function (cold) and with the cached one (warm).
+    """
+    params = ([100, 10000], ['linear', 'cubic'])
+    param_names = ['table_length', 'kind']
+
+    def setup(self, table_length, kind):
+        self.regime, self.file_name = _load(table_length)
+        self.points = np.linspace(*TABLE_RANGE, 1000).tolist()
+
+    def time_interpolation_cold(self, table_length, kind):
+        self.regime.interpl_dict.clear()
+        self.regime.interpolation('prop_1', self.points, kind=kind)
+
+    def time_interpolation_warm(self, table_length, kind):
+        self.regime.interpolation('prop_1', self.points, kind=kind)
+
+
+class InterpolationCoordinates:
+    """
+    Interpolating tables with coordinate tuples as keys.
+    """
+    params = ([100, 10000], ['nearest', 'linear'])
+    param_names = ['table_length', 'kind']
+
+    def setup(self, table_length, kind):
+        self.regime, self.file_name = _load(table_length, tuple_tables=1)
+        self.points = [tuple(point) for point in np.random.default_rng(0).uniform(0.1, 0.9, (1000, 3)).tolist()]
+
+    def time_interpolation_cold(self, table_length, kind):
+        self.regime.interpl_dict.clear()
+        self.regime.interpolation('coordinates_0', self.points, kind=kind)
+
+    def time_interpolation_warm(self, table_length, kind):
+        self.regime.interpolation('coordinates_0', self.points, kind=kind)
+
+
+class ScalarPropValue:
+    """
+    Single values of scalars, tables (uncached and cached) and expressions referring to another property.
+    """
+    params = [100, 10000]
+    param_names = ['table_length']
+
+    def setup(self, table_length):
+        self.regime, self.file_name = _load(table_length)
+        self.regime.store_interpolated = False
+        self.values = np.linspace(*TABLE_RANGE, 100)
+
+    def time_scalar(self, table_length):
+        self.regime.get_scalar_prop_value('prop_0')
+
+    def time_tabulated(self, table_length):
+        self.regime.interpolated_cache.clear()
+        for value in self.values:
+            self.regime.get_scalar_prop_value('prop_1', value)
+
+    def time_tabulated_cached(self, table_length):
+        for value in self.values:
+            self.regime.get_scalar_prop_value('prop_1', value)
+
+    def time_expression(self, table_length):
+        for value in self.values:
+            self.regime.get_scalar_prop_value('prop_2', value)
+
+    def time_unit(self, table_length):
+        for value in self.values:
+            self.regime.get_scalar_prop_value('prop_1', value, unit='g/cm^3')
+
+
+class PropValues:
+    """
+    Evaluating all properties of a file at many points at once.
+    """
+    params = [100, 10000]
+    param_names = ['table_length']
+
+    def setup(self, table_length):
+        self.regime, self.file_name = _load(table_length)
+        self.names = [name_props for name_props in self.regime.props if name_props.startswith('prop_')]
+        self.points = np.linspace(*TABLE_RANGE, 10000)
+
+    def time_get_prop_values(self, table_length):
+        self.regime.get_prop_values(self.names, self.points, interpolation_type='linear')
+
+
+class PlotProperty:
+    """
+    Figures of plot_property(gui=True), created (cold) and taken from the figure cache (warm).
+    """
+    params = ([1000, 100000], [True, False])
+    param_names = ['table_length', 'use_plotly']
+
+    def setup(self, table_length, use_plotly):
+        self.regime, self.file_name = _load(table_length)
+
+    def teardown(self, table_length, use_plotly):
+        import matplotlib.pyplot as plt
+        plt.close('all')
+
+    def time_tabulated_cold(self, table_length, use_plotly):
+        self.regime.figure_cache.clear()
+        self.regime.plot_property('prop_1', *TABLE_RANGE, use_plotly=use_plotly, gui=True)
+
+    def time_tabulated_warm(self, table_length, use_plotly):
+        self.regime.plot_property('prop_1', *TABLE_RANGE, use_plotly=use_plotly, gui=True)
+
+    def time_expression_cold(self, table_length, use_plotly):
+        self.regime.figure_cache.clear()
+        self.regime.plot_property('prop_2', 250., 300., use_plotly=use_plotly, gui=True)
@@ -0,0 +1,169 @@
+###############################################################
+#
+# Generator of synthetic yaml-db trees for the benchmarks
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# imports from system libraries if necessary
+import hashlib
+import json
+import os
+import tempfile
+
+# Python imports
+import numpy as np
+import yaml
+
+DATA_DIR_ENV = 'DATA_HUB_BENCHMARK_DIR'  # environment variable for the folder of the generated trees
+PROPERTY_TYPES = ['scalar', 'tabulated', 'expression']  # the properties of a file cycle through these types
+TABLE_RANGE = (0., 100.)  # range of the keys of 1D tables, e.g. a depth in m
+PROFILE_HEADER_LINES = 15  # see Profile.HEADER_LINES
+PROFILE_COUNT_LINE = 7  # see Profile.PROFILE_COUNT_LINE
+
+
+def generate_yaml_db(path: str = None, n_files: int = 10, n_props: int = 20, table_length: int = 100,
+                     tuple_tables: int = 0, n_locations: int = None, profile_files: int = 0, n_profiles: int = 4,
+                     profile_points: int = 1000, n_folders: int = 1, seed: int = 0):
+    """
+    Function to write a synthetic yaml-db tree. Every file has n_props properties, cycling through scalars, 1D tables
+    (with dev_value) and expressions which refer to a scalar of the same file; tuple-key tables, a location and a
+    properties_distribution are added on top.
+    :param path: the folder of the tree, the categories are its subfolders
+    :param n_files: number of YAML files. Default is 10.
+    :param n_props: number of properties per file (without location and properties_distribution). Default is 20.
+    :param table_length: number of entries of every table. Default is 100.
+    :param tuple_tables: number of tables per file with coordinate tuples (x, y, z) as keys. Default is 0.
+    :param n_locations: number of files with a location. Default is None (all files).
+    :param profile_files: number of files with a properties_distribution, each referring to its own profile file.
+    Default is 0.
+    :param n_profiles: number of profiles per profile file. Default is 4.
+    :param profile_points: number of points per profile. Default is 1000.
+    :param n_folders: number of categories (subfolders) the files are distributed to. Default is 1.
+    :param seed: seed of the random values, the same arguments give the same tree. Default is 0.
+    :return: the sorted list of the YAML files
+    """
+    rng = np.random.default_rng(seed)
+    if n_locations is None:
+        n_locations = n_files
+    folders = [os.path.join(path, f'category_{i}') for i in range(n_folders)]
+    for folder in folders:
+        os.makedirs(folder, exist_ok=True)
+
+    file_list = []
+    for i in range(n_files):
+        folder = folders[i % n_folders]
+        yaml_data = {'name': f'synthetic_{i}', 'description': 'Synthetic data for the benchmarks'}
+        for j in range(n_props):
+            yaml_data[f'prop_{j}'] = _property(PROPERTY_TYPES[j % len(PROPERTY_TYPES)], table_length, rng)
+        for j in range(tuple_tables):
+            yaml_data[f'coordinates_{j}'] = _coordinate_table(table_length, rng)
+        if i < n_locations:
+            yaml_data['location'] = {'type': 'coordinate',
+                                     'value': {'N': float(rng.uniform(-80., 80.)),
+                                               'E': float(rng.uniform(-180., 180.))},
+                                     'source': 'synthetic'}
+        if i < profile_files:
+            profile_file = os.path.abspath(os.path.join(folder, f'synthetic_{i}_profiles.txt'))
+            write_profile_file(profile_file, n_profiles, profile_points, rng)
+            yaml_data['properties_distribution'] = {'type': 'string', 'value': profile_file, 'source': 'synthetic'}
+        file_name = os.path.join(folder, f'synthetic_{i}.yaml')
+        with open(file_name, 'w', encoding='utf-8') as file:
+            yaml.dump(yaml_data, file)  # not safe_dump, tuple keys are written as !!python/tuple
+        file_list.append(file_name)
+    return sorted(file_list)
+
+
+def _property(prop_type, table_length, rng):
+    prop = {'type': prop_type, 'source': 'synthetic'}
+    if prop_type == 'scalar':
+        prop.update(value=float(rng.uniform(1., 1e3)), dev_pdf='Gauss', dev_value=float(rng.uniform(0., 1.)),
+                    unit_str='kg/m^3', unit=[1, -3, 0, 0, 0, 0, 0])
+    elif prop_type == 'tabulated':
+        keys = np.linspace(*TABLE_RANGE, table_length)
+        values = np.cumsum(rng.uniform(0., 1., table_length))
+        prop.update(value=dict(zip(keys.tolist(), values.tolist())), dev_pdf='Gauss',
+                    dev_value=dict(zip(keys.tolist(), (0.01 * values).tolist())),
+                    unit_str='kg/m^3', unit=[1, -3, 0, 0, 0, 0, 0],
+                    variable='depth', variable_unit_str='m', variable_unit=[0, 1, 0, 0, 0, 0, 0])
+    else:  # refers to prop_0, which is always a scalar
+        a, b = rng.uniform(0., 10., 2)
+        prop.update(value=f'{a:.4f}*x + {b:.4f}*sin(x/10.) + 1.e-3*prop_0',
+                    unit_str='kg/m^3', unit=[1, -3, 0, 0, 0, 0, 0],
+                    variable='temperature', variable_unit_str='K', variable_unit=[0, 0, 0, 1, 0, 0, 0])
+    return prop
+
+
+def _coordinate_table(table_length, rng):
+    # scattered points in a unit cube, the keys are (x, y, z) tuples
+    keys = rng.uniform(0., 1., (table_length, 3))
+    values = keys @ np.array([1., 2., 3.]) + 0.1 * rng.standard_normal(table_length)
+    return {'type': 'tabulated', 'value': dict(zip(map(tuple, keys.tolist()), values.tolist())),
+            'unit_str': 'K', 'unit': [0, 0, 0, 1, 0, 0, 0], 'variable': 'position',
+            'source': 'synthetic'}
+
+
+def write_profile_file(file_name: str = None, n_profiles: int = 4, profile_points: int = 1000, rng=None):
+    """
+    Function to write a 2D profile file as it is referred to by properties_distribution: a header, where line
+    PROFILE_COUNT_LINE ends with the number of profiles, followed by the rows x, y (in km), temperature and density;
+    row i belongs to profile i % n_profiles.
+    :param file_name: name of the .txt file
+    :param n_profiles: number of profiles. Default is 4.
+    :param profile_points: number of points per profile. Default is 1000.
+    :param rng: numpy.random.Generator. Default is None (seed 0).
+    """
+    if rng is None:
+        rng = np.random.default_rng(0)
+    header = [f'# synthetic profile file, line {i}' for i in range(PROFILE_HEADER_LINES)]
+    header[PROFILE_COUNT_LINE] = f'# number of profiles: {n_profiles}'
+    depth = np.repeat(np.linspace(0., 10., profile_points), n_profiles)
+    angle = np.tile(np.linspace(0., np.pi, n_profiles), profile_points)
+    data = np.column_stack([depth * np.cos(angle), depth * np.sin(angle),
+                            250. + 2. * depth + rng.standard_normal(depth.size),
+                            900. + 10. * depth + rng.standard_normal(depth.size)])
+    np.savetxt(file_name, data, fmt='%.6f', header='\n'.join(header), comments='')
+
+
+def write_converter_file(file_name: str = None, n_rows: int = 10000, n_columns: int = 5, seed: int = 0):
+    """
+    Function to write a .txt file as it is read by Converter.load_file: a line with the names of the columns followed
+    by the numeric rows.
+    :param file_name: name of the .txt file
+    :param n_rows: number of rows. Default is 10000.
+    :param n_columns: number of columns. Default is 5.
+    :param seed: seed of the random values. Default is 0.
+    """
+    rng = np.random.default_rng(seed)
+    data = rng.uniform(0., 1., (n_rows, n_columns))
+    data[:, 0] = np.linspace(0., 1., n_rows)  # sorted keys for 1D tables
+    np.savetxt(file_name, data, fmt='%.8f', header=' '.join(f'column_{i}' for i in range(n_columns)), comments='')
+
+
+def data_dir():
+    """
+    :return: the folder of the generated trees, DATA_HUB_BENCHMARK_DIR or a folder in the temporary directory
+    """
+    return os.environ.get(DATA_DIR_ENV) or os.path.join(tempfile.gettempdir(), 'sim_data_hub_benchmarks')
+
+
+def synthetic_db(**kwargs):
+    """
+    Function to get a synthetic yaml-db tree, which is generated once per combination of arguments (see
+    generate_yaml_db) and reused by all benchmarks and later runs.
+    :return: the sorted list of the YAML files
+    """
+    name = hashlib.sha1(json.dumps(kwargs, sort_keys=True).encode()).hexdigest()[:16]
+    path = os.path.join(data_dir(), name)
+    index_file = os.path.join(path, 'files.json')
+    try:
+        with open(index_file) as file:
+            file_list = json.load(file)
+        if all(os.path.exists(file_name) for file_name in file_list):
+            return file_list
+    except (OSError, ValueError):  # not generated yet
+        pass
+    file_list = generate_yaml_db(path, **kwargs)
+    with open(index_file, 'w') as file:
+        json.dump(file_list, file)
+    return file_list
@@ -5,6 +5,54 @@
 #
 ################################################################
 
+# imports from system libraries if necessary
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from data_hub.library.regimes.Regime import Regime as _Regime
+
+EVALUATED_TYPES = ['scalar', 'expression', 'tabulated']  # property types which can be sampled on a grid
+
+
+def default_translation(poroelastic=True, saturated=True):
+    """
+    :param poroelastic: poroelastic (True) or elastic/anelastic (False) material.
+    :param saturated: saturated (one fluid; True) or unsaturated (two fluids; False) material.
+    :return: Dictionary translating the porous material keywords to the properties of the regime
+    """
+    if poroelastic:
+        translation = {
+            'rho_s': 'density_ice',
+            'mu': 'shear_modulus_ice',
+            'phi': 'porosity_ice',
+            'kappa': 'permeability_ice',
+            'rho_w': 'density_water',
+            'k_w': 'bulk_modulus_water',
+            'nu_w': 'dynamic_viscosity_water',
+            'k': 'bulk_modulus_drained_ice',
+            'k_s': 'bulk_modulus_ice'
+        }
+        if not saturated:
+            translation.update({
+                'rho_nw': 'density_air',
+                'k_nw': 'bulk_modulus_air',
+                'nu_nw': 'dynamic_viscosity_air',
+                's_w': 'saturation_water'
+            })
+    else:
+        translation = {
+            'rho': 'density_ice',
+            'mu': 'shear_modulus_ice',
+            'k': 'bulk_modulus_drained_ice',
+            'v_p': 'velocity_P',
+            'v_s': 'velocity_S',
+            'q_p': 'Q_P',
+            'q_s': 'Q_S',
+        }
+    return translation
+
 
 def matprop(regime, poroelastic=True, saturated=True, translation=None, **kwargs):
     """
@@ -28,47 +76,23 @@ def matprop(regime, poroelastic=True, saturated=True, translation=None, **kwargs
     :param **t_inv: Inverse tortuosity (specify t or t_inv otherwise it will be estimated from the porosity)
     :param **r: Geometry factor for the shape of the pores (Default: 0.5; spherical pores)
     """
-    # local import to avoid having porodisp as a required package for ice-data-hub
-    from porodisp import material
-
     if not translation:
-        if poroelastic:
-            translation = {
-                'rho_s': 'density_ice',
-                'mu': 'shear_modulus_ice',
-                'phi': 'porosity_ice',
-                'kappa': 'permeability_ice',
-                'rho_w': 'density_water',
-                'k_w': 'bulk_modulus_water',
-                'nu_w': 'dynamic_viscosity_water',
-                'k': 'bulk_modulus_drained_ice',
-                'k_s': 'bulk_modulus_ice'
-            }
-            if not saturated:
-                translation.update({
-                    'rho_nw': 'density_air',
-                    'k_nw': 'bulk_modulus_air',
-                    'nu_nw': 'dynamic_viscosity_air',
-                    's_w': 'saturation_water'
-                })
-        else:
-            translation = {
-                'rho': 'density_ice',
-                'mu': 'shear_modulus_ice',
-                'k': 'bulk_modulus_drained_ice',
-                'v_p': 'velocity_P',
-                'v_s': 'velocity_S',
-                'q_p': 'Q_P',
-                'q_s': 'Q_S',
-            }
+        translation = default_translation(poroelastic, saturated)
 
     missing_properties = []
     for name_prop_poro, name_prop_icedb in translation.items():
         if name_prop_poro not in kwargs.keys():
             try:
-                kwargs[name_prop_poro] = regime.ice_props[name_prop_icedb]['value']
+                kwargs[name_prop_poro] = regime.props[name_prop_icedb]['value']
             except KeyError:
                 missing_properties.append(name_prop_icedb)
+    return _create_material(poroelastic, saturated, missing_properties, kwargs)
+
+
+def _create_material(poroelastic, saturated, missing_properties, kwargs):
+    # local import to avoid having porodisp as a required package for ice-data-hub
+    from porodisp import material
+
     if poroelastic:
         if missing_properties:
             raise AttributeError(f'Cannot export regime due to missing attribute(s): {", ".join(missing_properties)}')
@@ -88,3 +112,114 @@ def matprop(regime, poroelastic=True, saturated=True, translation=None, **kwargs
         except ValueError as error:
             raise AttributeError(
                 f'Cannot export regime due to missing attribute(s): {", ".join(missing_properties)}. {error}')
+
+
+class MaterialCollection(dict):
+    """
+    Dictionary of exported materials (keys as in the given regimes). Regimes which could not be exported are listed in
+    errors.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.errors = {}  # key: error message
+
+
+def matprop_batch(regimes, workers: int = None, **kwargs):
+    """
+    Function to export many regimes to porous materials in parallel. An error of one regime is reported in the errors
+    of the result and does not stop the export of the other regimes, including regimes which cannot be sent to the
+    processes; regimes whose process died are exported in the current process.
+    :param regimes: dict (e.g. a RegimeCollection) or list of regimes or YAML files; YAML files are loaded by the
+    processes
+    :param workers: number of processes; 1 exports all regimes in the current process. Default is None (number of
+    CPUs).
+    :param kwargs: parameters of matprop (poroelastic, saturated, translation and material parameters)
+    :return: a MaterialCollection with the same keys as regimes (for lists, the file names or list indices)
+    """
+    if isinstance(regimes, dict):
+        items = list(regimes.items())
+    else:  # YAML files are keyed by the file name, regimes by their position
+        items = [(regime if isinstance(regime, str) else i, regime) for i, regime in enumerate(regimes)]
+    tasks = [(key, regime, kwargs) for key, regime in items]
+    materials = MaterialCollection()
+    if not tasks:
+        return materials
+    if workers == 1:
+        results = list(map(_export_regime, tasks))
+    else:
+        results = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_export_regime, task) for task in tasks]
+            for task, future in zip(tasks, futures):
+                try:
+                    results.append(future.result())
+                except BrokenProcessPool:  # a process died, e.g. while unpickling a regime
+                    results.append(_export_regime(task))
+                except Exception as error:  # e.g. the regime cannot be pickled to be sent to a process
+                    results.append((task[0], None, f'{type(error).__name__}: {error}'))
+    for key, material, error in results:
+        if error is None:
+            materials[key] = material
+        else:
+            materials.errors[key] = error
+    return materials
+
+
+def _export_regime(task):
+    key, regime, kwargs = task
+    try:
+        if isinstance(regime, str):
+            regime = _Regime(file_name=regime)
+        return key, matprop(regime, **kwargs), None
+    except Exception as error:  # reported per regime
+        return key, None, f'{type(error).__name__}: {error}'
+
+
+def matprop_layers(regime, grid=None, poroelastic=True, saturated=True, translation=None, interpolation_type='linear',
+                   variables=None, **kwargs):
+    """
+    Function to export a stack of porous materials for a layered model, e.g. one material per depth or temperature.
+    Scalar, expression and tabulated properties are evaluated for all grid points at once (see
+    Regime.get_prop_values).
+    :param regime: Ice regime (instance of class Regime)
+    :param grid: values of the variable of the properties (e.g. depths) at which the layers are sampled
+    :param poroelastic: Export poroelastic (True) or elastic/anelastic (False) materials.
+    :param saturated: Export saturated (one fluid; True) or unsaturated (two fluids; False) materials.
+    :param translation: Dictionary translating keywords of the regime to the porous material keywords.
+    :param interpolation_type: kind of interpolation of tabulated properties. Default is 'linear'.
+    :param variables: Additional variables of expressions, single values or one value per grid point. Default is None.
+    :param kwargs: Parameters of the materials (see matprop), single values or one value per grid point.
+    :return: a list with one material per grid point
+    """
+    if not translation:
+        translation = default_translation(poroelastic, saturated)
+    grid = np.atleast_1d(np.asarray(grid, dtype=float))
+
+    missing_properties = []
+    evaluated = {}  # porous material keyword: property name
+    for name_prop_poro, name_prop_icedb in translation.items():
+        if name_prop_poro in kwargs:
+            continue
+        if name_prop_icedb in regime.props and regime.props[name_prop_icedb]['type'] in EVALUATED_TYPES:
+            evaluated[name_prop_poro] = name_prop_icedb
+        else:
+            missing_properties.append(name_prop_icedb)
+
+    values = regime.get_prop_values(list(evaluated.values()), grid, interpolation_type=interpolation_type,
+                                    as_dataframe=False, **(variables or {})) if evaluated else None
+
+    materials = []
+    for i in range(len(grid)):
+        layer = {name: _layer_value(value, i, len(grid)) for name, value in kwargs.items()}
+        for j, name_prop_poro in enumerate(evaluated):
+            layer[name_prop_poro] = float(values[i, j])
+        materials.append(_create_material(poroelastic, saturated, missing_properties, layer))
+    return materials
+
+
+def _layer_value(value, i, n_layers):
+    # parameters given per grid point or for all layers
+    if isinstance(value, (list, tuple, np.ndarray)) and len(value) == n_layers:
+        return value[i]
+    return value
@@ -8,16 +8,16 @@
 
 import os
 
-import pandas as pd
 import yaml
-from data_hub.library.regimes.Regime import Regime as _Regime
+from data_hub.library.regimes.LayeredRegime import LayeredRegime
 
 
 def straight_melting(regime, filename: str, defaults=None):
     """
     :param regime: Ice regime (instance of class Regime)
     :param filename: Output file
-    :param defaults: Dictionary with files to take _default properties from
+    :param defaults: List of files (or regimes) to take _default properties from, the first one has the highest
+    priority. Default files are loaded once per process.
     """
 
     properties_needed = ['temperature_ice', 'density_ice', 'surface_depth', 'melting_temperature_water',
@@ -29,31 +29,10 @@ def straight_melting(regime, filename: str, defaults=None):
         defaults = [os.path.join(os.pardir, 'yaml-db', '_default', 'default_expression_ice_props.yaml'),
                     os.path.join(os.pardir, 'yaml-db', '_default', 'default_ice_props.yaml')]
 
-    properties = dict()
-    for prop in properties_needed:
-        found = False
-        if prop in regime.props:
-            # if possible, get property from given regime object
-            properties[prop] = regime.props[prop]
-            found = True
-        else:
-            # lookup property in given _default databases (_default: first look for expression, then for scalar)
-            for default_file in defaults:
-                r = _Regime()
-                r.load_props(default_file)
-                if prop in r.props:
-                    properties[prop] = r.props[prop]
-                    found = True
-                    break
-        if not found:
-            raise ValueError(f'Property {prop} was not found.')
-
-    # clean HIDDEN_PARAMS
-    for prop in properties:
-        for hidden_param in r.HIDDEN_PARAMS:
-            del properties[prop][hidden_param]
-
-    properties_df = pd.DataFrame(properties)
+    # properties of the given regime, otherwise of the _default databases (first expression, then scalar)
+    layered = LayeredRegime(regime, defaults)
+    properties = {prop: layered.prop_to_dict(prop) for prop in properties_needed}
 
+    # HIDDEN_PARAMS are not part of prop_to_dict, tables are converted to dictionaries
     with open(filename, 'w') as file:
-        yaml.dump(properties_df.to_dict(), file)
+        yaml.dump(properties, file)
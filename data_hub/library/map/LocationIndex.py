@@ -0,0 +1,128 @@
+###############################################################
+#
+# Spatial index over the locations of regimes
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# Python imports
+import numpy as np
+from scipy import spatial
+
+
+class LocationIndex:
+    """
+    Class for fast spatial queries over the locations of regimes (viewport, nearest sites and radius search). The
+    locations are stored as points on the unit sphere in a KD-tree, so distances are great-circle distances.
+    """
+    EARTH_RADIUS = 6371.0088  # mean radius of the Earth in km
+
+    def __init__(self, location_list=None, radius: float = EARTH_RADIUS):
+        """
+        :param location_list: The list of regimes, regimes without the property 'location' are skipped
+        :param radius: radius of the body in km (e.g. 1560.8 for Europa), used for distances. Default is EARTH_RADIUS.
+        """
+        self.radius = radius
+        self.regimes = []  # the indexed regimes, query results are indices into this list
+        latitudes = []
+        longitudes = []
+        for location in location_list if location_list is not None else []:
+            if not location.props.__contains__('location'):
+                continue
+            self.regimes.append(location)
+            latitudes.append(location.props['location']['value']['N'])
+            longitudes.append(location.props['location']['value']['E'])
+        self._build(latitudes, longitudes)
+
+    @classmethod
+    def from_coordinates(cls, latitudes=None, longitudes=None, radius: float = EARTH_RADIUS):
+        """
+        Method to create an index from coordinates instead of regimes.
+        :param latitudes: latitudes in degree north
+        :param longitudes: longitudes in degree east
+        :param radius: radius of the body in km. Default is EARTH_RADIUS.
+        :return: a LocationIndex
+        """
+        index = cls(radius=radius)
+        index._build(latitudes, longitudes)
+        return index
+
+    def _build(self, latitudes, longitudes):
+        self.latitudes = np.asarray(latitudes, dtype=float).ravel()
+        self.longitudes = np.asarray(longitudes, dtype=float).ravel()
+        self._tree = spatial.cKDTree(self._to_xyz(self.latitudes, self.longitudes)) if len(self) else None
+        # latitudes in ascending order for the viewport queries
+        self._latitude_order = np.argsort(self.latitudes, kind='stable')
+        self._latitudes_sorted = self.latitudes[self._latitude_order]
+
+    def __len__(self):
+        return self.latitudes.shape[0]
+
+    @staticmethod
+    def _to_xyz(latitudes, longitudes):
+        latitudes = np.deg2rad(latitudes)
+        longitudes = np.deg2rad(longitudes)
+        return np.stack([np.cos(latitudes) * np.cos(longitudes), np.cos(latitudes) * np.sin(longitudes),
+                         np.sin(latitudes)], axis=-1)
+
+    def _to_distance(self, chord):
+        # great-circle distance from the distance through the unit sphere, missing neighbours (infinite chord) keep
+        # an infinite distance
+        chord = np.asarray(chord, dtype=float)
+        return np.where(np.isinf(chord), np.inf, 2. * self.radius * np.arcsin(np.clip(chord / 2., 0., 1.)))
+
+    def nearest(self, latitude, longitude, k: int = 1, max_distance: float = None):
+        """
+        Method to find the k nearest locations.
+        :param latitude: latitude(s) of the query point(s) in degree north
+        :param longitude: longitude(s) of the query point(s) in degree east
+        :param k: number of locations. Default is 1.
+        :param max_distance: only locations within this great-circle distance in km are returned. Default is None (no
+        limit).
+        :return: the distances in km and the indices of the locations, for arrays of query points with one row per
+        point; if fewer than k locations exist (or are within max_distance), missing entries have an infinite distance
+        and the index len(self)
+        """
+        if self._tree is None:
+            raise ValueError('The index does not contain any location.')
+        upper_bound = np.inf
+        if max_distance is not None and max_distance < np.pi * self.radius:
+            # chord of the distance, slightly enlarged so that locations at exactly max_distance are found
+            upper_bound = 2. * np.sin(max_distance / self.radius / 2.) * (1. + 1e-12)
+        chord, indices = self._tree.query(self._to_xyz(latitude, longitude), k=k, distance_upper_bound=upper_bound)
+        return self._to_distance(chord), indices
+
+    def within_radius(self, latitude: float, longitude: float, distance: float):
+        """
+        Method to find all locations within a distance of a point.
+        :param latitude: latitude of the point in degree north
+        :param longitude: longitude of the point in degree east
+        :param distance: great-circle distance in km
+        :return: the distances in km and the indices of the locations, sorted by distance
+        """
+        if self._tree is None:
+            return np.empty(0), np.empty(0, dtype=int)
+        chord = 2. * np.sin(min(distance / self.radius, np.pi) / 2.)
+        indices = np.array(self._tree.query_ball_point(self._to_xyz(latitude, longitude), chord), dtype=int)
+        xyz = self._to_xyz(self.latitudes[indices], self.longitudes[indices])
+        distances = self._to_distance(np.linalg.norm(xyz - self._to_xyz(latitude, longitude), axis=-1))
+        order = np.argsort(distances, kind='stable')
+        return distances[order], indices[order]
+
+    def in_bounds(self, sw_corner=None, ne_corner=None):
+        """
+        Method to find all locations in a viewport (e.g. the bounds of the Folium map).
+        :param sw_corner: [latitude, longitude] of the south-west corner
+        :param ne_corner: [latitude, longitude] of the north-east corner; if its longitude is smaller than the one of
+        sw_corner, the viewport crosses the antimeridian
+        :return: the indices of the locations
+        """
+        start = np.searchsorted(self._latitudes_sorted, sw_corner[0], side='left')
+        end = np.searchsorted(self._latitudes_sorted, ne_corner[0], side='right')
+        candidates = self._latitude_order[start:end]
+        longitudes = self.longitudes[candidates]
+        if sw_corner[1] <= ne_corner[1]:
+            mask = (longitudes >= sw_corner[1]) & (longitudes <= ne_corner[1])
+        else:
+            mask = (longitudes >= sw_corner[1]) | (longitudes <= ne_corner[1])
+        return np.sort(candidates[mask])
@@ -3,24 +3,45 @@
 # data hub Map class to plot coordinates on the map
 # Qian @ RWTH, July 2020
 ################################################################
+import hashlib
 import os
+import threading
 import webbrowser
 
 # Python imports
 import cartopy.crs as ccrs
 import folium
+from folium import plugins
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import matplotlib.pyplot as plt
 import numpy as np
 
+from .LocationIndex import LocationIndex
+from .Tiles import tile_zoom_levels
+from ..regimes.Cache import LRUCache
+
 
 class Map:
     """
     Class for visualization of locations on the Map.
     """
+    RENDER_MODES = ['markers', 'geojson', 'cluster']
+    TILES_PATH_DEFAULT = 'https://tiles.stadiamaps.com/tiles/stamen_terrain/{z}/{x}/{y}{r}.png'
+    FIGURE_SIZE = (6.4, 4.8)  # size in inches and resolution of the Cartopy maps
+    FIGURE_DPI = 100
+    AXES_POSITION = (0.125, 0.11, 0.775, 0.77)
+    BASE_MAP_CACHE_SIZE = 16  # maximum number of stored base maps (one RGBA image per projection center)
+    OVERLAY_FIGURES_SIZE = 4  # maximum number of stored figures for drawing the locations
+    # rendered base maps (stock image, coastlines, gridlines), shared by all maps
+    BASE_MAP_CACHE = LRUCache(maxsize=BASE_MAP_CACHE_SIZE)
+    # figures for drawing the locations with a lock each, reused for every map with the same base map
+    OVERLAY_FIGURES = LRUCache(maxsize=OVERLAY_FIGURES_SIZE)
 
     def __init__(self, location_list=None, map_offline: bool = False, zoom_start='auto',
-                 zoom_min=0, tiles_path: str = 'https://tiles.stadiamaps.com/tiles/stamen_terrain/{z}/{x}/{y}{r}.png', projection: str = 'Mercator',
-                 show_meta: bool = True, map_name: str = 'Earth'):
+                 zoom_min=0, tiles_path: str = TILES_PATH_DEFAULT, projection: str = 'Mercator',
+                 show_meta: bool = True, map_name: str = 'Earth', render_mode: str = 'markers', zoom_max: int = 6,
+                 base_map_cache_dir: str = None):
         """
         :param location_list: The list of locations
         :param map_offline: If there are custom maps, 'map_offline' should be set to 'True'. Default is 'False'
@@ -38,6 +59,13 @@ class Map:
         True
         :param map_name: The name for which map we want to work with (Currently we have maps for 'Earth', 'Europa'
         , 'Mars', 'Enceladus' and 'Ganymede'). Default is 'Earth'
+        :param render_mode: How the locations are added to the Folium map ('markers' (one marker with its own popup per
+        location), 'geojson' (all locations in one GeoJSON layer, markers and popups are created by the browser) or
+        'cluster' (client-side clustered markers, for thousands of locations)). Default is 'markers'
+        :param zoom_max: Maximum zoom level of offline maps, i.e. the highest zoom level of the tiles (integer). Default
+        is 6.
+        :param base_map_cache_dir: Folder to store the rendered base maps of the 'AzimuthalEquidistant' projection, so
+        they can be reused by other processes. Default is None (only kept in memory).
         """
         super().__init__()
         if location_list is None:
@@ -49,6 +77,7 @@ class Map:
         self.longitude_center = 0.
         self.zoom_start = zoom_start
         self.zoom_min = zoom_min
+        self.zoom_max = zoom_max
         self.tiles_path = tiles_path
         self.map_offline = map_offline
         self.projection = projection
@@ -59,6 +88,12 @@ class Map:
         self.map_name = map_name  # storing the name for map, for the purpose of choosing different map
         self.sw_corner = None
         self.ne_corner = None
+        if render_mode not in self.RENDER_MODES:
+            raise ValueError(f'Unknown render_mode {render_mode}, use one of {", ".join(self.RENDER_MODES)}.')
+        self.render_mode = render_mode
+        self.location_index = None  # spatial index over the locations, see get_location_index
+        self.base_map_cache_dir = base_map_cache_dir
+        self.tiles_zoom_min = 1  # lowest zoom level of the offline tiles, see set_map_offline
 
     def load_map(self, data_file_path: str = None):
         """
@@ -69,67 +104,209 @@ class Map:
         if self.projection == 'Mercator' and (not self.map_offline):  # If we want to use Cartopy, then we do not
             self.set_map_online()
 
+        locations = []  # (latitude, longitude, name, file name, properties) of every valid location
         for location in self.location_list:
-            location_file = os.path.split(location.propsfile)[-1]
-            location_name = location.name if location.name != 'Default' else location_file
-
             # load location into lists
             if not location.props.__contains__('location'):  # if not, set a random coordinate for the file
                 continue
+            location_file = os.path.split(location.propsfile)[-1]
+            location_name = location.name if location.name != 'Default' else location_file
+            locations.append((location.props['location']['value']['N'], location.props['location']['value']['E'],
+                              location_name, location_file, ', '.join(sorted(location.props.columns.values))))
+        if not locations:
+            return
 
-            location_latitude = location.props['location']['value']['N']
-            location_longitude = location.props['location']['value']['E']
-            location_color = 'yellow'  # assign the color for real loactions
-            self.location_latitude_list.append(location_latitude)  # storing the coordinates for Cartopy
-            self.location_longitude_list.append(location_longitude)
+        # storing the coordinates for Cartopy
+        self.location_latitude_list += [location[0] for location in locations]
+        self.location_longitude_list += [location[1] for location in locations]
+        # map center and bounds of all locations at once
+        latitudes = np.array(self.location_latitude_list, dtype=float)
+        longitudes = np.array(self.location_longitude_list, dtype=float)
+        self.latitude_center = float(latitudes.mean())
+        self.longitude_center = float(longitudes.mean())
+        self.sw_corner = [float(latitudes.min()), float(longitudes.min())]
+        self.ne_corner = [float(latitudes.max()), float(longitudes.max())]
+
+        if self.render_mode == 'markers':
+            self._add_markers(locations)
+        elif self.render_mode == 'geojson':
+            self._add_geojson(locations)
+        else:
+            self._add_cluster(locations)
 
+    @staticmethod
+    def _location_str(location_latitude, location_longitude):
+        location_str = f'{location_latitude}° N' if location_latitude >= 0 else f'{-1. * location_latitude}° S'
+        location_str += ', '
+        location_str += f'{location_longitude}° E' if location_longitude >= 0 else f'{-1. * location_longitude}° W'
+        return location_str
+
+    def _add_markers(self, locations):
+        """
+        Method to insert one marker with its own popup per location.
+        """
+        for location_latitude, location_longitude, location_name, location_file, location_props in locations:
+            location_color = 'yellow'  # assign the color for real loactions
             # Assembly the popup information
-            location_str = f'{location_latitude}° N' if location_latitude >= 0 else f'{-1. * location_latitude}° S'
-            location_str += ', '
-            location_str += f'{location_longitude}° E' if location_longitude >= 0 else f'{-1. * location_longitude}° W'
             popup = f'''<h4>{location_name}</h4>
-                        {location_str}<br><br>
-                        <b>Properties:</b> {', '.join(sorted(location.props.columns.values))}<br><br>
+                        {self._location_str(location_latitude, location_longitude)}<br><br>
+                        <b>Properties:</b> {location_props}<br><br>
                         <i>({location_file})</i>'''
 
             # insert the locations
-            kwargs = {'radium': 7, 'color': location_color, 'fill': True, 'fill_opcity': 0.4, 'fill_color': 'red'}
+            kwargs = {'radius': 7, 'color': location_color, 'fill': True, 'fill_opacity': 0.4, 'fill_color': 'red'}
             if self.show_tooltip:
                 kwargs.update({'tooltip': location_name, 'popup': popup})
             self.location_insert.add_child(
                 folium.CircleMarker((location_latitude, location_longitude), **kwargs))
-            # for calculating the mean, actually they are the sum
-            self.latitude_center += location_latitude
-            self.longitude_center += location_longitude
-            # update bounds
-            if self.sw_corner is None:
-                self.sw_corner = [location_latitude, location_longitude]
-            else:
-                self.sw_corner = [min(self.sw_corner[0], location_latitude), min(self.sw_corner[1], location_longitude)]
-            if self.ne_corner is None:
-                self.ne_corner = [location_latitude, location_longitude]
-            else:
-                self.ne_corner = [max(self.ne_corner[0], location_latitude), max(self.ne_corner[1], location_longitude)]
-            if self.location_list:
-                self.latitude_center /= len(self.location_list)
-            self.longitude_center /= len(self.location_list)
 
-    def show_map(self, show=False, filename_html: str = 'map.html', filename_png: str = 'map.png'):
+    def _add_geojson(self, locations):
         """
-        Method to plot locations into the map and create a map.html
+        Method to insert all locations as one GeoJSON layer.
         """
-        if self.projection == 'AzimuthalEquidistant':  # using Cartopy
-            ax = plt.axes(projection=ccrs.AzimuthalEquidistant(central_longitude=self.longitude_center,
+        features = [{'type': 'Feature',
+                     'geometry': {'type': 'Point', 'coordinates': [location_longitude, location_latitude]},
+                     'properties': {'name': location_name,
+                                    'location': self._location_str(location_latitude, location_longitude),
+                                    'properties': location_props, 'file': location_file}}
+                    for location_latitude, location_longitude, location_name, location_file, location_props
+                    in locations]
+        kwargs = {'marker': folium.CircleMarker(radius=7, color='yellow', fill=True, fill_opacity=0.4,
+                                                fill_color='red')}
+        if self.show_tooltip:
+            kwargs.update({'tooltip': folium.GeoJsonTooltip(fields=['name'], labels=False),
+                           'popup': folium.GeoJsonPopup(fields=['name', 'location', 'properties', 'file'],
+                                                        aliases=['', '', 'Properties:', ''])})
+        self.location_insert.add_child(
+            folium.GeoJson({'type': 'FeatureCollection', 'features': features}, **kwargs))
+
+    def _add_cluster(self, locations):
+        """
+        Method to insert all locations as markers which are created and clustered by the browser.
+        """
+        callback = """function (row) {
+            var marker = L.circleMarker(new L.LatLng(row[0], row[1]),
+                {radius: 7, color: 'yellow', fill: true, fillOpacity: 0.4, fillColor: 'red'});
+            if (row.length > 2) {
+                marker.bindTooltip(row[2]);
+                marker.bindPopup('<h4>' + row[2] + '</h4>' + row[3] + '<br><br><b>Properties:</b> ' + row[4] +
+                                 '<br><br><i>(' + row[5] + ')</i>');
+            }
+            return marker;
+        }"""
+        if self.show_tooltip:
+            data = [[location_latitude, location_longitude, location_name,
+                     self._location_str(location_latitude, location_longitude), location_props, location_file]
+                    for location_latitude, location_longitude, location_name, location_file, location_props
+                    in locations]
+        else:
+            data = [[location[0], location[1]] for location in locations]
+        self.location_insert.add_child(plugins.FastMarkerCluster(data, callback=callback))
+
+    def _base_map_key(self):
+        return ('AzimuthalEquidistant', round(float(self.longitude_center), 6), round(float(self.latitude_center), 6),
+                self.FIGURE_SIZE, self.FIGURE_DPI, self.AXES_POSITION)
+
+    def _new_figure(self):
+        # figure outside of pyplot, it is only rendered to an image and never shown
+        fig = Figure(figsize=self.FIGURE_SIZE, dpi=self.FIGURE_DPI)
+        FigureCanvasAgg(fig)
+        return fig
+
+    def _new_axes(self, fig):
+        ax = fig.add_axes(self.AXES_POSITION,
+                          projection=ccrs.AzimuthalEquidistant(central_longitude=self.longitude_center,
                                                                central_latitude=self.latitude_center))
+        ax.set_global()
+        return ax
+
+    def get_base_map(self):
+        """
+        Method to get the base map (stock image, coastlines and gridlines) of the 'AzimuthalEquidistant' projection.
+        The base map is rendered once per projection center and kept in memory (and in base_map_cache_dir).
+        :return: the base map as RGBA image (numpy.array of uint8)
+        """
+        key = self._base_map_key()
+        base_map = self.BASE_MAP_CACHE.lookup(key)
+        if base_map is not None:
+            return base_map
+
+        cache_file = None
+        if self.base_map_cache_dir:
+            cache_file = os.path.join(self.base_map_cache_dir,
+                                      'base_map_' + hashlib.sha1(repr(key).encode()).hexdigest() + '.png')
+        if cache_file and os.path.exists(cache_file):
+            base_map = (plt.imread(cache_file) * 255.).round().astype(np.uint8)
+        else:
+            fig = self._new_figure()
+            ax = self._new_axes(fig)
+            ax.stock_img()
+            ax.coastlines()
+            ax.gridlines()
+            fig.canvas.draw()
+            base_map = np.array(fig.canvas.buffer_rgba())
+            if cache_file:
+                os.makedirs(self.base_map_cache_dir, exist_ok=True)
+                # replaced at once, other processes never read a partly written image
+                tmp_file = f'{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp'
+                plt.imsave(tmp_file, base_map, format='png')
+                os.replace(tmp_file, cache_file)
+        self.BASE_MAP_CACHE[key] = base_map
+        return base_map
+
+    def _render_locations(self):
+        """
+        Method to draw the locations on a transparent figure with the same projection as the base map. The figure is
+        shared by all maps with the same center, it is used by one thread at a time.
+        :return: the locations as RGBA image (numpy.array of uint8)
+        """
+        key = self._base_map_key()
+        overlay = self.OVERLAY_FIGURES.lookup(key)
+        if overlay is None:
+            fig = self._new_figure()
+            fig.patch.set_alpha(0.)
+            ax = self._new_axes(fig)
+            ax.patch.set_visible(False)
+            ax.spines['geo'].set_visible(False)
+            overlay = self.OVERLAY_FIGURES[key] = (fig, ax, threading.Lock())
+        fig, ax, lock = overlay
+        with lock:
+            for line in list(ax.lines):  # the locations of the previous map
+                line.remove()
             ax.plot(self.location_longitude_list, self.location_latitude_list, 'r.', label='locations',
                     transform=ccrs.Geodetic())
             ax.legend(loc='best')
             ax.set_global()
-            ax.stock_img()
-            ax.coastlines()
-            ax.gridlines()
-            plt.savefig(filename_png)
+            fig.canvas.draw()
+            return np.array(fig.canvas.buffer_rgba())
+
+    def get_location_index(self, radius: float = LocationIndex.EARTH_RADIUS):
+        """
+        Method to get a spatial index over the locations of location_list, e.g. for showing only the locations in the
+        current viewport or for finding the nearest site to a coordinate.
+        :param radius: radius of the body in km. Default is the radius of the Earth.
+        :return: a LocationIndex
+        """
+        if self.location_index is None or self.location_index.radius != radius:
+            self.location_index = LocationIndex(self.location_list, radius=radius)
+        return self.location_index
+
+    def show_map(self, show=False, filename_html: str = 'map.html', filename_png: str = 'map.png'):
+        """
+        Method to plot locations into the map and create a map.html
+        """
+        if self.projection == 'AzimuthalEquidistant':  # using Cartopy
+            # the base map is rendered once per center, only the locations are drawn for every map
+            base_map = self.get_base_map()
+            overlay = self._render_locations()
+            alpha = overlay[..., 3:].astype(float) / 255.
+            image = np.empty_like(base_map)
+            image[..., :3] = np.round(overlay[..., :3] * alpha + base_map[..., :3] * (1. - alpha))
+            image[..., 3] = np.maximum(overlay[..., 3], base_map[..., 3])
+            plt.imsave(filename_png, image)
             if show:
+                fig = plt.figure(figsize=self.FIGURE_SIZE, dpi=self.FIGURE_DPI)
+                fig.figimage(image)
                 plt.show()
         else:  # using folium
             # evaluate state of location list:
@@ -149,8 +326,8 @@ class Map:
                       'tiles': self.tiles_path,
                       'attr': self.attribute}
             if self.map_offline:
-                kwargs['min_zoom'] = 1
-                kwargs['max_zoom'] = 6
+                kwargs['min_zoom'] = self.tiles_zoom_min
+                kwargs['max_zoom'] = self.zoom_max
             if self.sw_corner is None or one_valid_entry:
                 # is no or one location are shown, set the center of the map to the correct location (or (0,0))
                 kwargs['location'] = [self.latitude_center, self.longitude_center]
@@ -180,10 +357,14 @@ class Map:
             tile_set = os.path.join('USGS_National_Map_Topo', '{z}', '{x}', '{y}.png')
             self.attribute = '@ Mobile Atlas Creator(MOBAC)'
         else:
-            raise NotImplementedError(
-                'Currently only Earth is available for map plotting')
+            # tiles of the other map bodies, e.g. built by Tiles.build_tile_pyramid
+            tile_set = os.path.join(self.map_name, '{z}', '{x}', '{y}.png')
+            self.attribute = self.map_name
         # local path for tiles to pass to folium Map
         self.tiles_path = os.path.join(data_file_path, tile_set)
+        # lowest zoom level of the pyramid, 1 for tile folders which cannot be read here (e.g. paths of the GUI)
+        zoom_levels = tile_zoom_levels(os.path.dirname(os.path.dirname(os.path.dirname(self.tiles_path))))
+        self.tiles_zoom_min = zoom_levels[0] if zoom_levels else 1
 
     def set_map_online(self):
         # have to run these steps
@@ -191,7 +372,9 @@ class Map:
         if self.map_name.lower() == 'earth':
             self.tiles_path = self.tiles_path
             self.attribute = 'leaflet'
-
+        elif self.tiles_path != self.TILES_PATH_DEFAULT:
+            # other map bodies need their own tile server, e.g. Tiles.TileServer
+            self.attribute = self.map_name
         else:
             raise NotImplementedError(
                 'Currently only Earth is available for map online plotting')
@@ -0,0 +1,204 @@
+###############################################################
+#
+# Building and serving tile pyramids for offline maps
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# imports from system libraries if necessary
+import email.utils
+import hashlib
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Python imports
+import numpy as np
+
+from ..regimes.Cache import LRUCache
+
+TILE_SIZE = 256  # tile size in pixels
+
+
+def build_tile_pyramid(source_file: str = None, tiles_path: str = None, map_name: str = None, zoom_min: int = 0,
+                       zoom_max: int = 6, bounds=(-180., -90., 180., 90.), image_format: str = 'png',
+                       tile_size: int = TILE_SIZE):
+    """
+    Function to build a tile pyramid ({z}/{x}/{y}.png in Web Mercator, as used by Folium/Leaflet) from a raster image in
+    equirectangular projection, e.g. a global mosaic of Europa or Mars or an image of a host rock.
+    :param source_file: the raster image (any format Pillow can read, e.g. PNG, JPG or TIFF)
+    :param tiles_path: folder of the tiles, e.g. assets/custom_tiles
+    :param map_name: name of the map body, the tiles are written to tiles_path/map_name (see Map.set_map_offline)
+    :param zoom_min: minimum zoom level. Default is 0.
+    :param zoom_max: maximum zoom level. Default is 6.
+    :param bounds: (west, south, east, north) of the image in degree. Default is the whole body.
+    :param image_format: 'png' or 'jpg'. Default is 'png'.
+    :param tile_size: tile size in pixels. Default is TILE_SIZE.
+    :return: the number of written tiles
+    """
+    # local import, Pillow is only needed for building tiles (it is installed together with matplotlib)
+    from PIL import Image
+
+    Image.MAX_IMAGE_PIXELS = None  # source mosaics are often larger than the default limit
+    with Image.open(source_file) as image:
+        source = np.asarray(image.convert('RGBA'))
+    height, width = source.shape[:2]
+    west, south, east, north = bounds
+
+    n_tiles = 0
+    pixel = np.arange(tile_size) + 0.5  # pixel centers
+    for zoom in range(zoom_min, zoom_max + 1):
+        n = 2 ** zoom
+        for x in range(n):
+            longitudes = (x * tile_size + pixel) / (tile_size * n) * 360. - 180.
+            columns = np.floor((longitudes - west) / (east - west) * width).astype(int)
+            columns_valid = (columns >= 0) & (columns < width)
+            tile_dir = os.path.join(tiles_path, map_name, str(zoom), str(x))
+            os.makedirs(tile_dir, exist_ok=True)
+            for y in range(n):
+                # inverse Web Mercator projection of the pixel rows
+                latitudes = np.rad2deg(np.arctan(np.sinh(np.pi * (1. - 2. * (y * tile_size + pixel) / (tile_size * n)))))
+                rows = np.floor((north - latitudes) / (north - south) * height).astype(int)
+                rows_valid = (rows >= 0) & (rows < height)
+
+                tile = np.zeros((tile_size, tile_size, 4), dtype=np.uint8)  # transparent outside of the image
+                valid = rows_valid[:, None] & columns_valid[None, :]
+                tile[valid] = source[np.clip(rows, 0, height - 1)[:, None],
+                                     np.clip(columns, 0, width - 1)[None, :]][valid]
+                tile_image = Image.fromarray(tile, 'RGBA')
+                if image_format == 'jpg':
+                    tile_image = tile_image.convert('RGB')
+                tile_image.save(os.path.join(tile_dir, f'{y}.{image_format}'))
+                n_tiles += 1
+    return n_tiles
+
+
+def tile_zoom_levels(tiles_folder: str = None):
+    """
+    Function to find the zoom levels of a tile pyramid which have been built.
+    :param tiles_folder: folder of the tiles of one map body, containing the folders {z}
+    :return: the sorted list of zoom levels, empty if the folder does not exist
+    """
+    try:
+        names = os.listdir(tiles_folder)
+    except OSError:
+        return []
+    return sorted(int(name) for name in names if name.isdigit() and os.path.isdir(os.path.join(tiles_folder, name)))
+
+
+class TileServer:
+    """
+    Class for serving a tile folder over HTTP, e.g. on an air-gapped cluster. Recently requested tiles are kept in
+    memory (least recently used tiles are evicted) by their modification time, so tiles rebuilt while the server runs
+    are served in their new version; missing tiles are not cached. Responses carry cache headers, so browsers only
+    request a tile once and revalidate it with its ETag.
+    """
+    CONTENT_TYPES = {'png': 'image/png', 'jpg': 'image/jpeg', 'jpeg': 'image/jpeg'}
+    TILE_PATTERN = re.compile(r'^/(?P<name>[\w\-]+(?:/[\w\-]+)*)/(?P<z>\d+)/(?P<x>\d+)/(?P<y>\d+)\.(?P<ext>png|jpe?g)$')
+
+    def __init__(self, tiles_path: str = None, host: str = '127.0.0.1', port: int = 8000, cache_size: int = 4096,
+                 max_age: int = 86400):
+        """
+        :param tiles_path: folder of the tiles, tiles are requested as /(map name)/{z}/{x}/{y}.png
+        :param host: host name or address to listen on. Default is '127.0.0.1'.
+        :param port: port to listen on, 0 chooses a free port. Default is 8000.
+        :param cache_size: number of tiles kept in memory. Default is 4096.
+        :param max_age: time in seconds browsers may cache a tile. Default is 86400 (one day).
+        """
+        self.tiles_path = os.path.abspath(tiles_path)
+        self.max_age = max_age
+        self.tile_cache = LRUCache(maxsize=cache_size)  # keys are (path, modification time, size)
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self._thread = None
+
+    @property
+    def port(self):
+        return self.server.server_address[1]
+
+    def url(self, map_name: str = None, image_format: str = 'png'):
+        """
+        :param map_name: name of the map body (folder in tiles_path)
+        :param image_format: format of the tiles. Default is 'png'.
+        :return: the tile URL for Folium, e.g. Map(tiles_path=server.url('Europa'))
+        """
+        host = self.server.server_address[0]
+        return f'http://{host}:{self.port}/{map_name}/{{z}}/{{x}}/{{y}}.{image_format}'
+
+    def read_tile(self, path):
+        """
+        :param path: the tile path relative to tiles_path
+        :return: (content, ETag, Last-Modified) of the tile or None if it does not exist
+        """
+        file_name = os.path.join(self.tiles_path, path)
+        try:
+            stat = os.stat(file_name)
+        except OSError:  # missing tiles are not cached, they can be built later
+            return None
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        tile = self.tile_cache.lookup(key)
+        if tile is None:
+            try:
+                with open(file_name, 'rb') as file:
+                    content = file.read()
+            except OSError:
+                return None
+            tile = (content, '"' + hashlib.md5(content).hexdigest() + '"',
+                    email.utils.formatdate(stat.st_mtime, usegmt=True))
+            self.tile_cache[key] = tile
+        return tile
+
+    def _handler(self):
+        server = self
+
+        class TileRequestHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                match = server.TILE_PATTERN.match(self.path.split('?', 1)[0])
+                tile = server.read_tile(self.path.split('?', 1)[0].lstrip('/')) if match else None
+                if tile is None:
+                    self.send_error(404)
+                    return
+                content, etag, modified = tile
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', server.CONTENT_TYPES[match.group('ext')])
+                self.send_header('Content-Length', str(len(content)))
+                self.send_header('Cache-Control', f'public, max-age={server.max_age}')
+                self.send_header('ETag', etag)
+                self.send_header('Last-Modified', modified)
+                self.send_header('Access-Control-Allow-Origin', '*')
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, format, *args):  # no logging of every tile request
+                pass
+
+        return TileRequestHandler
+
+    def start(self):
+        """
+        Method to serve the tiles in a background thread.
+        """
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """
+        Method to serve the tiles in the current thread (e.g. when running as a separate process).
+        """
+        self.server.serve_forever()
+
+    def stop(self):
+        """
+        Method to stop serving the tiles.
+        """
+        self.server.shutdown()
+        self.server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
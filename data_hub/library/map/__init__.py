@@ -5,4 +5,6 @@
 #
 ################################################################
 
-from .Map import *
\ No newline at end of file
+from .LocationIndex import *
+from .Map import *
+from .Tiles import *
\ No newline at end of file
@@ -0,0 +1,81 @@
+###############################################################
+#
+# Size-limited caches for the Regime class
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# imports from system libraries if necessary
+import threading
+
+# Python imports
+from collections import OrderedDict
+
+
+class LRUCache(OrderedDict):
+    """
+    Dictionary with a size limit. If the limit is reached, the least recently used entries are evicted. Lookups via
+    'lookup' are counted as hits and misses. Reading and writing entries is thread-safe.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        """
+        :param maxsize: maximum number of entries; None means no limit. Default is 128.
+        """
+        super().__init__()
+        self._lock = threading.RLock()  # reading also reorders the entries
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def __getitem__(self, key):
+        with self._lock:
+            value = super().__getitem__(key)
+            self.move_to_end(key)
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self) > self.maxsize:
+                    self.popitem(last=False)
+
+    def __reduce__(self):
+        # keep the size limit and counters when copying or pickling
+        return self.__class__, (self.maxsize,), {'hits': self.hits, 'misses': self.misses}, None, iter(self.items())
+
+    def update(self, *args, **kwargs):
+        with self._lock:
+            for key, value in dict(*args, **kwargs).items():
+                self[key] = value
+
+    def lookup(self, key, default=None):
+        """
+        Method to get an entry and count the access as hit or miss.
+        :param key: key of the entry
+        :param default: value which is returned if the key is not cached. Default is None.
+        :return: the cached value or default
+        """
+        with self._lock:
+            try:
+                value = self[key]
+            except (KeyError, TypeError):  # TypeError: unhashable keys are never cached
+                self.misses += 1
+                return default
+            self.hits += 1
+            return value
+
+    def info(self):
+        """
+        Method to get the statistics of the cache.
+        :return: a dict with hits, misses, maxsize and currsize
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'maxsize': self.maxsize, 'currsize': len(self)}
+
+    def clear(self):
+        with self._lock:
+            super().clear()
+            self.hits = 0
+            self.misses = 0
@@ -0,0 +1,173 @@
+###############################################################
+#
+# Catalog of the yaml-db with a persistent index
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# imports from system libraries if necessary
+import hashlib
+import json
+import os
+
+# Python imports
+import pandas as pd
+import yaml as yaml
+
+from .Regime import PrettySafeLoader
+
+
+class Catalog:
+    """
+    Class for indexing the YAML files of a yaml-db (name, description, location, property names and types and scalar
+    values of every file). The index is stored in a cache file and only files whose modification time, size (or hash)
+    changed are parsed again.
+    """
+    CACHE_FILE_NAME = '.catalog.json'
+    VERSION = 1  # version of the cache file layout
+    EXTENSIONS = ('.yaml', '.yml')
+
+    def __init__(self, db_path: str = None, cache_file: str = None, use_hash: bool = False):
+        """
+        :param db_path: path to the yaml-db, every folder in it is a category. Default is data_hub/yaml-db.
+        :param cache_file: file to store the index. Default is CACHE_FILE_NAME in db_path.
+        :param use_hash: if it is True, files whose modification time changed are only parsed again if their content
+        (sha1 hash) changed as well. Default is False.
+        """
+        if db_path is None:
+            db_path = os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, 'yaml-db')
+        self.db_path = os.path.abspath(db_path)
+        self.cache_file = cache_file if cache_file else os.path.join(self.db_path, self.CACHE_FILE_NAME)
+        self.use_hash = use_hash
+        self.entries = {}  # the index, keys are the file paths relative to db_path
+        self.n_parsed = 0  # number of files parsed during the last scan
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __getitem__(self, file_name):
+        return self.entries[file_name]
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def load(self):
+        """
+        Method to read the index from the cache file. A missing or outdated cache file results in an empty index.
+        """
+        self.entries = {}
+        try:
+            with open(self.cache_file, encoding='utf-8') as file:
+                cache = json.load(file)
+        except (OSError, ValueError):
+            return
+        if cache.get('version') == self.VERSION and cache.get('db_path') == self.db_path:
+            self.entries = cache['entries']
+
+    def save(self):
+        """
+        Method to write the index to the cache file.
+        """
+        tmp_file = self.cache_file + '.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as file:
+            json.dump({'version': self.VERSION, 'db_path': self.db_path, 'entries': self.entries}, file)
+        os.replace(tmp_file, self.cache_file)  # replace at once, other processes never see a partial file
+
+    def scan(self, save: bool = True):
+        """
+        Method to update the index. Only new files and files which changed since the last scan are parsed.
+        :param save: if it is True, write the index to the cache file if it changed. Default is True.
+        :return: the index, a dict with one entry per file
+        """
+        if not self.entries:
+            self.load()
+
+        found = {}
+        changed = False
+        self.n_parsed = 0
+        for category in sorted(os.listdir(self.db_path)):
+            category_path = os.path.join(self.db_path, category)
+            if not os.path.isdir(category_path):
+                continue
+            for file_name in sorted(os.listdir(category_path)):
+                if not file_name.endswith(self.EXTENSIONS):
+                    continue
+                path = os.path.join(category_path, file_name)
+                key = os.path.join(category, file_name)
+                stat = os.stat(path)
+                entry = self.entries.get(key)
+                if entry is None or entry['mtime'] != stat.st_mtime_ns or entry['size'] != stat.st_size:
+                    file_hash = self._hash(path) if self.use_hash else None
+                    if entry is None or file_hash is None or entry['hash'] != file_hash:
+                        entry = self._parse(path)
+                        entry['category'] = category
+                        self.n_parsed += 1
+                    entry.update({'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'hash': file_hash})
+                    changed = True
+                found[key] = entry
+
+        changed = changed or found.keys() != self.entries.keys()  # files might have been removed
+        self.entries = found
+        if save and changed:
+            self.save()
+        return self.entries
+
+    @staticmethod
+    def _hash(path):
+        sha1 = hashlib.sha1()
+        with open(path, 'rb') as file:
+            for block in iter(lambda: file.read(1 << 20), b''):
+                sha1.update(block)
+        return sha1.hexdigest()
+
+    @staticmethod
+    def _parse(path):
+        """
+        Method to extract the index entry of one YAML file.
+        :param path: path to the YAML file
+        :return: a dict with name, description, location, props (property types) and scalars (scalar values)
+        """
+        entry = {'name': None, 'description': None, 'location': None, 'props': {}, 'scalars': {}, 'error': None}
+        try:
+            with open(path) as file:
+                yaml_data = yaml.load(file, Loader=PrettySafeLoader) or {}
+        except (OSError, yaml.YAMLError) as error:
+            entry['error'] = str(error)
+            return entry
+        if not isinstance(yaml_data, dict):  # e.g. a list or a single value
+            entry['error'] = 'The file does not contain a mapping of properties.'
+            return entry
+
+        entry['name'] = yaml_data.pop('name', None)
+        entry['description'] = yaml_data.pop('description', None)
+        yaml_data.pop('figures', None)
+        for name_props, prop in yaml_data.items():
+            if not isinstance(prop, dict):
+                continue
+            entry['props'][name_props] = prop.get('type')
+            value = prop.get('value')
+            if prop.get('type') == 'scalar' and isinstance(value, (bool, int, float, str)):
+                entry['scalars'][name_props] = value
+            if name_props == 'location' and isinstance(value, dict):
+                entry['location'] = {'N': value.get('N'), 'E': value.get('E')}
+        return entry
+
+    def categories(self):
+        """
+        :return: a sorted list of the categories (folders) of the yaml-db
+        """
+        return sorted({entry['category'] for entry in self.entries.values()})
+
+    def files(self, category: str = None):
+        """
+        :param category: only return files of this category. Default is None (all files).
+        :return: a list of the absolute paths of the indexed files
+        """
+        return [os.path.join(self.db_path, key) for key, entry in self.entries.items()
+                if category is None or entry['category'] == category]
+
+    def to_dataframe(self):
+        """
+        :return: a pandas.DataFrame with one row per file
+        """
+        return pd.DataFrame.from_dict(self.entries, orient='index')
@@ -0,0 +1,149 @@
+###############################################################
+#
+# Binary cache for parsed YAML files of the yaml-db
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# imports from system libraries if necessary
+import datetime
+import marshal
+import os
+
+# Python imports
+import numpy as np
+import yaml as yaml
+
+from .Table import Table, to_table
+
+CACHE_DIR_NAME = '__yamlcache__'
+CACHE_VERSION = 3  # version of the layout of the cache files
+# data which marshal cannot store is replaced by a tag, a frozenset with one tuple (YAML files never contain
+# frozensets): ('array', offset, shape), ('table', keys, values, dev), ('datetime', iso) and ('date', iso)
+_TAG_TYPES = ('array', 'table', 'datetime', 'date')
+
+
+def load_yaml(file_name: str = None, loader=yaml.CSafeLoader, use_cache: bool = True, cache_dir: str = None):
+    """
+    Function to load a YAML file through a binary cache. On the first load, the parsed content is written to a cache
+    file (tabulated values as Table); later loads read the cache file as long as modification time and size of the
+    YAML file did not change. The cache file holds only data (marshal data and the arrays of the tables in a .npz
+    file), it is never executed; a cache file which cannot be read is replaced.
+    :param file_name: name of the YAML file
+    :param loader: YAML loader used for parsing the file. Default is yaml.CSafeLoader.
+    :param use_cache: if it is False, the file is always parsed. Default is True.
+    :param cache_dir: folder for the cache files. Default is CACHE_DIR_NAME next to the YAML file.
+    :return: the content of the YAML file
+    """
+    if not use_cache:
+        return _compact(_parse(file_name, loader))
+
+    cache_file = get_cache_file(file_name, loader=loader, cache_dir=cache_dir)
+    stat = os.stat(file_name)
+    signature = (CACHE_VERSION, loader.__name__, stat.st_mtime_ns, stat.st_size)
+    try:
+        with np.load(cache_file, allow_pickle=False) as cache:
+            cached_signature, data = marshal.loads(cache['data'].tobytes())
+            if cached_signature == signature:
+                return _decode(data, cache['arrays'])
+    except (OSError, EOFError, ValueError, TypeError, KeyError):  # no cache file or not readable
+        pass
+
+    data = _compact(_parse(file_name, loader))
+    try:
+        arrays = []
+        payload = marshal.dumps((signature, _encode(data, arrays, {})))
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        tmp_file = f'{cache_file}.{os.getpid()}.tmp'
+        with open(tmp_file, 'wb') as file:
+            np.savez(file, data=np.frombuffer(payload, dtype=np.uint8),
+                     arrays=np.concatenate(arrays) if arrays else np.empty(0))
+        os.replace(tmp_file, cache_file)  # replace at once, other processes never see a partial file
+    except (OSError, TypeError, ValueError):  # e.g. a read-only yaml-db, then the file is simply parsed next time
+        pass
+    return data
+
+
+def get_cache_file(file_name: str = None, loader=yaml.CSafeLoader, cache_dir: str = None):
+    """
+    :param file_name: name of the YAML file
+    :param loader: YAML loader used for parsing the file, every loader has its own cache file. Default is
+    yaml.CSafeLoader.
+    :param cache_dir: folder for the cache files. Default is CACHE_DIR_NAME next to the YAML file.
+    :return: the name of the cache file of a YAML file
+    """
+    directory, base_name = os.path.split(os.path.abspath(file_name))
+    if cache_dir is None:
+        cache_dir = os.path.join(directory, CACHE_DIR_NAME)
+    return os.path.join(cache_dir, f'{base_name}.{loader.__name__}.npz')
+
+
+def _parse(file_name, loader):
+    with open(file_name) as file:
+        return yaml.load(file, Loader=loader)
+
+
+def _compact(data):
+    """
+    Function to replace the dictionaries of tabulated properties by tables of numpy arrays.
+    """
+    if isinstance(data, dict):
+        for prop in data.values():
+            to_table(prop)
+    return data
+
+
+def _encode(data, arrays, offsets):
+    # data for marshal, the arrays are appended to arrays (offsets: offset of every array by id, offsets[None] is the
+    # size of the arrays so far)
+    if isinstance(data, dict):
+        return {_encode(key, arrays, offsets): _encode(value, arrays, offsets) for key, value in data.items()}
+    if isinstance(data, (list, tuple, set)):
+        return type(data)(_encode(item, arrays, offsets) for item in data)
+    if isinstance(data, Table):
+        dev = -1 if data.dev is None else _encode(data.dev, arrays, offsets)
+        return frozenset({('table', _encode(data.keys, arrays, offsets), _encode(data.values, arrays, offsets), dev)})
+    if isinstance(data, np.ndarray):
+        if data.dtype != float:
+            raise TypeError(f'Cannot cache arrays of type {data.dtype}.')
+        if id(data) not in offsets:  # the dev_value of a table is the array of the table
+            offsets[id(data)] = offsets.get(None, 0)
+            offsets[None] = offsets[id(data)] + data.size
+            arrays.append(data.ravel())
+        return frozenset({('array', offsets[id(data)], data.shape)})
+    if isinstance(data, datetime.datetime):
+        return frozenset({('datetime', data.isoformat())})
+    if isinstance(data, datetime.date):
+        return frozenset({('date', data.isoformat())})
+    if data is None or isinstance(data, (str, bool, int, float, bytes)):
+        return data
+    raise TypeError(f'Cannot cache {type(data).__name__}.')
+
+
+def _decode(data, flat, arrays=None):
+    # the data written by _encode, only the types of YAML files are accepted
+    arrays = {} if arrays is None else arrays  # offset: array, so that dev_value is the array of the table
+    if isinstance(data, dict):
+        return {_decode(key, flat, arrays): _decode(value, flat, arrays) for key, value in data.items()}
+    if isinstance(data, (list, tuple, set)):
+        return type(data)(_decode(item, flat, arrays) for item in data)
+    if isinstance(data, frozenset):
+        (tag, *fields), = data
+        if tag not in _TAG_TYPES:
+            raise ValueError(f'Unknown tag {tag} in the cache.')
+        if tag == 'array':
+            offset, shape = fields
+            if offset not in arrays:
+                arrays[offset] = flat[offset:offset + int(np.prod(shape))].reshape(shape)
+            return arrays[offset]
+        if tag == 'table':
+            table = Table.__new__(Table)  # the arrays are sorted already
+            table.keys, table.values = _decode(fields[0], flat, arrays), _decode(fields[1], flat, arrays)
+            table.dev = None if fields[2] == -1 else _decode(fields[2], flat, arrays)
+            return table
+        if tag == 'datetime':
+            return datetime.datetime.fromisoformat(fields[0])
+        return datetime.date.fromisoformat(fields[0])
+    if data is None or isinstance(data, (str, bool, int, float, bytes)):
+        return data
+    raise ValueError(f'Unexpected {type(data).__name__} in the cache.')
@@ -0,0 +1,87 @@
+###############################################################
+#
+# Downsampling of large series for plotting
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# Python imports
+import numpy as np
+
+METHODS = ['lttb', 'minmax']
+
+
+def downsample(x=None, y=None, max_points: int = None, method: str = 'lttb'):
+    """
+    Function to select the points of a series which are plotted, keeping the shape of the series.
+    :param x: x values of the series in ascending order
+    :param y: y values of the series
+    :param max_points: maximum number of points; None or 0 means all points
+    :param method: 'lttb' (largest triangle three buckets) or 'minmax' (minimum and maximum per bin). Default is
+    'lttb'.
+    :return: the sorted indices of the selected points
+    """
+    n = len(y)
+    if not max_points or n <= max_points or max_points < 3:
+        return np.arange(n)
+    if method == 'lttb':
+        return lttb(x, y, max_points)
+    elif method == 'minmax':
+        return minmax(x, y, max_points)
+    raise ValueError(f'Unknown downsampling method {method}, possible methods are {METHODS}.')
+
+
+def lttb(x=None, y=None, max_points: int = None):
+    """
+    Function to downsample a series with the largest triangle three buckets algorithm (Steinarsson 2013). The first and
+    last point are kept, from every bucket in between the point forming the largest triangle with the selected point of
+    the previous bucket and the mean of the next bucket is selected.
+    :param x: x values of the series in ascending order
+    :param y: y values of the series
+    :param max_points: number of points, at least 3
+    :return: the sorted indices of the selected points
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    edges = np.linspace(1, n - 1, max_points - 1).astype(int)  # buckets between the first and last point
+    # means of the buckets, the last point is the "next bucket" of the last bucket
+    counts = np.diff(edges)
+    x_means = np.append(np.add.reduceat(x[:n - 1], edges[:-1]) / counts, x[-1])
+    y_means = np.append(np.add.reduceat(y[:n - 1], edges[:-1]) / counts, y[-1])
+
+    indices = np.empty(max_points, dtype=int)
+    indices[0] = 0
+    indices[-1] = n - 1
+    selected = 0
+    for i in range(max_points - 2):
+        start, end = edges[i], edges[i + 1]
+        # twice the triangle area, the constant factor does not change the maximum
+        area = np.abs((x[selected] - x_means[i + 1]) * (y[start:end] - y[selected])
+                      - (x[selected] - x[start:end]) * (y_means[i + 1] - y[selected]))
+        selected = start + int(np.argmax(area))
+        indices[i + 1] = selected
+    return indices
+
+
+def minmax(x=None, y=None, max_points: int = None):
+    """
+    Function to downsample a series by keeping the minimum and maximum of y in every bin, which keeps peaks and the
+    envelope of noisy series.
+    :param x: x values of the series in ascending order
+    :param y: y values of the series
+    :param max_points: maximum number of points
+    :return: the sorted indices of the selected points
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    n_bins = max(max_points // 2, 1)
+    starts = np.linspace(0, n, n_bins + 1).astype(int)[:-1]  # bins with (nearly) equal numbers of points
+    counts = np.diff(np.append(starts, n))
+    positions = np.arange(n)
+    # positions of the (last) maximum and (first) minimum of every bin, bins containing nan are skipped
+    is_max = y == np.repeat(np.maximum.reduceat(y, starts), counts)
+    is_min = y == np.repeat(np.minimum.reduceat(y, starts), counts)
+    maxima = np.maximum.reduceat(np.where(is_max, positions, -1), starts)
+    minima = np.minimum.reduceat(np.where(is_min, positions, n), starts)
+    return np.unique(np.concatenate([minima[minima < n], maxima[maxima >= 0]]))
@@ -0,0 +1,112 @@
+###############################################################
+#
+# Compiled expression engine for expression properties
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# Python imports
+import ast
+
+import numpy as np
+
+
+class Expression:
+    """
+    Class for parsing and validating the value of an expression property once and evaluating the compiled form for
+    scalars or whole numpy arrays.
+    """
+    FUNCTIONS = {'exp': np.exp, 'sqrt': np.sqrt, 'sin': np.sin, 'cos': np.cos, 'tan': np.tan, 'pow': pow, 'abs': abs}
+    ALLOWED_NODES = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load, ast.Constant,
+                     ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow, ast.USub, ast.UAdd)
+
+    def __init__(self, source: str = None):
+        """
+        :param source: the expression as a string, e.g. '1.e3*(2636.77 + 1.65924*x - 0.0034135*pow(x,2))'
+        """
+        self.source = str(source).strip()
+        try:
+            tree = ast.parse(self.source, mode='eval')
+        except SyntaxError as error:
+            raise ValueError(f'Invalid expression "{self.source}": {error.msg}')
+        self.variables = self._validate(tree)  # names which have to be given for evaluating the expression
+        self.code = compile(tree, '<expression>', 'eval')
+
+    def __repr__(self):
+        return f'Expression({self.source!r})'
+
+    def _validate(self, tree):
+        """
+        Method to check that the expression only contains arithmetic and the functions in FUNCTIONS.
+        :param tree: parsed expression
+        :return: a sorted list of the variable names used in the expression
+        """
+        names = set()
+        for node in ast.walk(tree):
+            if not isinstance(node, self.ALLOWED_NODES):
+                raise ValueError(f'Invalid expression "{self.source}": {type(node).__name__} is not allowed.')
+            if isinstance(node, ast.Call):
+                if not isinstance(node.func, ast.Name) or node.func.id not in self.FUNCTIONS:
+                    raise ValueError(f'Invalid expression "{self.source}": only the functions '
+                                     f'{", ".join(self.FUNCTIONS)} can be called.')
+                if node.keywords:
+                    raise ValueError(f'Invalid expression "{self.source}": keyword arguments are not allowed.')
+            elif isinstance(node, ast.Name) and node.id not in self.FUNCTIONS:
+                names.add(node.id)
+        return sorted(names)
+
+    def evaluate(self, **variables):
+        """
+        Method to evaluate the expression. Lists and arrays are evaluated element-wise in one call.
+        :param variables: values of the variables used in the expression, e.g. x=np.linspace(0., 1., 100)
+        :return: the value of the expression, broadcast to the shape of the array inputs
+        """
+        missing = [name for name in self.variables if variables.get(name) is None]
+        if missing:
+            raise ValueError(f'Expression "{self.source}" needs a value for: {", ".join(missing)}')
+
+        namespace = {'__builtins__': {}}
+        namespace.update(self.FUNCTIONS)
+        shapes = []
+        for name, value in variables.items():
+            if isinstance(value, (list, tuple, np.ndarray)):
+                value = np.asarray(value, dtype=float)
+                shapes.append(value.shape)
+            if name in self.variables:
+                namespace[name] = value
+        result = eval(self.code, namespace)
+
+        # e.g. a constant expression evaluated for an array still returns one value per entry
+        if shapes and np.shape(result) != np.broadcast_shapes(*shapes):
+            result = np.broadcast_to(result, np.broadcast_shapes(*shapes)).copy()
+        return result
+
+
+def sort_dependencies(dependencies: dict = None):
+    """
+    Function to sort properties so that every property comes after the properties it depends on.
+    :param dependencies: dictionary of the names of the properties each property depends on
+    :return: list of the property names in evaluation order
+    """
+    order = []
+    state = {}  # 1: visiting, 2: done
+    for start in dependencies:
+        if state.get(start):
+            continue
+        path = [start]
+        stack = [iter(dependencies.get(start, ()))]
+        state[start] = 1
+        while stack:
+            dependency = next(stack[-1], None)
+            if dependency is None:  # all dependencies of path[-1] are sorted
+                stack.pop()
+                state[path[-1]] = 2
+                order.append(path.pop())
+            elif state.get(dependency) == 1:
+                cycle = path[path.index(dependency):] + [dependency]
+                raise ValueError(f'Circular dependency of properties: {" -> ".join(cycle)}')
+            elif not state.get(dependency):
+                state[dependency] = 1
+                path.append(dependency)
+                stack.append(iter(dependencies.get(dependency, ())))
+    return order
@@ -0,0 +1,92 @@
+###############################################################
+#
+# Interpolation of tabulated properties with coordinate tuples as keys
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# Python imports
+import numpy as np
+from scipy import interpolate, spatial
+
+
+class NDInterpolator:
+    """
+    Class for interpolating tabulated properties whose keys are coordinate tuples, e.g. (x, y, z). The spatial structure
+    of the chosen kind (KD-tree, Delaunay triangulation or grid axes) is built once when the class is created.
+    """
+    KINDS = ['nearest', 'linear', 'grid']
+    # kinds of scipy.interpolate.interp1d (and integer spline orders) without a counterpart for coordinate tuples, they
+    # are interpolated linearly: 'grid' if the points form a grid, else 'linear'
+    INTERP1D_KINDS = ['zero', 'slinear', 'quadratic', 'cubic', 'previous', 'next']
+
+    def __init__(self, points=None, values=None, kind='linear'):
+        """
+        :param points: the coordinates of the tabulated values, an array (or list of tuples) of shape (n, dimension)
+        :param values: the tabulated values, an array of shape (n,)
+        :param kind: Specifies the kind of interpolation ('nearest': value of the nearest point using a KD-tree,
+        'linear': linear interpolation on a Delaunay triangulation, 'grid': linear interpolation on a regular grid,
+        only possible if the points form a grid). The kinds of interp1d in INTERP1D_KINDS and integer spline orders are
+        interpolated linearly, with 'grid' if the points form a grid and 'linear' otherwise; the kind which is used is
+        stored in kind. Other kinds raise a ValueError. Default is 'linear'.
+        """
+        self.points = np.asarray(points, dtype=float)
+        self.values = np.asarray(values, dtype=float)
+        if self.points.ndim != 2 or self.points.shape[0] != self.values.shape[0]:
+            raise ValueError('The points have to be of shape (n, dimension) and match the number of values.')
+        self.dimension = self.points.shape[1]
+
+        grid = self._grid_axes()
+        if kind in self.INTERP1D_KINDS or (isinstance(kind, int) and not isinstance(kind, bool)):
+            kind = 'grid' if grid is not None else 'linear'
+        elif kind not in self.KINDS:
+            raise ValueError(f'Unknown kind {kind} of interpolation, use one of {", ".join(self.KINDS)}.')
+        self.kind = kind
+
+        if kind == 'nearest':
+            self._tree = spatial.cKDTree(self.points)
+        elif kind == 'linear':
+            self._interpl_f = interpolate.LinearNDInterpolator(spatial.Delaunay(self.points), self.values)
+        else:
+            if grid is None:
+                raise ValueError('The tabulated points do not form a regular grid.')
+            axes, indices = grid
+            grid_values = np.empty([len(axis) for axis in axes])
+            grid_values[indices] = self.values
+            self._interpl_f = interpolate.RegularGridInterpolator(axes, grid_values, bounds_error=False,
+                                                                  fill_value=np.nan)
+
+    def _grid_axes(self):
+        """
+        Method to check if the points form a regular (not necessarily equidistant) grid.
+        :return: the grid axes and the grid index of every point, or None if the points do not form a grid
+        """
+        axes = []
+        indices = []
+        for i in range(self.dimension):
+            axis, index = np.unique(self.points[:, i], return_inverse=True)
+            axes.append(axis)
+            indices.append(index.ravel())
+        if int(np.prod([len(axis) for axis in axes])) != self.points.shape[0]:
+            return None
+        # every grid node has to be occupied exactly once
+        if np.unique(np.ravel_multi_index(indices, [len(axis) for axis in axes])).size != self.points.shape[0]:
+            return None
+        return axes, tuple(indices)
+
+    def __call__(self, points):
+        """
+        :param points: a point of shape (dimension,) or points of shape (m, dimension)
+        :return: the interpolated value(s); points outside of the tabulated domain are nan (except for 'nearest')
+        """
+        points = np.asarray(points, dtype=float)
+        single = points.ndim == 1
+        points = np.atleast_2d(points)
+        if points.shape[1] != self.dimension:
+            raise ValueError(f'The points have to be of dimension {self.dimension}.')
+
+        if self.kind == 'nearest':
+            result = self.values[self._tree.query(points)[1]]
+        else:
+            result = self._interpl_f(points)
+        return result[0] if single else result
@@ -0,0 +1,167 @@
+###############################################################
+#
+# Regime with fallback to default regimes
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# imports from system libraries if necessary
+import os
+import threading
+
+# Python imports
+import pandas as pd
+
+from .Regime import Regime, _EVALUATING
+
+_DEFAULT_REGIMES = {}  # (absolute file name, regime class): (modification time, size, regime)
+_DEFAULT_LOCK = threading.Lock()
+
+
+def get_default_regime(file_name: str = None, regime_class=Regime):
+    """
+    Function to get a regime of a default file (e.g. _default/props.yaml). Every file is loaded once per process and
+    reloaded only if it was changed; the regime is frozen, as it is shared by all users (see Regime.freeze).
+    :param file_name: the YAML file
+    :param regime_class: the class of the created regime. Default is Regime.
+    :return: the frozen regime
+    """
+    file_name = os.path.abspath(file_name)
+    stat = os.stat(file_name)
+    key = (file_name, regime_class)
+    with _DEFAULT_LOCK:
+        cached = _DEFAULT_REGIMES.get(key)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2]
+        regime = regime_class(file_name=file_name).freeze()
+        _DEFAULT_REGIMES[key] = (stat.st_mtime_ns, stat.st_size, regime)
+        return regime
+
+
+def clear_default_regimes():
+    """
+    Function to empty the cache of default regimes.
+    """
+    with _DEFAULT_LOCK:
+        _DEFAULT_REGIMES.clear()
+
+
+class LayeredRegime:
+    """
+    Class for looking up properties in a regime and, if it does not have them, in default regimes (in the given
+    order). Default regimes given as file names are loaded once (see get_default_regime) and only when a property is
+    not found in the layers before. Every property name is mapped to the layer it is taken from, so lookups do not
+    search the layers. The properties an expression refers to are looked up in the layers as well, i.e. an expression
+    of a default regime uses the values of the regime on top if it has these properties.
+    """
+
+    def __init__(self, regime=None, defaults=None):
+        """
+        :param regime: the regime on top (instance of class Regime)
+        :param defaults: list of default regimes or YAML files, the first one has the highest priority
+        """
+        self.regime = regime
+        self.layers = []  # the loaded layers
+        self._owners = {}  # property name: layer
+        self._pending = list(defaults) if defaults is not None else []
+        if regime is not None:
+            self._add_layer(regime)
+
+    def _add_layer(self, layer):
+        if isinstance(layer, str):
+            layer = get_default_regime(layer)
+        self.layers.append(layer)
+        for name_props in layer.props:
+            self._owners.setdefault(name_props, layer)  # the layers before have priority
+
+    def owner(self, name_props: str = None):
+        """
+        :param name_props: Name of the property
+        :return: the regime the property is taken from or None if no layer has the property
+        """
+        layer = self._owners.get(name_props)
+        while layer is None and self._pending:
+            self._add_layer(self._pending.pop(0))
+            layer = self._owners.get(name_props)
+        return layer
+
+    def __contains__(self, name_props):
+        return self.owner(name_props) is not None
+
+    def _get_owner(self, name_props):
+        layer = self.owner(name_props)
+        if layer is None:
+            raise ValueError(f'Property {name_props} was not found.')
+        return layer
+
+    def names(self):
+        """
+        :return: the names of the properties of all layers (all default files are loaded)
+        """
+        while self._pending:
+            self._add_layer(self._pending.pop(0))
+        return list(self._owners)
+
+    def prop_to_dict(self, name_props: str = None):
+        """
+        Method to get the fields of a property from the first layer which has it (see Regime.prop_to_dict).
+        """
+        return self._get_owner(name_props).prop_to_dict(name_props)
+
+    def _dependencies(self, layer, name_props, mapping: dict, interpolation_type, memo: dict):
+        """
+        Method to evaluate the properties the expression of a property refers to, each from the first layer which has
+        it (see Regime._evaluate).
+        :return: dict of the values, empty if the property is not an expression
+        """
+        if layer.props[name_props]['type'] != 'expression':
+            return {}
+        return {name: self._evaluate(name, mapping, interpolation_type, memo)
+                for name in layer.get_expression(name_props).variables
+                if mapping.get(name) is None and name != name_props and name in self}
+
+    def _evaluate(self, name_props, mapping: dict, interpolation_type, memo: dict):
+        if name_props in memo:
+            if memo[name_props] is _EVALUATING:
+                raise ValueError(f'Circular dependency of properties at {name_props}.')
+            return memo[name_props]
+        memo[name_props] = _EVALUATING
+        layer = self._get_owner(name_props)
+        values = dict(mapping, **self._dependencies(layer, name_props, mapping, interpolation_type, memo))
+        memo[name_props] = layer._evaluate(name_props, values, interpolation_type, {})
+        return memo[name_props]
+
+    def get_scalar_prop_value(self, name_props=None, variable=None, interpolation_type='cubic', unit=None,
+                              **variables):
+        """
+        Method to get a value of a property from the first layer which has it (see Regime.get_scalar_prop_value).
+        """
+        layer = self._get_owner(name_props)
+        dependencies = self._dependencies(layer, name_props, dict(variables, x=variable), interpolation_type, {})
+        return layer.get_scalar_prop_value(name_props, variable, interpolation_type, unit,
+                                           **dict(variables, **dependencies))
+
+    def get_prop_values(self, name_props_list=None, variable=None, interpolation_type='cubic', as_dataframe=True,
+                        units=None, **variables):
+        """
+        Method to evaluate several properties, each from the first layer which has it (see Regime.get_prop_values).
+        """
+        if isinstance(name_props_list, str):
+            name_props_list = [name_props_list]
+        # one call per layer, the columns are put back into the requested order
+        by_layer = {}
+        for name_props in name_props_list:
+            by_layer.setdefault(id(self._get_owner(name_props)), []).append(name_props)
+        mapping = dict(variables, x=variable)
+        memo = {}  # every property the expressions refer to is evaluated once
+        columns = {}
+        for names in by_layer.values():
+            layer = self._owners[names[0]]
+            dependencies = {}
+            for name_props in names:
+                dependencies.update(self._dependencies(layer, name_props, mapping, interpolation_type, memo))
+            values = layer.get_prop_values(names, variable, interpolation_type, as_dataframe=True, units=units,
+                                           **dict(variables, **dependencies))
+            columns.update(values.items())
+        result = pd.DataFrame({name_props: columns[name_props] for name_props in name_props_list})
+        return result if as_dataframe else result.to_numpy()
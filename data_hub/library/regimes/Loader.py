@@ -0,0 +1,113 @@
+###############################################################
+#
+# Bulk loading of many Regime files
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# imports from system libraries if necessary
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from .CompiledCache import load_yaml
+from .Regime import PrettySafeLoader, Regime
+
+
+class RegimeCollection(dict):
+    """
+    Dictionary of loaded regimes (keys are the file names). Files which could not be loaded are listed in errors.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.errors = {}  # file name: error message
+
+
+def load_regimes(file_list=None, workers: int = None, recursive: bool = False, use_cache: bool = None,
+                 regime_class=Regime):
+    """
+    Function to load many YAML files as regimes. The regimes (properties, units and profile data) are created in
+    parallel by a pool of processes and sent back to the current process; an error in one file is reported in the
+    errors of the result and does not stop loading the other files.
+    :param file_list: a folder (e.g. a category of the yaml-db) or a list of YAML files
+    :param workers: number of processes; 1 loads all files in the current process. Default is None (number of CPUs).
+    :param recursive: if file_list is a folder, also load the files of its subfolders. Default is False.
+    :param use_cache: load the files through the binary cache. Default is USE_COMPILED_CACHE of regime_class.
+    :param regime_class: the class of the created regimes, e.g. a customized Regime class. Default is Regime.
+    :return: a RegimeCollection
+    """
+    if isinstance(file_list, str):
+        file_list = find_yaml_files(file_list, recursive=recursive)
+    if use_cache is None:
+        use_cache = regime_class.USE_COMPILED_CACHE
+
+    regimes = RegimeCollection()
+    if not file_list:
+        return regimes
+    tasks = [(file_name, use_cache, regime_class) for file_name in file_list]
+    if workers == 1:
+        results = map(_load_file, tasks)
+    else:
+        results = _load_in_processes(tasks, workers)
+    for file_name, regime, error in results:
+        if error is None:
+            regimes[file_name] = regime
+        else:
+            regimes.errors[file_name] = error
+    return regimes
+
+
+def _load_in_processes(tasks, workers):
+    # the regimes are created in chunks by the processes; chunks which cannot be sent to a process or back (e.g. a
+    # regime_class which cannot be pickled) are loaded in the current process
+    n_workers = workers if workers else os.cpu_count() or 1
+    chunk_size = max(1, len(tasks) // (4 * n_workers))
+    chunks = [tasks[i:i + chunk_size] for i in range(0, len(tasks), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_load_files, chunk) for chunk in chunks]
+        for chunk, future in zip(chunks, futures):
+            try:
+                results = future.result()
+            except Exception:
+                results = [_load_file(task) for task in chunk]
+            for file_name, regime, error in results:
+                if error is None and regime.PROFILE_MEMMAP and regime.profile_data is None:
+                    regime.load_profile_data()  # maps the binary file written by the process
+                yield file_name, regime, error
+
+
+def find_yaml_files(path: str = None, recursive: bool = False):
+    """
+    :param path: folder to search in
+    :param recursive: also search the subfolders. Default is False.
+    :return: a sorted list of the YAML files in the folder
+    """
+    file_list = []
+    for directory, sub_directories, files in os.walk(path):
+        sub_directories[:] = sorted(name for name in sub_directories if not name.startswith(('.', '__')))
+        file_list += [os.path.join(directory, name) for name in sorted(files) if name.endswith(('.yaml', '.yml'))]
+        if not recursive:
+            break
+    return file_list
+
+
+def _load_files(tasks):
+    # runs in the worker processes, the regimes are created there and sent back to the main process
+    return [_load_file(task, map_again=True) for task in tasks]
+
+
+def _load_file(task, map_again=False):
+    # map_again: memory-mapped profile data is not returned, it is mapped again by the receiving process
+    file_name, use_cache, regime_class = task
+    try:
+        yaml_data = load_yaml(file_name, loader=PrettySafeLoader, use_cache=use_cache)
+        if not isinstance(yaml_data, dict):
+            raise ValueError('The file does not contain a mapping of properties.')
+        regime = regime_class()
+        regime.set_props(yaml_data, file_name=file_name)
+        regime.load_profile_data()
+        if map_again and regime.PROFILE_MEMMAP:
+            regime.profile_data = None
+        return file_name, regime, None
+    except Exception as exception:
+        return file_name, None, f'{type(exception).__name__}: {exception}'
@@ -0,0 +1,124 @@
+###############################################################
+#
+# Streaming loader for 2D profile files (properties_distribution)
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# imports from system libraries if necessary
+import itertools
+import json
+import os
+
+# Python imports
+import numpy as np
+
+from .CompiledCache import CACHE_DIR_NAME
+
+HEADER_LINES = 15  # number of lines before the numeric data
+PROFILE_COUNT_LINE = 7  # index of the header line which ends with the number of profiles
+CHUNK_ROWS = 100000  # number of rows parsed at once
+
+
+def read_profile_header(file_name: str = None):
+    """
+    Function to read the header of a 2D profile file.
+    :param file_name: name of the .txt file
+    :return: the header lines and the number of profiles
+    """
+    with open(file_name, 'r') as file:
+        header = list(itertools.islice(file, HEADER_LINES))
+    if len(header) <= PROFILE_COUNT_LINE:
+        raise ValueError(f'{file_name} has no valid header.')
+    nprofiles = int(float(header[PROFILE_COUNT_LINE].split()[-1]))  # number of profiles
+    return header, nprofiles
+
+
+def load_profiles(file_name: str = None, memmap: bool = False, chunk_rows: int = CHUNK_ROWS, cache_dir: str = None):
+    """
+    Function to load a 2D profile file. The numeric data is parsed in chunks of rows, the columns radius and angle are
+    appended and the rows are separated into profiles (row i belongs to profile i % number of profiles).
+    :param file_name: name of the .txt file
+    :param memmap: if it is True, the data is converted once to a binary .npy file which is memory-mapped, so profiles
+    can be sliced without loading the full file. The binary file is rebuilt when the .txt file changes. Default is False.
+    :param chunk_rows: number of rows parsed at once. Default is CHUNK_ROWS.
+    :param cache_dir: folder for the binary file. Default is CACHE_DIR_NAME next to the .txt file.
+    :return: an array of shape (number of profiles, number of columns + 2, number of points per profile)
+    """
+    header, nprofiles = read_profile_header(file_name)
+
+    data = None
+    if memmap:
+        directory, base_name = os.path.split(os.path.abspath(file_name))
+        binary_file = os.path.join(cache_dir if cache_dir else os.path.join(directory, CACHE_DIR_NAME),
+                                   base_name + '.npy')
+        stat = os.stat(file_name)
+        signature = {'mtime': stat.st_mtime_ns, 'size': stat.st_size}
+        try:
+            with open(binary_file + '.json') as file:
+                if json.load(file) == signature:
+                    data = np.load(binary_file, mmap_mode='r')
+        except (OSError, ValueError):  # not converted yet
+            pass
+        if data is None:
+            try:
+                os.makedirs(os.path.dirname(binary_file), exist_ok=True)
+                data = _read_rows(file_name, binary_file=binary_file, chunk_rows=chunk_rows)
+                data.flush()
+                with open(binary_file + '.json', 'w') as file:
+                    json.dump(signature, file)
+                data = np.load(binary_file, mmap_mode='r')
+            except OSError:  # e.g. a read-only folder, then load the data into memory
+                data = None
+    if data is None:
+        data = _read_rows(file_name, chunk_rows=chunk_rows)
+
+    if data.shape[0] % nprofiles:
+        raise ValueError(f'{data.shape[0]} rows in {file_name} cannot be separated into {nprofiles} profiles.')
+    # Separate data into different profiles without copying: profile i consists of the rows i, i + nprofiles, ...
+    return data.reshape(data.shape[0] // nprofiles, nprofiles, data.shape[1]).transpose(1, 2, 0)
+
+
+def _iter_data_lines(file):
+    # skip the header, empty lines and comments
+    for line in itertools.islice(file, HEADER_LINES, None):
+        line = line.split('#', 1)[0]
+        if line.strip():
+            yield line
+
+
+def _read_rows(file_name, binary_file=None, chunk_rows=CHUNK_ROWS):
+    """
+    Function to parse the numeric data chunk by chunk into a preallocated array (or a .npy file).
+    :return: an array of shape (number of rows, number of columns + 2), the last columns are radius and angle
+    """
+    # first pass: count rows and columns, so the result can be allocated once
+    nrows = 0
+    ncols = None
+    with open(file_name, 'r') as file:
+        for line in _iter_data_lines(file):
+            if ncols is None:
+                ncols = len(line.split())
+            nrows += 1
+    if ncols is None:
+        raise ValueError(f'{file_name} contains no data.')
+
+    shape = (nrows, ncols + 2)
+    if binary_file:
+        data = np.lib.format.open_memmap(binary_file, mode='w+', dtype=float, shape=shape)
+    else:
+        data = np.empty(shape)
+
+    row = 0
+    with open(file_name, 'r') as file:
+        lines = _iter_data_lines(file)
+        while row < nrows:
+            chunk = np.loadtxt(itertools.islice(lines, chunk_rows), ndmin=2)
+            end = row + chunk.shape[0]
+            data[row:end, :ncols] = chunk
+            # Calculate Radius and Angle
+            # Convert Cartesian coordinate system to polar coordinate system
+            data[row:end, ncols] = np.sqrt((chunk[:, 0] * 1000) ** 2 + (chunk[:, 1] * 1000) ** 2)
+            data[row:end, ncols + 1] = np.arctan2(chunk[:, 0] * 1000, chunk[:, 1] * 1000)
+            row = end
+    return data
@@ -7,7 +7,9 @@
 ################################################################
 
 # imports from system libraries if necessary
+import hashlib
 import os
+import pickle
 
 # Python imports
 import matplotlib.pyplot as plt
@@ -16,9 +18,35 @@ import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import plotly.io as pio
 import yaml as yaml
 from scipy import interpolate
 
+from .Cache import LRUCache
+from .CompiledCache import load_yaml
+from .Downsample import downsample
+from .Expression import Expression, sort_dependencies
+from .Interpolator import NDInterpolator
+from .Profile import load_profiles
+from .Table import Table, to_table
+from .Units import convert, prop_unit
+
+
+_EVALUATING = object()  # marks properties which are being evaluated, see Regime._evaluate
+
+
+def _freeze(value):
+    """
+    Function to convert arguments (e.g. the multivariable dict of plot_property) into hashable tuples.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
 
 # import parent class if needed
 # from . import ????
@@ -35,11 +63,34 @@ PrettySafeLoader.add_constructor(
 
 class Regime:
     PLOT_POINTS = 100
+    PLOT_INTERPOLATION = 'linear'  # interpolation of the tables referred to by plotted expressions
     DESCRIPTION_DEFAULT = "(No description)"
     NAME_DEFAULT = "Default"
     HIDDEN_PARAMS = ['_interpolated']
-
-    def __init__(self, name=None, file_name=None):
+    INTERPOLATOR_CACHE_SIZE = 64  # maximum number of stored interpolation functions
+    INTERPOLATED_CACHE_SIZE = 1024  # maximum number of stored interpolated values (per property in '_interpolated')
+    USE_COMPILED_CACHE = True  # load YAML files through the binary cache (see CompiledCache)
+    PROFILE_MEMMAP = False  # memory-map the 2D profile data (see Profile)
+    FIGURE_CACHE_SIZE = 32  # maximum number of stored figures of plot_property(gui=True)
+    PLOT_MAX_POINTS = 2000  # maximum number of plotted table points, larger tables are downsampled
+    WEBGL_THRESHOLD = 5000  # number of points from which plotly figures are rendered with WebGL
+
+    def __init__(self, name=None, file_name=None, store_interpolated: bool = True, interpolator_cache_size=None,
+                 interpolated_cache_size=None, figure_cache_size=None, figure_cache_dir=None):
+        """
+        :param name: name of the regime
+        :param file_name: YAML file to load the properties from
+        :param store_interpolated: if it is True, interpolated values are stored in '_interpolated' of the property,
+        otherwise they are only returned. Default is True.
+        :param interpolator_cache_size: maximum number of cached interpolation functions. Default is
+        INTERPOLATOR_CACHE_SIZE.
+        :param interpolated_cache_size: maximum number of cached interpolated values. Default is
+        INTERPOLATED_CACHE_SIZE.
+        :param figure_cache_size: maximum number of cached figures of plot_property(gui=True). Default is
+        FIGURE_CACHE_SIZE.
+        :param figure_cache_dir: folder to store plotly figures as JSON, so they can be shared between processes (e.g.
+        the workers of a Dash server). Default is None (figures are only kept in memory).
+        """
         # defaulted instance arguments
         self.separator = ": "
         self.populated = False
@@ -51,11 +102,44 @@ class Regime:
         self.name = str(name) if name else self.NAME_DEFAULT
         self.description = self.DESCRIPTION_DEFAULT
         self.figures = {}
-        self.interpl_dict = {}  # interploation dictionary for storing interpolation functions
+        self.store_interpolated = store_interpolated
+        self.interpolated_cache_size = interpolated_cache_size or self.INTERPOLATED_CACHE_SIZE
+        # interploation dictionary for storing interpolation functions, keys are (name_props, kind)
+        self.interpl_dict = LRUCache(maxsize=interpolator_cache_size or self.INTERPOLATOR_CACHE_SIZE)
+        # storing interpolated values, keys are (name_props, kind, value)
+        self.interpolated_cache = LRUCache(maxsize=self.interpolated_cache_size)
+        self.expressions = {}  # dictionary for storing the compiled expressions
+        # names of the properties each expression refers to, and all properties in evaluation order
+        self.dependencies = {}
+        self.evaluation_order = []
+        self.units = {}  # units of the values of the properties (Unit or None), checked when loading
+        self.variable_units = {}  # units of the variables of the properties
+        # storing figures of plot_property(gui=True), keys are the arguments and the content version of the regime
+        self.figure_cache = LRUCache(maxsize=figure_cache_size or self.FIGURE_CACHE_SIZE)
+        self.figure_cache_dir = figure_cache_dir
+        self.revision = 0  # counts the changes of the properties, part of the content version
+        self.frozen = False  # read-only regime, see freeze
         self.profile_data = None  # storing 2D profile data
         if file_name:
             self.load_props(file_name=file_name)
 
+    def __getstate__(self):
+        # caches and compiled expressions are rebuilt after unpickling, e.g. in another process
+        state = self.__dict__.copy()
+        state['interpl_dict'] = state['interpl_dict'].maxsize
+        state['interpolated_cache'] = state['interpolated_cache'].maxsize
+        state['figure_cache'] = state['figure_cache'].maxsize
+        state['expressions'] = {}
+        if isinstance(self.profile_data, np.ndarray):  # the profiles are a transposed view of the loaded data
+            state['profile_data'] = np.ascontiguousarray(self.profile_data)
+        return state
+
+    def __setstate__(self, state):
+        state['interpl_dict'] = LRUCache(maxsize=state['interpl_dict'])
+        state['interpolated_cache'] = LRUCache(maxsize=state['interpolated_cache'])
+        state['figure_cache'] = LRUCache(maxsize=state['figure_cache'])
+        self.__dict__.update(state)
+
     def __str__(self):
         out = 'REGIME name' + self.separator + self.name + '\n'
         if not self.populated:
@@ -70,64 +154,106 @@ class Regime:
         print('REGIME SUMMARY:')
         print(self.__str__())
 
-    def load_props(self, file_name=None):
+    def load_props(self, file_name=None, use_cache: bool = None):
         # read *.yaml file and save as pandas dataframe
+        # use_cache: load the file through the binary cache, default is USE_COMPILED_CACHE
+        self._check_frozen('loading properties')
         if file_name:
-            with open(file_name) as file:
-                yaml_data = yaml.load(file, Loader=PrettySafeLoader)
-                if 'name' in yaml_data.keys():
-                    self.name = yaml_data.pop('name')
-                if 'description' in yaml_data.keys():
-                    self.description = yaml_data.pop('description')
-                if 'figures' in yaml_data.keys():
-                    self.figures = yaml_data.pop('figures')
-                self.props = pd.DataFrame.from_dict(yaml_data, orient='index').T
-                if not self.props.empty:
-                    self.props.loc['_interpolated'] = [dict() for i in range(self.props.shape[1])]
-                self.propsfile = file_name
-                self.populated = True
-
+            if use_cache is None:
+                use_cache = self.USE_COMPILED_CACHE
+            self.set_props(load_yaml(file_name, loader=PrettySafeLoader, use_cache=use_cache), file_name=file_name)
         else:
             print('Please specify YAML file to load properties')
             print('\n')
 
         # load properties like temperature, density, salt concentration
+        self.load_profile_data()
+
+    def set_props(self, yaml_data: dict = None, file_name=None):
+        """
+        Method to set the properties from the parsed content of a YAML file.
+        :param yaml_data: the content of the YAML file as a dict
+        :param file_name: the name of the YAML file
+        """
+        self._check_frozen('setting properties')
+        if 'name' in yaml_data.keys():
+            self.name = yaml_data.pop('name')
+        if 'description' in yaml_data.keys():
+            self.description = yaml_data.pop('description')
+        if 'figures' in yaml_data.keys():
+            self.figures = yaml_data.pop('figures')
+        for prop in yaml_data.values():  # tabulated values are stored as Table
+            to_table(prop)
+        # the units are parsed and checked once, inconsistencies are reported as warnings
+        self.units = {name_props: prop_unit(prop, name_props) for name_props, prop in yaml_data.items()
+                      if isinstance(prop, dict)}
+        self.variable_units = {name_props: prop_unit(prop, name_props, variable=True)
+                               for name_props, prop in yaml_data.items() if isinstance(prop, dict)}
+        self.props = pd.DataFrame.from_dict(yaml_data, orient='index').T
+        self.expressions = {}
+        self.clear_cache()
+        self.update_dependencies()
+        if not self.props.empty:
+            self.props.loc['_interpolated'] = [LRUCache(maxsize=self.interpolated_cache_size)
+                                               for i in range(self.props.shape[1])]
+        self.propsfile = file_name
+        self.populated = True
+        self.revision += 1
+
+    def load_profile_data(self, memmap: bool = None):
+        """
+        Method to load the 2D profile data if the regime has the property properties_distribution.
+        :param memmap: if it is True, the data is converted once to a memory-mapped binary file (see load_profiles).
+        Default is PROFILE_MEMMAP.
+        """
+        self._check_frozen('loading profile data')
         if hasattr(self.props, "properties_distribution"):
             # preparing the data from 2D files
             props_distribution_name = self.props['properties_distribution']['value']
-            # Load data
-            data = np.genfromtxt(props_distribution_name, skip_header=15, unpack=True)
-            # Calculate Radius and Angle and append them
-            # Convert Cartesian coordinate system to polar coordinate system
-            data = np.append(data, [np.sqrt((data[0, :] * 1000) ** 2 + (data[1, :] * 1000) ** 2)], axis=0)
-            data = np.append(data, [np.arctan2(data[0, :] * 1000, data[1, :] * 1000)], axis=0)
-
-            # calculate the number of profiles
-            with open(props_distribution_name, 'r') as openfile:
-                nprofiles = int(float(openfile.readlines()[7].split()[-1]))  # number of profiles
-
-            # Separate data into different profiles according to .txt file
-            profile_data = []
-            for i in range(nprofiles):
-                profile_data.append(data[:, i::nprofiles])
-            profile_data = np.array(profile_data)
-            self.profile_data = profile_data
+            # Load data, the profiles are separated according to .txt file
+            self.profile_data = load_profiles(props_distribution_name,
+                                              memmap=self.PROFILE_MEMMAP if memmap is None else memmap)
             print('2D data loaded from txt file:', props_distribution_name, sep=self.separator)
 
     def load_site(self, file_name=None):
         # read *.yaml file and save as pandas dataframe
+        self._check_frozen('loading site specifics')
         if file_name is not None:
-            with open(file_name) as file:
-                self.site = pd.DataFrame.from_dict(yaml.safe_load(file), 'index').T
-                self.site_file = file_name
-                # print('Site specifics loaded from:', file_name, sep = self.separator)
-                # print('\n')
+            self.site = pd.DataFrame.from_dict(load_yaml(file_name, use_cache=self.USE_COMPILED_CACHE), 'index').T
+            self.site_file = file_name
+            # print('Site specifics loaded from:', file_name, sep = self.separator)
+            # print('\n')
         else:
             print('Please specify YAML file to load site specifics')
             print('\n')
 
+    def freeze(self):
+        """
+        Method to make the regime read-only, so that one regime can be shared by the threads of a server. All .npz
+        tables are loaded and all arrays are made read-only; queries no longer store interpolated values (they only
+        return them) and methods changing the properties raise a RuntimeError. The caches of interpolation functions,
+        values and figures stay in use, they are thread-safe.
+        :return: the regime
+        """
+        if self.frozen:
+            return self
+        for name_props in self.props:
+            if self.props[name_props]['type'] == 'tabulated':
+                self.resolve_tabulated(name_props)
+                value = self.props[name_props]['value']
+                if isinstance(value, Table):
+                    value.set_readonly()
+        if isinstance(self.profile_data, np.ndarray):
+            self.profile_data.flags.writeable = False
+        self.frozen = True
+        return self
+
+    def _check_frozen(self, action: str = None):
+        if self.frozen:
+            raise RuntimeError(f'The regime {self.name} is frozen (read-only), {action} is not possible.')
+
     def plot_property(self, name_props=None, props_min=None, props_max=None, multivariable=None, use_plotly=False,
-                      gui=False,
+                      gui=False, max_points: int = None, downsample_method: str = 'lttb'
                       ):
         """
         Method to plot properties of the Regime class
@@ -138,10 +264,111 @@ class Regime:
         variable and changing variables in a dictionary form( e.g {'cst':{'x3': 45}, 'noncst':{'x':[3, 78],
          'x2': [23,90]}}). Default is None.
         :param use_plotly: use plotly for plotting the figure. If it is False, then use matplotlib. Default is False.
-        :param gui: if it is True, then return a figure. Default is False.
+        :param gui: if it is True, then return a figure. Figures are cached until the properties change and every call
+        returns its own copy, so callers (e.g. threads of a server) can change it; matplotlib figures are not managed by
+        pyplot. Default is False.
+        :param max_points: maximum number of plotted points of tabulated values, larger tables are downsampled (for the
+        full resolution of a zoomed range, plot again with props_min and props_max or use get_plot_data). 0 plots all
+        points. Default is PLOT_MAX_POINTS.
+        :param downsample_method: 'lttb' or 'minmax', see Downsample. Default is 'lttb'.
         :return: if gui is True, return a figure; if gui is False, directly display the figure.
         """
+        if max_points is None:
+            max_points = self.PLOT_MAX_POINTS
+        if not gui:
+            fig = self._create_figure(name_props, props_min, props_max, multivariable, use_plotly, max_points,
+                                      downsample_method)
+            if use_plotly:
+                fig.show()
+            else:
+                plt.show()
+            return
+
+        # the interpolated values of the plotted property are drawn as well, they are part of the key (sorted, as
+        # lookups change the order of the stored values); other properties do not invalidate the figure
+        interpolated = self.props[name_props]['_interpolated'] if name_props in self.props else None
+        key = (name_props, _freeze(props_min), _freeze(props_max), _freeze(multivariable),
+               'plotly' if use_plotly else 'matplotlib', max_points, downsample_method, self.content_version(),
+               _freeze(dict(interpolated.items())) if interpolated else None)
+        fig = self.figure_cache.lookup(key)
+        cache_file = None
+        if fig is None and use_plotly and self.figure_cache_dir:
+            cache_file = os.path.join(self.figure_cache_dir, hashlib.sha1(repr(key).encode()).hexdigest() + '.json')
+            try:
+                with open(cache_file) as file:
+                    fig = pio.from_json(file.read())
+            except (OSError, ValueError):  # not stored yet or not readable
+                fig = None
+            else:
+                self.figure_cache[key] = fig
+        if fig is None:
+            fig = self._create_figure(name_props, props_min, props_max, multivariable, use_plotly, max_points,
+                                      downsample_method)
+            if not use_plotly:  # stored pickled and without pyplot, every call unpickles its own figure
+                plt.close(fig)
+                fig = pickle.dumps(fig)
+            self.figure_cache[key] = fig
+            if cache_file:
+                try:
+                    os.makedirs(self.figure_cache_dir, exist_ok=True)
+                    tmp_file = f'{cache_file}.{os.getpid()}.tmp'
+                    with open(tmp_file, 'w') as file:
+                        file.write(fig.to_json())
+                    os.replace(tmp_file, cache_file)
+                except OSError:
+                    pass
+        return go.Figure(fig) if use_plotly else pickle.loads(fig)
+
+    def content_version(self):
+        """
+        Method to get the version of the content of the regime, which changes if the properties are loaded or changed.
+        :return: a tuple of the YAML file, its modification time and the revision of the properties
+        """
+        try:
+            mtime = os.stat(self.propsfile).st_mtime_ns
+        except (OSError, TypeError):  # no file
+            mtime = None
+        return self.propsfile, mtime, self.revision
+
+    def get_plot_data(self, name_props=None, x_min=None, x_max=None, max_points: int = None,
+                      downsample_method: str = 'lttb'):
+        """
+        Method to get the plotted points of a tabulated property in a range, e.g. to update a figure with the full
+        resolution after zooming in.
+        :param name_props: Name of the property
+        :param x_min: minimum key. Default is None (no limit).
+        :param x_max: maximum key. Default is None (no limit).
+        :param max_points: maximum number of points, larger ranges are downsampled; 0 returns all points. Default is
+        PLOT_MAX_POINTS.
+        :param downsample_method: 'lttb' or 'minmax', see Downsample. Default is 'lttb'.
+        :return: the keys, the values and the dev_values (None if the table has none) as numpy arrays
+        """
+        self.resolve_tabulated(name_props)
+        props_value = self.props[name_props]['value']
+        if self.props[name_props]['type'] != 'tabulated':
+            raise NotImplementedError('Plot data can only be selected from tabulated values.')
+        table = props_value if isinstance(props_value, Table) else Table.from_dict(props_value)
+        if table.dimension > 1:
+            raise NotImplementedError('Tabulated values with coordinates as keys cannot be plotted.')
+        # the keys are sorted, so the range is a slice of the table
+        start = 0 if x_min is None else np.searchsorted(table.keys, x_min, side='left')
+        end = len(table) if x_max is None else np.searchsorted(table.keys, x_max, side='right')
+        x = table.keys[start:end]
+        y = table.values[start:end]
+        dev = None if table.dev is None else table.dev[start:end]
+        indices = downsample(x, y, self.PLOT_MAX_POINTS if max_points is None else max_points, downsample_method)
+        if len(indices) < len(x):
+            x, y, dev = x[indices], y[indices], None if dev is None else dev[indices]
+        return x, y, dev
+
+    def _create_figure(self, name_props=None, props_min=None, props_max=None, multivariable=None, use_plotly=False,
+                       max_points: int = None, downsample_method: str = 'lttb'):
+        """
+        Method to create the figure of plot_property.
+        :return: a plotly or matplotlib figure
+        """
         # Get information on the property
+        self.resolve_tabulated(name_props)
         props = self.props[name_props]
         props_type = props['type']  # to define if it is constant or not
         props_value = props['value']  # expression:a string,should call eval
@@ -156,6 +383,9 @@ class Regime:
             if type(props_dev) is dict:
                 if np.any(np.isnan(list(props_dev.values()))):
                     props_dev = None
+            elif isinstance(props_dev, np.ndarray):  # dev_values of a Table
+                if np.any(np.isnan(props_dev)):
+                    props_dev = None
             elif np.any(np.isnan(props_dev)):
                 props_dev = None
 
@@ -183,12 +413,12 @@ class Regime:
             props_ylabel += f" in {props['unit_str']}"
 
         if props_type == 'expression':
-            mappings = {'exp': np.exp, 'sqrt': np.sqrt, 'sin': np.sin, 'cos': np.cos, 'tan': np.tan}
+            variables = {}
             if multivariable is not None:  # if we have more than one variable.
                 cst_list = multivariable['cst']
                 noncst_list = multivariable['noncst']
                 selected_noncst = list(noncst_list)
-                mappings.update(cst_list)
+                variables.update(cst_list)
                 if len(selected_noncst) == 1:  # if we have only changing variable, then 2D plot
                     props_min = noncst_list[selected_noncst[0]][0]
                     props_max = noncst_list[selected_noncst[0]][1]
@@ -204,22 +434,18 @@ class Regime:
             x = np.linspace(props_min, props_max, self.PLOT_POINTS)
             if type(props_min) == list:  # 3D plot
                 x, x2 = np.meshgrid(x[:, 0], x[:, 1])
-                noncst_list.update({selected_noncst[0]: x})
-                noncst_list.update({selected_noncst[1]: x2})
-                mappings.update(noncst_list)
-                props_y = eval(props_value, mappings)
-            else:  # 2D plot
-                props_y = list()
-                for value in x:
-                    mappings.update({selected_noncst[0]: value})
-                    props_y.append(eval(props_value, mappings))  # eval(expression)
-                props_y = np.array(props_y)
+                variables.update({selected_noncst[0]: x, selected_noncst[1]: x2})
+                props_y = self._evaluate(name_props, variables, self.PLOT_INTERPOLATION, {})
+            else:  # 2D plot, evaluate all points at once
+                variables.update({selected_noncst[0]: x})
+                props_y = self._evaluate(name_props, variables, self.PLOT_INTERPOLATION, {})
                 if type(props_xlabel) == dict:  # if we have variable with a dict input
                     props_xlabel = props_xlabel[selected_noncst[0]]
             symbol = 'b-'
         elif props_type == 'tabulated':
-            x = list(props_value.keys())
-            props_y = list(props_value.values())
+            x, props_y, dev = self.get_plot_data(name_props, props_min, props_max, max_points, downsample_method)
+            if isinstance(props_dev, np.ndarray):  # dev_values of the selected points
+                props_dev = dev
             symbol = 'b.'
         else:
             raise NotImplementedError('Currently only expressions and tabulated values can be plotted.')
@@ -228,21 +454,25 @@ class Regime:
         if props_type == 'expression' or props_type == 'tabulated':
             if type(props_dev) == dict:
                 y_err = list(props_dev.values())
+            elif isinstance(props_dev, np.ndarray):
+                y_err = props_dev
             elif (type(props_dev) == float or type(props_dev) == int) and not np.isnan(props_dev):
                 y_err = props_dev
 
             if use_plotly:
                 labels = {'x': props_xlabel, 'y': props_ylabel}
+                render_mode = 'webgl' if np.size(props_y) > self.WEBGL_THRESHOLD else 'auto'
                 if props_type == 'expression':
                     try:  # 2D plot
-                        fig = px.line(x=x, y=props_y, title=name_props, labels=labels)
+                        fig = px.line(x=x, y=props_y, title=name_props, labels=labels, render_mode=render_mode)
                         fig.update_traces(name='Data', showlegend=True)
                     except ValueError:  # 3D plot
                         fig = go.Figure(data=[go.Surface(x=x, y=x2, z=props_y)])
                         fig.update_traces(contours_z=dict(show=True, usecolormap=True, highlightcolor="limegreen",
                                                           project_z=True))
                 elif props_type == 'tabulated':
-                    fig = px.scatter(x=x, y=props_y, error_y=y_err, title=name_props, labels=labels)
+                    fig = px.scatter(x=x, y=props_y, error_y=y_err, title=name_props, labels=labels,
+                                     render_mode=render_mode)
                     fig.update_traces(name='Data', showlegend=True)
                 if self.props[name_props]['_interpolated']:
                     fig.add_trace(go.Scatter(x=list(self.props[name_props]['_interpolated'].keys()),
@@ -276,15 +506,10 @@ class Regime:
                 ax.set_ylabel(props_ylabel)
                 ax.set_title(name_props)
                 ax.legend(loc='best')
-            if gui:
-                return fig
-            else:
-                if use_plotly:
-                    fig.show()
-                else:
-                    plt.show()
+            return fig
 
-    def get_scalar_prop_value(self, name_props=None, variable=None, interpolation_type='cubic', **variables):
+    def get_scalar_prop_value(self, name_props=None, variable=None, interpolation_type='cubic', unit=None,
+                              **variables):
         """
         Method to get a scalar value from tables or expressions. This can be used as a black box for accessing data.
         :param name_props: Name of the field
@@ -293,7 +518,11 @@ class Regime:
          ‘slinear’, ‘quadratic’, ‘cubic’, ‘previous’, ‘next’, where ‘zero’, ‘slinear’, ‘quadratic’ and ‘cubic’ refer to
          a spline interpolation of zeroth, first, second or third order; ‘previous’ and ‘next’ simply return the
          previous or next value of the point) or as an integer specifying the order of the spline interpolator to use
-         (see scipy.interpolate.interp1d). Default is ‘cubic’.
+         (see scipy.interpolate.interp1d). Default is ‘cubic’. For keys which are coordinate tuples, ‘nearest’,
+         ‘linear’ and ‘grid’ are available; the other kinds, including the default ‘cubic’, are interpolated linearly
+         there (see NDInterpolator).
+        :param unit: Unit of the result as unit string (e.g. 'g/cm^3') or exponent array. Default is None (the unit of
+         the property).
         :param variables: Additional variables with its value needs to be specified here.
         :return:
         """
@@ -302,34 +531,183 @@ class Regime:
         prop_type = prop['type']  # to define if it is constant or not
         prop_value = prop['value']  # expression: a string,should call eval
 
-        mapping = {'x': variable, 'exp': np.exp, 'sqrt': np.sqrt, 'sin': np.sin, 'cos': np.cos, 'tan': np.tan}
+        mapping = {'x': variable}
         mapping.update(variables)
 
-        if prop_type == 'expression':
-            prop_y = eval(prop_value, mapping)  # eval(expression)
+        if prop_type == 'expression':  # including the properties the expression refers to
+            prop_y = self._evaluate(name_props, mapping, interpolation_type, {})
         elif prop_type == 'tabulated':
-            self.interpolation(name_props=name_props, interpl_list=[variable], kind=interpolation_type)
-            prop_y = self.props[name_props]['_interpolated'][variable]
+            key = (name_props, interpolation_type, variable)
+            prop_y = self.interpolated_cache.lookup(key)
+            if prop_y is None:
+                prop_y = self.interpolation(name_props=name_props, interpl_list=[variable], kind=interpolation_type,
+                                            store=False)[variable]
+                try:
+                    self.interpolated_cache[key] = prop_y
+                except TypeError:  # e.g. an array as variable
+                    pass
+            if self.store_interpolated and not self.frozen:
+                self._store_interpolated(name_props, {variable: prop_y})
         elif prop_type == 'scalar':
             prop_y = prop_value
         else:
             raise NotImplementedError('This method only works for expressions, tabulated and scalar values.')
+        if unit is not None:
+            prop_y = self.convert_unit(name_props, prop_y, unit)
         return prop_y
 
-    def interpolation(self, name_props: str = None, interpl_list=None, overwrite: bool = True, kind='quadratic'):
+    def get_prop_values(self, name_props_list=None, variable=None, interpolation_type='cubic', as_dataframe=True,
+                        units=None, **variables):
         """
-        Method to interpolate between known values of a tabulated property.
+        Method to evaluate several properties for arrays of variable values in one pass. Scalar, expression and
+        tabulated properties are supported; tabulated properties are interpolated without storing the results in
+        '_interpolated'.
+        :param name_props_list: List of property names (or a single name)
+        :param variable: Array of values of the variable x, i.e., name_props(variable). For tabulated properties with
+        coordinates as keys, an array of shape (n points, dimension).
+        :param interpolation_type: Specifies the kind of interpolation for tabulated properties (see
+        get_scalar_prop_value). Default is ‘cubic’.
+        :param as_dataframe: if it is True, return a pandas.DataFrame, else a numpy.ndarray. Default is True.
+        :param units: dict of the units of the results, e.g. {'density_firn': 'g/cm^3'}; properties which are not in
+        units keep their unit. Default is None.
+        :param variables: Additional variables of expressions, given as arrays of the same length as variable or as
+        single values.
+        :return: a pandas.DataFrame (or numpy.ndarray) with one row per point and one column per property
+        """
+        if isinstance(name_props_list, str):
+            name_props_list = [name_props_list]
+
+        mapping = {'x': variable}
+        mapping.update(variables)
+        mapping = {key: np.asarray(value, dtype=float) for key, value in mapping.items() if value is not None}
+        # for tabulated properties with coordinates as keys, x is of shape (n points, dimension)
+        shapes = [value.shape[:1] if key == 'x' and value.ndim == 2 else value.shape for key, value in mapping.items()]
+        n_points = int(np.prod(np.broadcast_shapes(*shapes))) if shapes else 1
+
+        result = np.empty((n_points, len(name_props_list)))
+        memo = {}  # every property (also the ones referred to by expressions) is evaluated once
+        for i, name_props in enumerate(name_props_list):
+            prop_y = self._evaluate(name_props, mapping, interpolation_type, memo)
+            result[:, i] = np.broadcast_to(prop_y, (n_points,)) if np.ndim(prop_y) == 0 else np.ravel(prop_y)
+            if units and name_props in units:  # converting the whole column
+                result[:, i] = self.convert_unit(name_props, result[:, i], units[name_props])
+
+        if as_dataframe:
+            return pd.DataFrame(result, columns=name_props_list)
+        return result
+
+    def convert_unit(self, name_props: str = None, values=None, unit=None):
+        """
+        Method to convert values of a property to another unit.
         :param name_props: Name of the property
-        :param interpl_list: List of values at which the interpolation should be done
-        :param overwrite: If there are already interpolated values available, should they be overwritten (True) or kept
-        / updated (False)? Default is True.
-        :param kind: Specifies the kind of interpolation as a string (‘linear’, ‘nearest’, ‘zero’, ‘slinear’,
-        ‘quadratic’, ‘cubic’, ‘previous’, ‘next’, where ‘zero’, ‘slinear’, ‘quadratic’ and ‘cubic’ refer to a spline
-        interpolation of zeroth, first, second or third order; ‘previous’ and ‘next’ simply return the previous or next
-        value of the point) or as an integer specifying the order of the spline interpolator to use
-        (see scipy.interpolate.interp1d). Default is ‘quadratic’.
+        :param values: values in the unit of the property (scalar or array)
+        :param unit: the unit of the result as unit string or exponent array
+        :return: the converted values
+        """
+        if self.units.get(name_props) is None:
+            raise ValueError(f'{name_props} has no unit, its values cannot be converted to {unit}.')
+        return convert(values, self.units[name_props], unit)
+
+    def update_dependencies(self):
+        """
+        Method to find the properties the expressions refer to by name (e.g. 'density_ice * 9.81') and to sort the
+        properties in evaluation order. Circular references raise a ValueError. Invalid expressions are skipped here,
+        they raise an error when they are evaluated.
+        """
+        self.dependencies = {}
+        for name_props in self.props:
+            if self.props[name_props]['type'] != 'expression':
+                continue
+            try:
+                expression = self.get_expression(name_props)
+            except ValueError:
+                continue
+            self.dependencies[name_props] = [name for name in expression.variables
+                                             if name in self.props and name != name_props]
+        self.evaluation_order = sort_dependencies(self.dependencies)
+
+    def _evaluate(self, name_props, mapping: dict, interpolation_type, memo: dict):
+        """
+        Method to evaluate a property and the properties its expression refers to. Every property is evaluated once
+        per memo, i.e. intermediate properties shared by several expressions of a query are reused.
+        :param name_props: Name of the property
+        :param mapping: the variables (x and the additional variables of the expressions); variables named like a
+        property replace that property
+        :param interpolation_type: kind of interpolation for tabulated properties
+        :param memo: dictionary of the evaluated properties
+        :return: the value(s) of the property
+        """
+        if name_props in memo:
+            if memo[name_props] is _EVALUATING:
+                raise ValueError(f'Circular dependency of properties at {name_props}.')
+            return memo[name_props]
+        memo[name_props] = _EVALUATING
+        prop = self.props[name_props]
+        prop_type = prop['type']
+        if prop_type == 'expression':
+            expression = self.get_expression(name_props)
+            values = dict(mapping)
+            for name in expression.variables:
+                if values.get(name) is None and name in self.props and name != name_props:
+                    values[name] = self._evaluate(name, mapping, interpolation_type, memo)
+            prop_y = expression.evaluate(**values)
+        elif prop_type == 'tabulated':
+            if mapping.get('x') is None:
+                raise ValueError(f'Provide variable values for interpolating {name_props}.')
+            prop_y = self.get_interpolator(name_props=name_props, kind=interpolation_type)(mapping['x'])
+        elif prop_type == 'scalar':
+            prop_y = prop['value']
+        else:
+            raise NotImplementedError('This method only works for expressions, tabulated and scalar values.')
+        memo[name_props] = prop_y
+        return prop_y
+
+    def get_expression(self, name_props: str = None):
+        """
+        Method to get the compiled expression of a property. The expression is parsed and validated once and the
+        compiled form is reused for all following evaluations.
+        :param name_props: Name of the property
+        :return: an instance of class Expression
+        """
+        props = self.props[name_props]
+        if props['type'] != 'expression':
+            raise ValueError(f'{name_props} is not an expression.')
+
+        expression = self.expressions.get(name_props)
+        if expression is None or expression.source != str(props['value']).strip():  # the value might have been changed
+            expression = Expression(props['value'])
+            self.expressions[name_props] = expression
+        return expression
+
+    def resolve_tabulated(self, name_props: str = None):
+        """
+        Method to load the table of a tabulated property which is stored in a .npz file (see Converter.create_yaml).
+        The file is read on first use and the table replaces the file name in the properties.
+        :param name_props: Name of the property
+        """
+        props = self.props[name_props]
+        if props['type'] != 'tabulated' or not isinstance(props['value'], str):
+            return
+        # the .npz file is referenced relative to the yaml file
+        npz_file = os.path.join(os.path.dirname(self.propsfile) if self.propsfile else '', props['value'])
+        with np.load(npz_file) as data:
+            dev = data['dev'] if 'dev' in data and 'dev_value' in props and isinstance(props['dev_value'], str) \
+                else None
+            table = Table(data['keys'], data['values'], dev)
+        self.props.at['value', name_props] = table
+        if table.dev is not None:
+            self.props.at['dev_value', name_props] = table.dev
+
+    def get_interpolator(self, name_props: str = None, kind='quadratic'):
+        """
+        Method to get the interpolation function of a tabulated property. The function is created once per property
+        and kind and reused afterwards.
+        :param name_props: Name of the property
+        :param kind: Specifies the kind of interpolation (see interpolation). Default is ‘quadratic’.
+        :return: a function to find the interpolated values
         """
         # Get information on the property
+        self.resolve_tabulated(name_props)
         props = self.props[name_props]
         props_type = props['type']  # to define if its tabulated or not
         props_value = props['value']
@@ -338,39 +716,81 @@ class Regime:
             raise NotImplementedError('It is currently only possible to interpolate tabulated values.')
 
         # if the given property and kind have been computed or not
-        if self.interpl_dict.__contains__(name_props) and self.interpl_dict[name_props].__contains__(kind):
-            # returns a function to find the interpolated values
-            interpl_f = self.interpl_dict[name_props][kind]
-        else:
-            x = list(props_value.keys())
-            y = list(props_value.values())
+        interpl_f = self.interpl_dict.lookup((name_props, kind))
+        if interpl_f is None:
+            table = props_value if isinstance(props_value, Table) else Table.from_dict(props_value)
             # returns a function to find the interpolated values
-            interpl_f = interpolate.interp1d(x, y,  # default quadratic refers to spline interpolation of second order
-                                             kind=kind)
-            if self.interpl_dict.__contains__(name_props):
-                self.interpl_dict[name_props].update({kind: interpl_f})
+            if table.dimension > 1:  # keys are coordinates, e.g. (x, y, z)
+                interpl_f = NDInterpolator(table.keys, table.values, kind=kind)
             else:
-                self.interpl_dict.update({name_props: {kind: interpl_f}})
+                interpl_f = interpolate.interp1d(table.keys, table.values,  # default quadratic refers to spline
+                                                 kind=kind, assume_sorted=True,  # interpolation of second order
+                                                 copy=False)  # the arrays of the table are not changed
+            self.interpl_dict[(name_props, kind)] = interpl_f
+        return interpl_f
+
+    def interpolation(self, name_props: str = None, interpl_list=None, overwrite: bool = True, kind='quadratic',
+                      store=None):
+        """
+        Method to interpolate between known values of a tabulated property.
+        :param name_props: Name of the property
+        :param interpl_list: List of values at which the interpolation should be done
+        :param overwrite: If there are already interpolated values available, should they be overwritten (True) or kept
+        / updated (False)? Default is True.
+        :param kind: Specifies the kind of interpolation as a string (‘linear’, ‘nearest’, ‘zero’, ‘slinear’,
+        ‘quadratic’, ‘cubic’, ‘previous’, ‘next’, where ‘zero’, ‘slinear’, ‘quadratic’ and ‘cubic’ refer to a spline
+        interpolation of zeroth, first, second or third order; ‘previous’ and ‘next’ simply return the previous or next
+        value of the point) or as an integer specifying the order of the spline interpolator to use
+        (see scipy.interpolate.interp1d). Default is ‘quadratic’. For keys which are coordinate tuples, the kinds
+        ‘nearest’, ‘linear’ and ‘grid’ are available, the other kinds are interpolated linearly (see NDInterpolator).
+        :param store: if it is True, store the interpolated values in '_interpolated' of the property. Default is
+        store_interpolated of the regime (False for frozen regimes).
+        :return: a dict with the interpolated values
+        """
+        interpl_f = self.get_interpolator(name_props=name_props, kind=kind)
+        interpolated = dict(zip(interpl_list, interpl_f(interpl_list)))
+
+        if store is None:
+            store = self.store_interpolated and not self.frozen
+        if store:
+            self._store_interpolated(name_props, interpolated, overwrite=overwrite)
+        return interpolated
 
-        # if overwrite is True
-        if overwrite:
-            self.props[name_props]['_interpolated'] = dict(
-                zip(interpl_list, interpl_f(interpl_list)))  # to store the interpolation values in interpolated
+    def _store_interpolated(self, name_props, interpolated: dict, overwrite: bool = True):
+        """
+        Method to store interpolated values in '_interpolated' of a property, which keeps at most
+        interpolated_cache_size values.
+        """
+        self._check_frozen('storing interpolated values')
+        if overwrite:  # to store the interpolation values in interpolated
+            stored = LRUCache(maxsize=self.interpolated_cache_size)
+            self.props.at['_interpolated', name_props] = stored
         else:  # if not overwritten, then add the new interpolated values
-            self.props[name_props]['_interpolated'].update(dict(zip(interpl_list, interpl_f(interpl_list))))
+            stored = self.props.at['_interpolated', name_props]
+        stored.update(interpolated)
+
+    def cache_info(self):
+        """
+        Method to get the statistics of the caches of the regime.
+        :return: a dict with the statistics of the interpolation functions, interpolated values and figures
+        """
+        return {'interpolators': self.interpl_dict.info(), 'interpolated': self.interpolated_cache.info(),
+                'figures': self.figure_cache.info()}
+
+    def clear_cache(self):
+        """
+        Method to empty the caches of interpolation functions, interpolated values and figures.
+        """
+        self.interpl_dict.clear()
+        self.interpolated_cache.clear()
+        self.figure_cache.clear()
 
     def save_regime(self, filename: str):
         """
         Method to save the properties to a yaml file.
         :param filename: location to store the data
         """
-        output = self.props
-        for prop in output:
-            for hidden_param in self.HIDDEN_PARAMS:
-                try:
-                    del output[prop][hidden_param]
-                except KeyError:
-                    pass
+        output = {name_props: self.prop_to_dict(name_props) for name_props in self.props}
         if self.name != self.NAME_DEFAULT:
             output['name'] = self.name
         if self.description != self.DESCRIPTION_DEFAULT:
@@ -379,13 +799,32 @@ class Regime:
         with open(filename, 'w') as file:
             yaml.dump(output, file)
 
+    def prop_to_dict(self, name_props: str = None):
+        """
+        Method to get the fields of a property as they are written to a yaml file, i.e. without hidden and empty
+        fields and with tables as dictionaries.
+        :param name_props: Name of the property
+        :return: a dict of the fields of the property
+        """
+        prop = {}
+        for field, value in self.props[name_props].items():
+            if field in self.HIDDEN_PARAMS or (isinstance(value, float) and np.isnan(value)):  # nan: field not given
+                continue
+            prop[field] = value
+        if isinstance(prop.get('value'), Table):
+            if isinstance(prop.get('dev_value'), np.ndarray):
+                prop['dev_value'] = prop['value'].dev_to_dict()
+            prop['value'] = prop['value'].to_dict()
+        return prop
+
     def load_regime(self):
         # Re-load regime that had been saved previously 
         pass
 
 
 # unit test and demo
-# run by executing module directly: python Regime.py
+# run as module from the root folder of the repository (the relative imports need the package):
+# python -m data_hub.library.regimes.Regime
 
 if __name__ == "__main__":
     # create Regime objects for different argument options
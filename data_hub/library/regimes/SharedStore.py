@@ -0,0 +1,114 @@
+###############################################################
+#
+# Regimes shared between processes through a memory-mapped file
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# imports from system libraries if necessary
+import mmap
+import os
+import pickle
+import struct
+
+from .Loader import RegimeCollection
+
+MAGIC = b'DHSTORE1'
+HEADER = struct.Struct('<8sQQ')  # magic, offset and length of the pickled regimes
+ALIGNMENT = 64  # alignment of the arrays in the file
+MIN_SHARED_BYTES = 4096  # smaller arrays are copied into every process
+
+
+class SharedStore:
+    """
+    Class for sharing loaded regimes between processes, e.g. the workers of a Dash/gunicorn server. The parent process
+    writes the regimes once to a store file (create); the arrays of tables and profile data are stored as raw data and
+    every worker maps them read-only into memory (SharedStore(file_name)), so all workers use the same physical memory
+    of the page cache. Only the light metadata (names, fields, expressions) is unpickled per worker.
+    The regimes of a store are frozen (see Regime.freeze). A store file in /dev/shm is kept in RAM.
+    """
+
+    def __init__(self, file_name: str = None):
+        """
+        :param file_name: the store file written by SharedStore.create
+        """
+        self.file_name = file_name
+        with open(file_name, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, payload_offset, payload_length = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f'{file_name} is not a regime store.')
+        view = memoryview(self._mmap)
+        manifest, payload = pickle.loads(view[payload_offset:payload_offset + payload_length])
+        # the arrays are created on the mapped memory without copying (read-only)
+        buffers = [view[offset:offset + length] for offset, length in manifest]
+        self.regimes = pickle.loads(payload, buffers=buffers)
+        for regime in self.regimes.values():  # small arrays are copies, make them read-only as well
+            regime.frozen = False
+            regime.freeze()
+        del view, buffers
+
+    @classmethod
+    def create(cls, regimes=None, file_name: str = None, min_shared_bytes: int = MIN_SHARED_BYTES):
+        """
+        Method to write regimes to a store file. The regimes are frozen.
+        :param regimes: a dict of regimes (e.g. the RegimeCollection of load_regimes) or a list of regimes
+        :param file_name: the store file, replaced at once so that attached processes keep their version
+        :param min_shared_bytes: arrays with at least this size are shared. Default is MIN_SHARED_BYTES.
+        :return: the SharedStore
+        """
+        if not isinstance(regimes, dict):
+            regimes = {regime.propsfile or regime.name: regime for regime in regimes}
+        collection = RegimeCollection({key: regime.freeze() for key, regime in regimes.items()})
+        collection.errors = dict(getattr(regimes, 'errors', {}))
+
+        buffers = []
+
+        def buffer_callback(buffer):
+            # a false return value keeps the buffer out of the pickled data
+            if buffer.raw().nbytes < min_shared_bytes:
+                return True
+            buffers.append(buffer)
+            return False
+
+        payload = pickle.dumps(collection, protocol=5, buffer_callback=buffer_callback)
+
+        tmp_file = f'{file_name}.{os.getpid()}.tmp'
+        with open(tmp_file, 'wb') as file:
+            file.write(HEADER.pack(MAGIC, 0, 0))
+            manifest = []
+            for buffer in buffers:
+                raw = buffer.raw()
+                file.write(b'\0' * (-file.tell() % ALIGNMENT))
+                manifest.append((file.tell(), raw.nbytes))
+                file.write(raw)
+            payload = pickle.dumps((manifest, payload), protocol=pickle.HIGHEST_PROTOCOL)
+            payload_offset = file.tell()
+            file.write(payload)
+            file.seek(0)
+            file.write(HEADER.pack(MAGIC, payload_offset, len(payload)))
+        os.replace(tmp_file, file_name)
+        return cls(file_name)
+
+    def __getitem__(self, key):
+        return self.regimes[key]
+
+    def __iter__(self):
+        return iter(self.regimes)
+
+    def __len__(self):
+        return len(self.regimes)
+
+    @property
+    def errors(self):
+        return self.regimes.errors
+
+    def find(self, name: str = None):
+        """
+        :param name: the name of a regime (not its file name)
+        :return: the first regime with this name
+        """
+        for regime in self.regimes.values():
+            if regime.name == name:
+                return regime
+        raise KeyError(name)
@@ -0,0 +1,115 @@
+###############################################################
+#
+# Array-backed table of tabulated properties
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# Python imports
+import numpy as np
+
+
+class Table:
+    """
+    Class for storing the value of a tabulated property as sorted, contiguous numpy arrays of keys and values (and
+    optionally dev_value). Keys are of shape (n,), or (n, dimension) if the keys are coordinate tuples.
+    """
+
+    def __init__(self, keys=None, values=None, dev=None):
+        """
+        :param keys: the keys of the table
+        :param values: the values of the table, one per key
+        :param dev: the dev_value of the table, one per key. Default is None.
+        """
+        keys = np.asarray(keys, dtype=float)
+        values = np.asarray(values, dtype=float)
+        if keys.ndim not in (1, 2) or values.shape != keys.shape[:1]:
+            raise ValueError('A table needs one value per key.')
+        order = np.argsort(keys, kind='stable') if keys.ndim == 1 else np.lexsort(keys.T[::-1])
+        self.keys = np.ascontiguousarray(keys[order])
+        self.values = np.ascontiguousarray(values[order])
+        self.dev = None
+        if dev is not None:
+            dev = np.asarray(dev, dtype=float)
+            if dev.shape != values.shape:
+                raise ValueError('A table needs one dev_value per key.')
+            self.dev = np.ascontiguousarray(dev[order])
+
+    def __len__(self):
+        return self.values.shape[0]
+
+    def __repr__(self):
+        return f'Table({len(self)} entries, dimension {self.dimension})'
+
+    def __eq__(self, other):
+        return (isinstance(other, Table) and np.array_equal(self.keys, other.keys)
+                and np.array_equal(self.values, other.values)
+                and (self.dev is None) == (other.dev is None)
+                and (self.dev is None or np.array_equal(self.dev, other.dev, equal_nan=True)))
+
+    @property
+    def dimension(self):
+        """
+        :return: 1 for scalar keys, else the number of coordinates of the keys
+        """
+        return 1 if self.keys.ndim == 1 else self.keys.shape[1]
+
+    @classmethod
+    def from_dict(cls, value: dict = None, dev_value: dict = None):
+        """
+        Method to create a table from the dictionaries of a YAML file.
+        :param value: dictionary of the values, e.g. {10: 0.39, 42: 0.65}
+        :param dev_value: dictionary of the dev_values with the same keys as value. Default is None.
+        :return: a Table
+        """
+        dev = None
+        if isinstance(dev_value, dict) and dev_value:
+            dev = [dev_value[key] for key in value]
+        return cls(list(value.keys()), list(value.values()), dev)
+
+    def set_readonly(self):
+        """
+        Method to make the arrays of the table read-only, e.g. for tables shared between threads or processes.
+        :return: the table
+        """
+        for array in (self.keys, self.values, self.dev):
+            if array is not None:
+                array.flags.writeable = False
+        return self
+
+    def _key_list(self):
+        keys = self.keys.tolist()
+        return list(map(tuple, keys)) if self.keys.ndim == 2 else keys
+
+    def to_dict(self):
+        """
+        :return: the table as a dictionary (e.g. for writing YAML files)
+        """
+        return dict(zip(self._key_list(), self.values.tolist()))
+
+    def dev_to_dict(self):
+        """
+        :return: the dev_values as a dictionary or None
+        """
+        return None if self.dev is None else dict(zip(self._key_list(), self.dev.tolist()))
+
+
+def to_table(prop: dict = None):
+    """
+    Function to replace the dictionaries in value and dev_value of a tabulated property by a Table. dev_value then
+    holds the array of the dev_values of the table. Tables which cannot be converted (e.g. non-numeric values) are
+    kept as dictionaries.
+    :param prop: the fields of a property as a dict, changed in place
+    :return: True if the property was converted
+    """
+    if not isinstance(prop, dict) or prop.get('type') != 'tabulated' or not isinstance(prop.get('value'), dict) \
+            or not prop['value']:
+        return False
+    try:
+        table = Table.from_dict(prop['value'], prop.get('dev_value'))
+    except (KeyError, TypeError, ValueError):
+        return False
+    prop['value'] = table
+    if table.dev is not None:
+        prop['dev_value'] = table.dev
+    return True
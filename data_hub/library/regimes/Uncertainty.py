@@ -0,0 +1,332 @@
+###############################################################
+#
+# Monte Carlo propagation of the uncertainties of properties
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# imports from system libraries if necessary
+import itertools
+
+# Python imports
+import numpy as np
+import pandas as pd
+from scipy import interpolate, sparse, spatial
+
+from .Interpolator import NDInterpolator
+from .Table import Table
+
+PDFS = {'gauss': 'normal', 'gaussian': 'normal', 'normal': 'normal', 'uniform': 'uniform'}
+
+
+def draw(pdf: str = 'Gauss', size=None, rng=None):
+    """
+    Function to draw standardized samples of a PDF given by dev_pdf, which are scaled with dev_value.
+    :param pdf: 'Gauss' (dev_value is the standard deviation) or 'uniform' (dev_value is the half width). Default is
+    'Gauss'.
+    :param size: shape of the samples
+    :param rng: numpy.random.Generator. Default is None (a new unseeded generator).
+    :return: the samples
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    if pdf is None or (isinstance(pdf, float) and np.isnan(pdf)):  # dev_pdf not given
+        pdf = 'Gauss'
+    kind = PDFS.get(str(pdf).lower())
+    if kind == 'normal':
+        return rng.standard_normal(size)
+    elif kind == 'uniform':
+        return rng.uniform(-1., 1., size)
+    raise NotImplementedError(f'The PDF {pdf} is not supported, possible PDFs are {list(PDFS)}.')
+
+
+class MonteCarlo:
+    """
+    Class for propagating the uncertainties (dev_pdf and dev_value) of the properties of a regime with Monte Carlo
+    sampling. The samples are processed in chunks, so the number of samples is only limited by time: statistics are
+    accumulated per chunk and percentiles are taken from histograms per point.
+    Scalar properties are sampled around value, tabulated properties get independent samples at every table entry
+    which are interpolated with interpolation_type, and expressions are evaluated on the samples of the properties they
+    refer to and get a sampled offset of their own dev_value. The histograms start at the range of the first chunk and
+    are widened (by merging pairs of bins) whenever a later chunk exceeds it, so no sample is clipped.
+    """
+    PERCENTILES = (5., 50., 95.)
+    CHUNK_SIZE = 10000  # number of samples per chunk
+    BINS = 1000  # number of histogram bins per point for the percentiles
+
+    def __init__(self, regime=None, n_samples: int = 100000, seed=None, chunk_size: int = None, bins: int = None,
+                 interpolation_type='linear'):
+        """
+        :param regime: the Regime
+        :param n_samples: number of samples. Default is 100000.
+        :param seed: seed of the random numbers, the same seed gives the same samples. Default is None.
+        :param chunk_size: number of samples processed at once. Default is CHUNK_SIZE.
+        :param bins: number of histogram bins for the percentiles. Default is BINS.
+        :param interpolation_type: kind of interpolation of tabulated properties (see Regime.get_scalar_prop_value),
+        should be the one used for the values of the regime. Default is 'linear'.
+        """
+        self.regime = regime
+        self.n_samples = n_samples
+        self.seed = seed
+        self.chunk_size = chunk_size or self.CHUNK_SIZE
+        self.bins = bins or self.BINS
+        self.interpolation_type = interpolation_type
+
+    def _rng(self, name_props):
+        # one random stream per property, so results do not depend on the order of the properties
+        name_key = [ord(char) for char in name_props]
+        return np.random.default_rng(np.random.SeedSequence(self.seed, spawn_key=name_key)
+                                     if self.seed is not None else None)
+
+    def iter_samples(self, name_props=None, variable=None, **variables):
+        """
+        Method to generate the samples of a property in chunks.
+        :param name_props: Name of the property
+        :param variable: Array of values of the variable x. For tabulated properties with coordinates as keys, an array
+        of shape (n points, dimension).
+        :param variables: Additional variables of expressions
+        :return: generator of arrays of shape (chunk size, n points)
+        """
+        x = None if variable is None else np.asarray(variable, dtype=float)
+        n_points = 1 if x is None or x.ndim == 0 else len(x)
+        samplers = {}  # per property, kept for all chunks
+        for size in self._chunk_sizes():
+            # every property is sampled once per chunk, properties referred to several times get the same samples
+            yield np.broadcast_to(self._draw(name_props, size, x, variables, samplers, {}), (size, n_points))
+
+    def _draw(self, name_props, size, x, variables, samplers, memo):
+        """
+        Method to draw the samples of a property for one chunk. Expressions are evaluated on the samples of the
+        properties they refer to (arrays of shape (chunk size, n points)) and get their own dev_value on top.
+        """
+        if name_props in memo:
+            return memo[name_props]
+        if name_props not in samplers:
+            samplers[name_props] = self._sampler(name_props, x)
+        samples = samplers[name_props](size)
+        if self.regime.props[name_props]['type'] == 'expression':
+            expression = self.regime.get_expression(name_props)
+            values = {'x': x}
+            values.update(variables)  # variables named like a property replace that property
+            for name in expression.variables:
+                if values.get(name) is None and name in self.regime.props and name != name_props:
+                    values[name] = self._draw(name, size, x, variables, samplers, memo)
+            samples = expression.evaluate(**values) + samples
+        memo[name_props] = samples
+        return samples
+
+    def _sampler(self, name_props, x):
+        """
+        Method to prepare the sampling of a property at the points x.
+        :return: a function of the chunk size returning the samples of the property, for expressions only the samples
+        of their own dev_value
+        """
+        regime = self.regime
+        regime.resolve_tabulated(name_props)
+        prop = regime.props[name_props]
+        pdf = prop['dev_pdf'] if 'dev_pdf' in prop else None
+        dev = prop['dev_value'] if 'dev_value' in prop else None
+        rng = self._rng(name_props)
+
+        if prop['type'] == 'tabulated':
+            table = prop['value'] if isinstance(prop['value'], Table) else Table.from_dict(prop['value'], dev)
+            if x is None:
+                raise ValueError(f'Provide variable values for interpolating {name_props}.')
+            nodes, weights = self._weights(table, x, self.interpolation_type)
+            # only the table entries used by the points are sampled, the interpolation is a sparse matrix product
+            needed, local = np.unique(nodes, return_inverse=True)
+            rows = np.repeat(np.arange(nodes.shape[0]), nodes.shape[1])
+            matrix = sparse.csr_matrix((weights.ravel(), (rows, local.ravel())), shape=(nodes.shape[0], len(needed)))
+            mean = table.values[needed]
+            dev = _dev_array(table.dev if table.dev is not None else dev, len(table))[needed]
+            return lambda size: (matrix @ (mean + dev * draw(pdf, (size, len(needed)), rng)).T).T
+        if prop['type'] == 'scalar':
+            mean = float(prop['value'])
+            dev = _dev_array(dev, 1)[0]
+            return lambda size: mean + dev * draw(pdf, (size, 1), rng)
+        if prop['type'] == 'expression':
+            dev = _dev_array(dev, 1)[0]
+            return lambda size: dev * draw(pdf, (size, 1), rng)
+        raise NotImplementedError('Uncertainties can only be propagated for expressions, tabulated and scalar values.')
+
+    def _chunk_sizes(self):
+        n_chunks, rest = divmod(self.n_samples, self.chunk_size)
+        return [self.chunk_size] * n_chunks + ([rest] if rest else [])
+
+    @staticmethod
+    def _weights(table, x, kind='linear'):
+        """
+        Method to get the weights of the interpolation of a table, i.e. the value at every point is the weighted sum of
+        the values of a few table entries (of all entries for splines of higher order).
+        :param kind: kind of interpolation (see Regime.get_scalar_prop_value). Default is 'linear'.
+        :return: the indices of the table entries and their weights, both of shape (n points, entries per point)
+        """
+        n_entries = len(table)
+        if table.dimension == 1:
+            x = np.atleast_1d(x)
+            if np.any(x < table.keys[0]) or np.any(x > table.keys[-1]):
+                raise ValueError('A value in x is outside of the interpolation range.')
+            if kind in ('linear', 'slinear'):
+                left = np.clip(np.searchsorted(table.keys, x, side='right') - 1, 0, n_entries - 2)
+                fraction = (x - table.keys[left]) / (table.keys[left + 1] - table.keys[left])
+                return np.stack([left, left + 1], axis=1), np.stack([1. - fraction, fraction], axis=1)
+            if kind in ('nearest', 'zero', 'previous', 'next'):  # one entry, found by interpolating the indices
+                index = interpolate.interp1d(table.keys, np.arange(n_entries), kind=kind, assume_sorted=True)(x)
+                return np.rint(index).astype(np.int64)[:, None], np.ones((len(x), 1))
+            # splines are linear in the values as well, the weights are the splines of the unit vectors
+            weights = interpolate.interp1d(table.keys, np.eye(n_entries), kind=kind, axis=0, assume_sorted=True)(x)
+            return np.broadcast_to(np.arange(n_entries), weights.shape), weights
+
+        x = np.atleast_2d(x)
+        dimension = table.dimension
+        # the kind which is used for coordinates as keys (and the check of the kind) as in NDInterpolator
+        interpolator = NDInterpolator(table.keys, np.arange(n_entries, dtype=float), kind=kind)
+        if interpolator.kind == 'nearest':
+            return np.rint(interpolator(x)).astype(np.int64)[:, None], np.ones((len(x), 1))
+        if interpolator.kind == 'grid':
+            # multilinear weights of the corners of the grid cells, points outside of the grid give nan
+            axes, indices = interpolator._grid_axes()
+            entries = np.empty([len(axis) for axis in axes], dtype=np.int64)
+            entries[indices] = np.arange(n_entries)
+            corners = np.array(list(itertools.product((0, 1), repeat=dimension)))  # (2^dimension, dimension)
+            weights = np.ones((len(x), len(corners)))
+            lefts = []
+            for i, axis in enumerate(axes):
+                left = np.clip(np.searchsorted(axis, x[:, i], side='right') - 1, 0, len(axis) - 2)
+                fraction = (x[:, i] - axis[left]) / (axis[left + 1] - axis[left])
+                weights *= np.where(corners[:, i], fraction[:, None], 1. - fraction[:, None])
+                lefts.append(left[:, None] + corners[:, i])
+            nodes = entries[tuple(lefts)]
+            outside = np.any((x < [axis[0] for axis in axes]) | (x > [axis[-1] for axis in axes]), axis=1)
+            weights[outside] = np.nan
+            return nodes, weights
+        # barycentric coordinates in the Delaunay triangulation, points outside of the convex hull give nan
+        triangulation = spatial.Delaunay(table.keys)
+        simplices = triangulation.find_simplex(x)
+        transform = triangulation.transform[simplices]
+        barycentric = np.einsum('pij,pj->pi', transform[:, :dimension], x - transform[:, dimension])
+        weights = np.column_stack([barycentric, 1. - barycentric.sum(axis=1)])
+        weights[simplices < 0] = np.nan
+        return triangulation.simplices[simplices], weights
+
+    def sample(self, name_props=None, variable=None, **variables):
+        """
+        Method to get all samples of a property at once (n_samples x n points values in memory).
+        :return: an array of shape (n_samples, n points)
+        """
+        return np.concatenate(list(self.iter_samples(name_props, variable, **variables)))
+
+    def propagate(self, name_props_list=None, variable=None, percentiles=None, **variables):
+        """
+        Method to get statistics of the samples of properties at points.
+        :param name_props_list: List of property names (or a single name)
+        :param variable: Array of values of the variable x (see iter_samples)
+        :param percentiles: the percentiles of the bands. Default is PERCENTILES.
+        :param variables: Additional variables of expressions
+        :return: a dict with a pandas.DataFrame per property, with one row per point and the columns mean, std and
+        p<percentile> (e.g. p5, p50, p95)
+        """
+        if isinstance(name_props_list, str):
+            name_props_list = [name_props_list]
+        if percentiles is None:
+            percentiles = self.PERCENTILES
+        return {name_props: self._statistics(self.iter_samples(name_props, variable, **variables), percentiles)
+                for name_props in name_props_list}
+
+    def _statistics(self, chunks, percentiles):
+        first = next(chunks)
+        n_points = first.shape[1]
+        # histogram range per point, set by the first chunk with values and widened for later samples outside of it
+        low = np.full(n_points, np.nan)
+        width = np.full(n_points, np.nan)
+        minimum = np.full(n_points, np.inf)
+        maximum = np.full(n_points, -np.inf)
+
+        counts = np.zeros((n_points, self.bins), dtype=np.int64)
+        n = np.zeros(n_points)
+        mean = np.zeros(n_points)
+        squares = np.zeros(n_points)  # sum of the squared deviations from the mean
+        offsets = np.arange(n_points) * self.bins
+        chunk = first
+        while chunk is not None:
+            valid = ~np.isnan(chunk)
+            # merge the mean and squared deviations of the chunk (Chan et al.), stable for large sample numbers
+            n_chunk = valid.sum(axis=0)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                mean_chunk = np.where(n_chunk > 0, np.where(valid, chunk, 0.).sum(axis=0) / n_chunk, 0.)
+                squares_chunk = (np.where(valid, chunk - mean_chunk, 0.) ** 2).sum(axis=0)
+                n_total = n + n_chunk
+                delta = mean_chunk - mean
+                mean = np.where(n_total > 0, mean + delta * n_chunk / n_total, 0.)
+                squares += np.where(n_total > 0, squares_chunk + delta ** 2 * n * n_chunk / n_total, 0.)
+            n = n_total
+
+            chunk_min = np.where(valid, chunk, np.inf).min(axis=0)
+            chunk_max = np.where(valid, chunk, -np.inf).max(axis=0)
+            minimum = np.minimum(minimum, chunk_min)
+            maximum = np.maximum(maximum, chunk_max)
+            start = np.isnan(low) & (n_chunk > 0)  # the range of the chunk, widened for the tails
+            spread = chunk_max[start] - chunk_min[start]
+            low[start] = chunk_min[start] - 0.5 * spread
+            width[start] = np.where(spread > 0., 2. * spread, 1.) / self.bins
+            counts = self._widen(counts, low, width, chunk_min, chunk_max)
+
+            index = np.clip(np.floor((chunk - low) / width), 0, self.bins - 1)
+            flat = (index + offsets)[valid].astype(np.int64)
+            counts += np.bincount(flat, minlength=n_points * self.bins).reshape(n_points, self.bins)
+            chunk = next(chunks, None)
+
+        constant = ~(maximum > minimum)  # no spread (or only nan)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(n > 0, mean, np.nan)
+            std = np.sqrt(squares / (n - 1))
+        result = {'mean': mean, 'std': std}
+        cumulative = np.cumsum(counts, axis=1)
+        for percentile in percentiles:
+            target = percentile / 100. * n
+            # first bin reaching the target, linear inside of the bin
+            bin_index = np.minimum((cumulative < target[:, None]).sum(axis=1), self.bins - 1)
+            below = np.take_along_axis(cumulative, bin_index[:, None], axis=1)[:, 0] \
+                - counts[np.arange(n_points), bin_index]
+            in_bin = counts[np.arange(n_points), bin_index]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                fraction = np.clip(np.where(in_bin > 0, (target - below) / in_bin, 0.), 0., 1.)
+            value = low + (bin_index + fraction) * width
+            value[constant] = mean[constant]
+            value[n == 0] = np.nan
+            result[f'p{percentile:g}'] = value
+        return pd.DataFrame(result)
+
+    def _widen(self, counts, low, width, chunk_min, chunk_max):
+        """
+        Method to double the range of the histograms (low and width are changed in place) until it holds the values of
+        a chunk. Pairs of bins are merged, the old range becomes the upper or lower part of the new one.
+        :return: the counts of the widened histograms
+        """
+        shift = self.bins // 2  # bins added below the old range when it is widened downwards
+        merged_index = np.arange(self.bins) // 2
+        while True:
+            down = chunk_min < low
+            up = ~down & (chunk_max >= low + self.bins * width)
+            grow = down | up
+            if not grow.any():
+                return counts
+            target = merged_index + np.where(down[grow], shift, 0)[:, None]
+            merged = np.zeros((int(grow.sum()), self.bins), dtype=counts.dtype)
+            np.add.at(merged, (np.arange(len(merged))[:, None], target), counts[grow])
+            counts[grow] = merged
+            low[down] -= 2. * shift * width[down]
+            width[grow] *= 2.
+
+
+def _dev_array(dev, length):
+    """
+    Function to get dev_value as an array of standard deviations (or half widths), missing values mean no uncertainty.
+    """
+    if dev is None or isinstance(dev, (dict, str)):
+        if isinstance(dev, dict):
+            dev = list(dev.values())
+        else:
+            return np.zeros(length)
+    dev = np.asarray(dev, dtype=float)
+    return np.nan_to_num(np.broadcast_to(dev, (length,)) if dev.ndim == 0 else dev, nan=0.)
@@ -0,0 +1,285 @@
+###############################################################
+#
+# Conversion of SI units given by unit strings and exponent arrays
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# imports from system libraries if necessary
+import functools
+import re
+import warnings
+
+# Python imports
+import numpy as np
+
+BASE_UNITS = ['kg', 'm', 's', 'K', 'A', 'mol', 'cd']  # order of the exponent arrays unit and variable_unit
+
+
+def _exponents(**powers):
+    return tuple(float(powers.get(base, 0)) for base in BASE_UNITS)
+
+
+# symbol: (factor to SI, exponents)
+UNITS = {
+    'kg': (1., _exponents(kg=1)),
+    'g': (1e-3, _exponents(kg=1)),
+    't': (1e3, _exponents(kg=1)),
+    'm': (1., _exponents(m=1)),
+    's': (1., _exponents(s=1)),
+    'min': (60., _exponents(s=1)),
+    'h': (3600., _exponents(s=1)),
+    'd': (86400., _exponents(s=1)),
+    'a': (31557600., _exponents(s=1)),  # Julian year
+    'yr': (31557600., _exponents(s=1)),
+    'K': (1., _exponents(K=1)),
+    'A': (1., _exponents(A=1)),
+    'mol': (1., _exponents(mol=1)),
+    'cd': (1., _exponents(cd=1)),
+    'Hz': (1., _exponents(s=-1)),
+    'N': (1., _exponents(kg=1, m=1, s=-2)),
+    'Pa': (1., _exponents(kg=1, m=-1, s=-2)),
+    'bar': (1e5, _exponents(kg=1, m=-1, s=-2)),
+    'atm': (101325., _exponents(kg=1, m=-1, s=-2)),
+    'J': (1., _exponents(kg=1, m=2, s=-2)),
+    'W': (1., _exponents(kg=1, m=2, s=-3)),
+    'C': (1., _exponents(s=1, A=1)),
+    'V': (1., _exponents(kg=1, m=2, s=-3, A=-1)),
+    'Ohm': (1., _exponents(kg=1, m=2, s=-3, A=-2)),
+    'S': (1., _exponents(kg=-1, m=-2, s=3, A=2)),
+    'L': (1e-3, _exponents(m=3)),
+    'l': (1e-3, _exponents(m=3)),
+    'rad': (1., _exponents()),
+    'deg': (np.pi / 180., _exponents()),
+    '%': (1e-2, _exponents()),
+    'ppm': (1e-6, _exponents()),
+}
+# units with a zero point, they can only be converted alone (e.g. degC to K), not as part of compound units
+OFFSET_UNITS = {
+    'degC': (1., 273.15),
+    '°C': (1., 273.15),
+    'degF': (5. / 9., 459.67 * 5. / 9.),
+}
+PREFIXES = {'Y': 1e24, 'Z': 1e21, 'E': 1e18, 'P': 1e15, 'T': 1e12, 'G': 1e9, 'M': 1e6, 'k': 1e3, 'h': 1e2, 'da': 1e1,
+            'd': 1e-1, 'c': 1e-2, 'm': 1e-3, 'u': 1e-6, 'µ': 1e-6, 'n': 1e-9, 'p': 1e-12, 'f': 1e-15, 'a': 1e-18}
+DIMENSIONLESS = ['', '-', '1']
+
+_TOKEN = re.compile(r'\s*(\*\*|[()*/^.·]|[+-]?\d+(?:\.\d+)?|[A-Za-z%°µΩ]+)')
+
+
+class Unit(tuple):
+    """
+    A unit as (factor to SI, exponents of BASE_UNITS, offset to SI), e.g. km/h is (1 / 3.6, (0, 1, -1, 0, 0, 0, 0), 0).
+    """
+
+    def __new__(cls, factor=1., exponents=None, offset=0.):
+        return super().__new__(cls, (float(factor), tuple(exponents or _exponents()), float(offset)))
+
+    def __getnewargs__(self):
+        # pickle and copy call __new__ with these arguments, not with the tuple itself
+        return tuple(self)
+
+    factor = property(lambda self: self[0])
+    exponents = property(lambda self: self[1])
+    offset = property(lambda self: self[2])
+
+    def __mul__(self, other):
+        return Unit(self.factor * other.factor, np.add(self.exponents, other.exponents).tolist())
+
+    def __pow__(self, power):
+        return Unit(self.factor ** power, (np.multiply(self.exponents, power)).tolist())
+
+    def __truediv__(self, other):
+        return self * other ** -1
+
+    def __str__(self):
+        # in SI base units, e.g. '1000 kg m^-3'
+        parts = [] if self.factor == 1. else [f'{self.factor:g}']
+        parts += [base if exponent == 1 else f'{base}^{exponent:g}'
+                  for base, exponent in zip(BASE_UNITS, self.exponents) if exponent != 0]
+        if self.offset:
+            parts.append(f'{self.offset:+g}')
+        return ' '.join(parts) or '1'
+
+
+def parse_exponents(unit=None):
+    """
+    Function to parse an exponent array of a YAML file, e.g. [ 1 -3 0 0 0 0 0 ] (which is read as a list with one
+    string) or [1, -3, 0, 0, 0, 0, 0].
+    :param unit: the exponent array
+    :return: the exponents as a tuple of floats or None if unit is not given
+    """
+    if unit is None or (isinstance(unit, float) and np.isnan(unit)):
+        return None
+    if isinstance(unit, str):
+        unit = [unit]
+    values = [float(item) for entry in unit for item in (entry.split() if isinstance(entry, str) else [entry])]
+    if len(values) != len(BASE_UNITS):
+        raise ValueError(f'A unit array needs {len(BASE_UNITS)} exponents {BASE_UNITS}, got {unit}.')
+    return tuple(values)
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_unit(unit_str: str = None):
+    """
+    Function to parse a unit string, e.g. 'kg/m^3', 'W/(m K)', 'km h^-1' or 'MPa'. Factors are separated by spaces,
+    '*' or '.', exponents are given with '^' or '**'.
+    :param unit_str: the unit string
+    :return: a Unit
+    """
+    text = unit_str.strip()
+    if text in DIMENSIONLESS:
+        return Unit()
+    if text in OFFSET_UNITS:
+        factor, offset = OFFSET_UNITS[text]
+        return Unit(factor, _exponents(K=1), offset)
+
+    position = 0
+    tokens = []
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if match is None or not match.group(1):
+            raise ValueError(f'Cannot parse the unit {unit_str}.')
+        tokens.append(match.group(1))
+        position = match.end()
+        if position < len(text) and text[position].isspace() and text[position:].strip():
+            tokens.append(' ')  # a space separates factors
+
+    tokens = [token for i, token in enumerate(tokens)
+              if token != ' ' or (tokens[i - 1] not in '*/.·(' and tokens[i + 1] not in '*/.·)^')]
+    unit, position = _parse_product(tokens, 0, unit_str)
+    if position != len(tokens):
+        raise ValueError(f'Cannot parse the unit {unit_str}.')
+    return unit
+
+
+def _parse_product(tokens, position, unit_str):
+    unit, position = _parse_power(tokens, position, unit_str)
+    while position < len(tokens) and tokens[position] in ('*', '.', '·', ' ', '/'):
+        operator = tokens[position]
+        factor, position = _parse_power(tokens, position + 1, unit_str)
+        unit = unit / factor if operator == '/' else unit * factor
+    return unit, position
+
+
+def _parse_power(tokens, position, unit_str):
+    if position >= len(tokens):
+        raise ValueError(f'Cannot parse the unit {unit_str}.')
+    token = tokens[position]
+    if token == '(':
+        unit, position = _parse_product(tokens, position + 1, unit_str)
+        if position >= len(tokens) or tokens[position] != ')':
+            raise ValueError(f'Missing parenthesis in the unit {unit_str}.')
+        position += 1
+    elif re.fullmatch(r'[+-]?\d+(?:\.\d+)?', token):
+        unit, position = Unit(float(token)), position + 1
+    else:
+        unit, position = _symbol(token, unit_str), position + 1
+    if position < len(tokens) and tokens[position] in ('^', '**'):
+        unit = unit ** float(tokens[position + 1])
+        position += 2
+    elif position < len(tokens) and re.fullmatch(r'[+-]?\d+', tokens[position]):
+        unit = unit ** float(tokens[position])  # exponents without '^', e.g. m2 or s-1
+        position += 1
+    return unit, position
+
+
+def _symbol(symbol, unit_str):
+    if symbol in UNITS:
+        return Unit(*UNITS[symbol])
+    if symbol in ('Ω', 'ohm'):
+        return Unit(*UNITS['Ohm'])
+    for prefix in sorted(PREFIXES, key=len, reverse=True):  # 'da' before 'd'
+        if symbol.startswith(prefix) and symbol[len(prefix):] in UNITS and symbol[len(prefix):] != 'kg':
+            factor, exponents = UNITS[symbol[len(prefix):]]
+            return Unit(PREFIXES[prefix] * factor, exponents)
+    raise ValueError(f'Unknown unit {symbol} in {unit_str}.')
+
+
+def get_unit(unit=None):
+    """
+    :param unit: a unit string or an exponent array (SI units, e.g. [0 1 -1 0 0 0 0] for m/s)
+    :return: a Unit
+    """
+    if isinstance(unit, Unit):
+        return unit
+    if isinstance(unit, str):
+        return parse_unit(unit)
+    return Unit(1., parse_exponents(unit))
+
+
+@functools.lru_cache(maxsize=1024)
+def _conversion(from_unit, to_unit):
+    if not np.allclose(from_unit.exponents, to_unit.exponents):
+        return None
+    # value_to = (value_from * factor_from + offset_from - offset_to) / factor_to
+    return from_unit.factor / to_unit.factor, (from_unit.offset - to_unit.offset) / to_unit.factor
+
+
+def conversion_factor(from_unit=None, to_unit=None):
+    """
+    Function to get the (cached) conversion between two compatible units.
+    :param from_unit: unit string, exponent array or Unit of the values
+    :param to_unit: unit string, exponent array or Unit of the result
+    :return: (scale, offset), the converted values are values * scale + offset
+    """
+    conversion = _conversion(get_unit(from_unit), get_unit(to_unit))
+    if conversion is None:
+        raise ValueError(f'The units {from_unit} and {to_unit} are not compatible.')
+    return conversion
+
+
+def convert(values=None, from_unit=None, to_unit=None):
+    """
+    Function to convert values (scalars or arrays) between compatible units.
+    :param values: the values
+    :param from_unit: unit string, exponent array or Unit of the values
+    :param to_unit: unit string, exponent array or Unit of the result
+    :return: the converted values
+    """
+    scale, offset = conversion_factor(from_unit, to_unit)
+    if scale == 1. and offset == 0.:
+        return values
+    if isinstance(values, (list, tuple)):
+        values = np.asarray(values, dtype=float)
+    return values * scale + offset if offset else values * scale
+
+
+def prop_unit(prop=None, name_props: str = None, variable: bool = False):
+    """
+    Function to get the unit of the values (or of the variable) of a property and to check that unit_str and the
+    exponent array unit agree. Inconsistent or unknown units are reported as warnings.
+    :param prop: the fields of a property as a dict or pandas.Series
+    :param name_props: Name of the property, for the warnings
+    :param variable: if it is True, use variable_unit_str and variable_unit. Default is False.
+    :return: a Unit or None if the property has no (readable) unit; for several variables a dict of them
+    """
+    field = 'variable_unit' if variable else 'unit'
+    unit_str = prop.get(field + '_str')
+    unit = prop.get(field)
+    if isinstance(unit_str, dict) or isinstance(unit, dict):  # one unit per variable
+        unit_str = unit_str if isinstance(unit_str, dict) else {}
+        unit = unit if isinstance(unit, dict) else {}
+        return {name: _checked_unit(unit_str.get(name), unit.get(name), f'{name_props} ({name})', field)
+                for name in {**unit_str, **unit}}
+    return _checked_unit(unit_str, unit, name_props, field)
+
+
+def _checked_unit(unit_str, unit, name, field):
+    if isinstance(unit_str, float) and np.isnan(unit_str):
+        unit_str = None
+    try:
+        exponents = parse_exponents(unit)
+    except (TypeError, ValueError) as error:
+        warnings.warn(f'{name}: {error}')
+        exponents = None
+    if not isinstance(unit_str, str):
+        return Unit(1., exponents) if exponents is not None else None
+    try:
+        parsed = parse_unit(unit_str)
+    except ValueError as error:
+        warnings.warn(f'{name}: {error}')
+        return Unit(1., exponents) if exponents is not None else None
+    if exponents is not None and not np.allclose(parsed.exponents, exponents):
+        warnings.warn(f'{name}: {field}_str {unit_str} does not match {field} {list(exponents)}.')
+    return parsed
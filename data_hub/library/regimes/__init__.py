@@ -5,4 +5,16 @@
 #
 ################################################################
 
+from .Cache import *
+from .Expression import *
+from .Interpolator import *
+from .Profile import *
+from .Table import *
+from .Units import *
+from .CompiledCache import *
 from .Regime import *
+from .Uncertainty import *
+from .Catalog import *
+from .Loader import *
+from .SharedStore import *
+from .LayeredRegime import *
@@ -6,9 +6,17 @@
 ################################################################
 
 # Python import
+import itertools
+import os
+
 import yaml as yaml
 import numpy as np
 
+from ..regimes.Regime import PrettySafeLoader
+
+CHUNK_ROWS = 1000000  # number of rows read at once by Converter.iter_file
+META_KEYS = ['name', 'description', 'figures']  # entries of a file which are not properties
+
 
 class Converter:
     """
@@ -27,19 +35,27 @@ class Converter:
         :return: a numpy.array and a str which stores the names of variables
         """
 
-        data_file = []
         with open(file_name, 'r') as f:
-            data = f.readlines()
-        for i, line in enumerate(data):
-            # only take the numbers
-            if i > 0:  # suppose the first line only contains string
-                tmp = list(map(float, line.split()))  # convert str to float
-                data_file.append(tmp)
-            else:
-                self.res_str = line.split()
-        self.res = np.array(data_file)
+            self.res_str = f.readline().split()  # suppose the first line only contains string
+            # only take the numbers, parsed at once by numpy
+            self.res = np.loadtxt(f, dtype=float, ndmin=2)
         return self.res, self.res_str
 
+    def iter_file(self, file_name: str = None, chunk_rows: int = CHUNK_ROWS):
+        """
+        Method for reading the .txt file chunk by chunk, e.g. for files which are larger than the memory
+        :param file_name: Name of the .txt file
+        :param chunk_rows: number of rows per chunk
+        :return: a generator of numpy.arrays with at most chunk_rows rows; the names of variables are stored in res_str
+        """
+
+        with open(file_name, 'r') as f:
+            self.res_str = f.readline().split()  # suppose the first line only contains string
+            lines = (line for line in f if line.strip())
+            for first_line in lines:  # stops at the end of the file, numpy is never called without data
+                yield np.loadtxt(itertools.chain([first_line], itertools.islice(lines, chunk_rows - 1)), dtype=float,
+                                 ndmin=2)
+
     def create_value_dict_1d(self, key_list=None, value_list=None):
         """
         Method for creating a dictionary (for 1D file)
@@ -82,11 +98,14 @@ class Converter:
                     meta_sys: str = None,
                     unit_str: str = None,
                     variable: str = None,
-                    unit: list = None, variable_unit_str: str = None, variable_unit: list = None):
+                    unit: list = None, variable_unit_str: str = None, variable_unit: list = None,
+                    storage: str = 'yaml', txt_file: str = None, key_columns=(0,), value_column: int = 1,
+                    dev_column: int = None, chunk_rows: int = CHUNK_ROWS):
         """
         :param save_file_name : The new yaml files name
         :param ice_props_name: name of ice property
-        :param value: the value of ice property, which is in the form of dictionary
+        :param value: the value of ice property, which is in the form of dictionary (for storage 'npz' also a tuple of
+        a key array and a value array)
         :param dev_pdf: Gauss or other parametrized or tabulated PDF
         :param dev_value: hyperparameters of PDF or array
         :param source: data source
@@ -97,8 +116,37 @@ class Converter:
         :param unit: unit in systematically documented SI units [ kg m s K A mol cd ]
         :param variable_unit_str: standard string to indicate variable_unit
         :param variable_unit: unit in systematically documented SI units [ kg m s K A mol cd ]
+        :param storage: 'yaml' writes the table into the yaml file, 'npz' writes keys, values (and dev_value) into a
+        .npz file next to the yaml file, which is referenced by its name in value (and dev_value). Default is 'yaml'.
+        :param txt_file: a .txt file (see load_file) which is read chunk by chunk instead of giving value, e.g. for
+        tables which are too large for the dictionaries of value. Default is None.
+        :param key_columns: indices of the columns of txt_file with the keys, one column for scalar keys and several
+        for coordinate tuples. Default is (0,).
+        :param value_column: index of the column of txt_file with the values. Default is 1.
+        :param dev_column: index of the column of txt_file with the dev_values. Default is None (no dev_value).
+        :param chunk_rows: number of rows of txt_file read at once. Default is CHUNK_ROWS.
         """
 
+        if txt_file is not None:
+            value, dev = Converter._read_table(txt_file, key_columns, value_column, dev_column, chunk_rows)
+            if dev is not None:
+                dev_value = (value[0], dev)
+            if storage != 'npz':
+                keys = list(map(tuple, value[0].tolist())) if value[0].ndim == 2 else value[0].tolist()
+                value = dict(zip(keys, value[1].tolist()))
+                dev_value = dict(zip(keys, dev.tolist())) if dev is not None else dev_value
+
+        if storage == 'npz':
+            npz_name = f'{os.path.splitext(os.path.basename(save_file_name))[0]}.{ice_props_name}.npz'
+            arrays = Converter._table_arrays(value)
+            if isinstance(dev_value, (dict, tuple)):
+                arrays['dev'] = Converter._dev_array(value, dev_value)
+                dev_value = npz_name
+            np.savez(os.path.join(os.path.dirname(save_file_name), npz_name), **arrays)
+            value = npz_name
+        elif storage != 'yaml':
+            raise ValueError(f'Unknown storage {storage}, use "yaml" or "npz".')
+
         ice_props_dict = {
             ice_props_name: {'type': 'tabulated', 'value': value, 'dev_pdf': dev_pdf, 'dev_value': dev_value,
                              'unit': unit, 'unit_str': unit_str,
@@ -110,20 +158,145 @@ class Converter:
             yaml.dump(ice_props_dict, file)
 
     @staticmethod
-    def merge(file1: str = None, file2: str = None):
+    def _read_table(txt_file, key_columns, value_column, dev_column, chunk_rows):
+        # only copies of the columns of the table are kept from the chunks of the file
+        key_columns = list(key_columns)
+        keys, values, dev = [], [], []
+        for chunk in Converter().iter_file(txt_file, chunk_rows=chunk_rows):
+            keys.append(chunk[:, key_columns] if len(key_columns) > 1 else chunk[:, key_columns[0]].copy())
+            values.append(chunk[:, value_column].copy())
+            if dev_column is not None:
+                dev.append(chunk[:, dev_column].copy())
+        if not values:
+            raise ValueError(f'{txt_file} contains no data.')
+        return (np.concatenate(keys), np.concatenate(values)), np.concatenate(dev) if dev else None
+
+    @staticmethod
+    def _table_arrays(value):
+        # keys and values of a table as arrays, keys of shape (n,) or (n, dimension) for coordinates
+        if isinstance(value, dict):
+            keys, values = list(value.keys()), list(value.values())
+        else:
+            keys, values = value
+        return {'keys': np.asarray(keys, dtype=float), 'values': np.asarray(values, dtype=float)}
+
+    @staticmethod
+    def _dev_array(value, dev_value):
+        # dev_values in the order of the keys of value, the dictionaries can be ordered differently
+        if isinstance(dev_value, dict):
+            keys = value.keys() if isinstance(value, dict) else Converter._table_arrays(value)['keys'].tolist()
+            return np.asarray([dev_value[tuple(key) if isinstance(key, list) else key] for key in keys], dtype=float)
+        return Converter._table_arrays(dev_value)['values']
+
+    @staticmethod
+    def merge(file1: str = None, file2: str = None, overwrite: bool = False):
         """
-        Method for merging two files
+        Method for merging two files. The entries of file2 are appended to file1 as text (file1 is created if it does
+        not exist), so comments and the order of file1 are kept; only the lines with the top-level keys are parsed.
         :param file1: name of file1, the content of file2 will be merged into file1
         :param file2: name of file2
+        :param overwrite: if it is True, properties of file2 replace properties of file1 with the same name, otherwise
+        duplicate properties raise a ValueError and file1 is not changed. Default is False.
 
         """
-        f1 = open(file1, 'a+', encoding='utf-8')
+        text1 = ''
+        if os.path.exists(file1):
+            with open(file1, 'r', encoding='utf-8') as f1:
+                text1 = f1.read()
         with open(file2, 'r', encoding='utf-8') as f2:
-            f1.write('\n')
-            for i in f2:
-                f1.write(i)
+            text2 = f2.read()
+        split1, split2 = Converter._top_level_entries(text1), Converter._top_level_entries(text2)
+        if split1 is None or split2 is None:  # not in block style, e.g. a flow mapping
+            return Converter._merge_parsed(file1, file2, text1, text2, overwrite)
+        (header1, entries1), (header2, entries2) = split1, split2
+
+        keys1 = [key for key, entry in entries1]
+        duplicates = [key for key, entry in entries2 if key in keys1 and key not in META_KEYS]
+        if duplicates and not overwrite:
+            raise ValueError(f'{file2} cannot be merged into {file1}, duplicate properties: {", ".join(duplicates)}')
+
+        dir1, dir2 = os.path.dirname(os.path.abspath(file1)), os.path.dirname(os.path.abspath(file2))
+        appended = header2
+        for key, entry in entries2:
+            if key in META_KEYS and key in keys1:  # the meta data of file1 is kept
+                continue
+            if dir1 != dir2 and 'tabulated' in entry:
+                entry = Converter._relocated_entry(key, entry, dir1, dir2)
+            appended += entry
+
+        if not duplicates:
+            with open(file1, 'a', encoding='utf-8') as f1:
+                f1.write('\n' + appended)
+            return
+        # the replaced entries are removed from the text of file1
+        text1 = header1 + ''.join(entry for key, entry in entries1 if key not in duplicates)
+        Converter._write_text(file1, text1 + '\n' + appended)
+
+    @staticmethod
+    def _top_level_entries(text):
+        # the text of a YAML mapping in block style as the lines before the first entry and a list of (key, text) of
+        # the top-level entries; None if the keys cannot be found line by line
+        lines = text.splitlines(keepends=True)
+        starts = [i for i, line in enumerate(lines) if line[:1] not in ('', ' ', '\t', '\r', '\n', '#')]
+        entries = []
+        for start, end in zip(starts, starts[1:] + [len(lines)]):
+            if lines[start][:1] in ('{', '[', '-', '?', '%', '.'):  # flow style, documents or directives
+                return None
+            try:
+                entry = yaml.load(lines[start], Loader=PrettySafeLoader)
+            except yaml.YAMLError:  # e.g. a value continued on the next lines
+                return None
+            if not isinstance(entry, dict) or len(entry) != 1:
+                return None
+            entries.append((next(iter(entry)), ''.join(lines[start:end])))
+        return ''.join(lines[:starts[0]] if starts else lines), entries
+
+    @staticmethod
+    def _relocated_entry(key, entry, dir1, dir2):
+        # .npz files are referenced relative to the yaml file, entries referring to one are written again
+        prop = Converter._relocated(yaml.load(entry, Loader=PrettySafeLoader)[key], dir1, dir2)
+        return yaml.dump({key: prop}) if prop is not None else entry
+
+    @staticmethod
+    def _relocated(prop, dir1, dir2):
+        # the property with .npz references relative to dir1 instead of dir2 or None if it has none
+        if not isinstance(prop, dict) or prop.get('type') != 'tabulated' or \
+                not any(isinstance(prop.get(field), str) for field in ('value', 'dev_value')):
+            return None
+        for field in ('value', 'dev_value'):
+            if isinstance(prop.get(field), str):
+                prop[field] = os.path.relpath(os.path.join(dir2, prop[field]), dir1)
+        return prop
+
+    @staticmethod
+    def _merge_parsed(file1, file2, text1, text2, overwrite):
+        # merging the parsed files, file1 is written with yaml.dump (without its comments)
+        data1 = yaml.load(text1, Loader=PrettySafeLoader) or {}
+        data2 = yaml.load(text2, Loader=PrettySafeLoader) or {}
+        duplicates = [key for key in data2 if key in data1 and key not in META_KEYS]
+        if duplicates and not overwrite:
+            raise ValueError(f'{file2} cannot be merged into {file1}, duplicate properties: {", ".join(duplicates)}')
+
+        dir1, dir2 = os.path.dirname(os.path.abspath(file1)), os.path.dirname(os.path.abspath(file2))
+        for key, prop in data2.items():
+            if key in META_KEYS and key in data1:
+                continue
+            if dir1 != dir2:
+                prop = Converter._relocated(prop, dir1, dir2) or prop
+            data1[key] = prop
+        Converter._write_text(file1, yaml.dump(data1))
+
+    @staticmethod
+    def _write_text(file_name, text):
+        # replaced at once, readers never see a partly written file
+        tmp_file = f'{file_name}.{os.getpid()}.tmp'
+        with open(tmp_file, 'w', encoding='utf-8') as file:
+            file.write(text)
+        os.replace(tmp_file, file_name)
 
 
+# demo, run as module (the relative imports need the package), the .txt files are read from the working directory:
+# python -m data_hub.library.tool.Converter
 if __name__ == "__main__":
     Converter_rho = Converter()
     Converter_t = Converter()
@@ -0,0 +1,5 @@
+import os
+
+# the shipped default properties, e.g. for tests with units, expressions and tables of a real file
+DEFAULT_PROPS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             'data_hub', 'yaml-db', '_default', 'props.yaml')
@@ -0,0 +1,31 @@
+###############################################################
+#
+# Shared fixtures of the tests
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# imports from system libraries if necessary
+import os
+import sys
+
+# Python imports
+import matplotlib
+import pytest
+import yaml
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+matplotlib.use('Agg')
+
+
+@pytest.fixture
+def write_yaml(tmp_path):
+    """
+    Fixture to write the content of a YAML file, returns a function taking the content and the file name.
+    """
+    def write(content, name='props.yaml'):
+        file_name = tmp_path / name
+        with open(file_name, 'w', encoding='utf-8') as file:
+            yaml.dump(content, file)
+        return str(file_name)
+    return write
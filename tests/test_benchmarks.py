@@ -0,0 +1,94 @@
+###############################################################
+#
+# Tests of the benchmark runner and the synthetic yaml-db generator
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# imports from system libraries if necessary
+import json
+import os
+
+# Python imports
+from benchmarks import __main__ as runner
+from benchmarks import generator
+from data_hub.library.regimes.Regime import Regime
+from data_hub.library.regimes.Table import Table
+
+
+class Counting:
+    params = [1, 2]
+    param_names = ['n']
+    calls = []
+
+    def setup(self, n):
+        self.n = n
+
+    def time_count(self, n):
+        self.calls.append(self.n)
+
+
+class Skipped:
+    def setup(self):
+        raise NotImplementedError
+
+    def time_nothing(self):
+        pass
+
+
+def test_generated_tree(tmp_path):
+    files = generator.generate_yaml_db(str(tmp_path), n_files=3, n_props=4, table_length=20, tuple_tables=1,
+                                       n_locations=2, profile_files=1, n_profiles=2, profile_points=10, n_folders=2)
+    assert len(files) == 3
+    assert sorted(os.listdir(tmp_path)) == ['category_0', 'category_1']
+    regimes = [Regime(file_name=file_name) for file_name in files]
+    assert sum('location' in regime.props for regime in regimes) == 2
+    regime = Regime(file_name=str(tmp_path / 'category_0' / 'synthetic_0.yaml'))
+    assert [regime.props[f'prop_{j}']['type'] for j in range(4)] == ['scalar', 'tabulated', 'expression', 'scalar']
+    assert len(regime.props['prop_1']['value']) == 20
+    assert isinstance(regime.props['coordinates_0']['value'], Table)
+    assert regime.props['coordinates_0']['value'].dimension == 3
+    assert regime.dependencies['prop_2'] == ['prop_0']
+    regime.load_profile_data()
+    assert regime.profile_data.shape == (2, 6, 10)
+    # the same arguments give the same tree
+    again = generator.generate_yaml_db(str(tmp_path / 'again'), n_files=3, n_props=4, table_length=20,
+                                       tuple_tables=1, n_locations=2, profile_files=1, n_profiles=2,
+                                       profile_points=10, n_folders=2)
+    with open(files[1]) as file, open(again[1]) as file_again:
+        assert file.read() == file_again.read()
+
+
+def test_synthetic_db_is_generated_once(tmp_path, monkeypatch):
+    monkeypatch.setenv(generator.DATA_DIR_ENV, str(tmp_path))
+    files = generator.synthetic_db(n_files=2, n_props=3)
+    modified = [os.stat(file_name).st_mtime_ns for file_name in files]
+    assert generator.synthetic_db(n_files=2, n_props=3) == files
+    assert [os.stat(file_name).st_mtime_ns for file_name in files] == modified
+    assert generator.synthetic_db(n_files=3, n_props=3) != files
+
+
+def test_discover():
+    benchmarks = runner.discover(r'ScalarPropValue\.time_scalar')
+    assert benchmarks
+    assert all(name.startswith('bench_regime.ScalarPropValue.time_scalar(table_length=') and
+               method_name == 'time_scalar' for name, cls, method_name, params in benchmarks)
+
+
+def test_run_and_compare(tmp_path, monkeypatch, capsys):
+    Counting.calls.clear()
+    assert runner.run(Counting, 'time_count', (2,), repeat=3, min_time=0.) >= 0.
+    assert Counting.calls == [2] * 6  # one untimed and one timed call per sample
+    assert runner.run(Skipped, 'time_nothing') is None
+
+    monkeypatch.setattr(runner, 'discover', lambda pattern: [(f'Counting.time_count(n={n})', Counting, 'time_count',
+                                                              (n,)) for n in Counting.params])
+    baseline = str(tmp_path / 'baseline.json')
+    assert runner.main(['--quick', '--save', baseline]) == 0
+    with open(baseline) as file:
+        results = json.load(file)
+    assert sorted(results) == ['Counting.time_count(n=1)', 'Counting.time_count(n=2)']
+    with open(baseline, 'w') as file:
+        json.dump(dict.fromkeys(results, 1e-12), file)  # everything is slower now
+    assert runner.main(['--quick', '--compare', baseline]) == 1
+    assert 'REGRESSION' in capsys.readouterr().out
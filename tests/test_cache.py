@@ -0,0 +1,67 @@
+###############################################################
+#
+# Tests of the size-limited caches of the Regime class
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# imports from system libraries if necessary
+import copy
+import pickle
+
+# Python imports
+import pytest
+
+from data_hub.library.regimes.Cache import LRUCache
+from data_hub.library.regimes.Regime import Regime
+
+PROPS = {'density': {'type': 'tabulated', 'value': {0.: 900., 50.: 910., 100.: 930.}, 'variable': 'depth'}}
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = LRUCache(maxsize=2)
+    cache['a'] = 1
+    cache['b'] = 2
+    assert cache.lookup('a') == 1  # 'b' is now the least recently used entry
+    cache['c'] = 3
+    assert list(cache) == ['a', 'c']
+    assert cache.lookup('b') is None
+    assert cache.lookup(['unhashable'], default=0) == 0
+    assert cache.info() == {'hits': 1, 'misses': 2, 'maxsize': 2, 'currsize': 2}
+    cache.clear()
+    assert cache.info() == {'hits': 0, 'misses': 0, 'maxsize': 2, 'currsize': 0}
+
+
+@pytest.mark.parametrize('duplicate', [copy.deepcopy, lambda cache: pickle.loads(pickle.dumps(cache))])
+def test_copies_keep_the_limit_and_counters(duplicate):
+    cache = LRUCache(maxsize=2)
+    cache.update({'a': 1, 'b': 2, 'c': 3})
+    cache.lookup('c')
+    copied = duplicate(cache)
+    assert isinstance(copied, LRUCache)
+    assert list(copied.items()) == [('b', 2), ('c', 3)]
+    assert copied.info() == cache.info()
+
+
+def test_regime_caches_are_bounded(write_yaml):
+    regime = Regime(file_name=write_yaml(PROPS), interpolator_cache_size=1, interpolated_cache_size=4)
+    for i in range(10):
+        regime.get_scalar_prop_value('density', float(i), interpolation_type='linear')
+    regime.get_scalar_prop_value('density', 9., interpolation_type='linear')
+    regime.get_scalar_prop_value('density', 9., interpolation_type='nearest')
+    info = regime.cache_info()
+    assert info['interpolators']['currsize'] == 1
+    assert info['interpolated']['currsize'] == 4
+    assert info['interpolated']['hits'] == 1
+    # the values stored in the properties are limited as well
+    regime.interpolation('density', list(range(20)), overwrite=False, kind='linear')
+    assert len(regime.props.at['_interpolated', 'density']) == 4
+
+
+def test_query_results_are_kept_out_of_the_properties(write_yaml):
+    regime = Regime(file_name=write_yaml(PROPS), store_interpolated=False)
+    assert regime.get_scalar_prop_value('density', 25., interpolation_type='linear') == pytest.approx(905.)
+    regime.interpolation('density', [10., 20.], kind='linear')
+    assert len(regime.props.at['_interpolated', 'density']) == 0
+    assert regime.interpolation('density', [10.], kind='linear', store=True) == {10.: pytest.approx(902.)}
+    assert list(regime.props.at['_interpolated', 'density']) == [10.]
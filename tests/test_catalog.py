@@ -0,0 +1,22 @@
+###############################################################
+#
+# Tests of the catalog of the yaml-db
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+from data_hub.library.regimes.Catalog import Catalog
+
+
+def test_files_without_a_mapping_are_reported(tmp_path):
+    category = tmp_path / 'earth'
+    category.mkdir()
+    (category / 'list.yaml').write_text('- 1\n- 2\n')
+    (category / 'scalar.yaml').write_text('42\n')
+    (category / 'props.yaml').write_text('name: site\ndensity:\n  type: scalar\n  value: 917.\n')
+
+    entries = Catalog(str(tmp_path)).scan()
+    assert entries['earth/props.yaml']['scalars'] == {'density': 917.}
+    assert entries['earth/props.yaml']['error'] is None
+    assert entries['earth/list.yaml']['error'] is not None
+    assert entries['earth/scalar.yaml']['error'] is not None
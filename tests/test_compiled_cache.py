@@ -0,0 +1,100 @@
+###############################################################
+#
+# Tests of the binary cache of YAML files
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# imports from system libraries if necessary
+import datetime
+import os
+import pickle
+
+# Python imports
+import numpy as np
+import pytest
+import yaml
+
+from data_hub.library.regimes import CompiledCache
+from data_hub.library.regimes.CompiledCache import get_cache_file, load_yaml
+from data_hub.library.regimes.Regime import PrettySafeLoader
+from data_hub.library.regimes.Table import Table
+
+TEXT = '''
+name: Regime
+created: 2026-10-18
+updated: 2026-10-18 12:30:00
+density:
+  type: tabulated
+  value: {0.: 900., 100.: 920., 50.: 910.}
+  dev_pdf: Gauss
+  dev_value: {0.: 1., 50.: 2., 100.: 3.}
+temperature:
+  type: tabulated
+  value: {!!python/tuple [0., 1.]: 250., !!python/tuple [0., 0.]: 240.}
+tags: !!set {ice: null, firn: null}
+'''
+
+
+class _Exploit:
+    def __reduce__(self):
+        return os.mkdir, (self.directory,)
+
+
+@pytest.fixture
+def parse_count(monkeypatch):
+    count = []
+    parse = CompiledCache._parse
+    monkeypatch.setattr(CompiledCache, '_parse', lambda *args: count.append(args) or parse(*args))
+    return count
+
+
+@pytest.fixture
+def yaml_file(tmp_path):
+    file_name = tmp_path / 'props.yaml'
+    file_name.write_text(TEXT)
+    return str(file_name)
+
+
+def test_cached_data_equals_parsed_data(yaml_file, parse_count):
+    parsed = load_yaml(yaml_file, loader=PrettySafeLoader)
+    cached = load_yaml(yaml_file, loader=PrettySafeLoader)
+    assert len(parse_count) == 1
+    assert isinstance(cached['density']['value'], Table)
+    assert cached['density']['dev_value'] is cached['density']['value'].dev
+    np.testing.assert_array_equal(cached['density']['value'].keys, [0., 50., 100.])
+    np.testing.assert_array_equal(cached['temperature']['value'].keys, [[0., 0.], [0., 1.]])
+    assert cached.pop('density')['value'] == parsed.pop('density')['value']  # tables compare dev_value as well
+    assert cached == parsed
+    assert isinstance(parsed['created'], datetime.date) and isinstance(parsed['tags'], set)
+
+
+def test_loaders_have_their_own_cache_files(yaml_file, parse_count):
+    text = 'density:\n  type: scalar\n  value: 917.\n'
+    with open(yaml_file, 'w') as file:
+        file.write(text)
+    for i in range(2):
+        assert load_yaml(yaml_file, loader=yaml.CSafeLoader) == yaml.safe_load(text)
+        assert load_yaml(yaml_file, loader=PrettySafeLoader) == yaml.safe_load(text)
+    assert len(parse_count) == 2
+    assert get_cache_file(yaml_file, loader=yaml.CSafeLoader) != get_cache_file(yaml_file, loader=PrettySafeLoader)
+
+
+@pytest.mark.parametrize('content', ['pickle', 'npz'])
+def test_tampered_cache_is_never_executed(yaml_file, parse_count, tmp_path, content):
+    exploit = _Exploit()
+    exploit.directory = str(tmp_path / 'executed')
+    cache_file = get_cache_file(yaml_file, loader=PrettySafeLoader)
+    os.makedirs(os.path.dirname(cache_file))
+    with open(cache_file, 'wb') as file:
+        if content == 'pickle':
+            pickle.dump(exploit, file)
+        else:  # an object array holds pickled data as well
+            np.savez(file, data=np.array([exploit], dtype=object), arrays=np.empty(0))
+
+    data = load_yaml(yaml_file, loader=PrettySafeLoader)
+    assert not os.path.exists(exploit.directory)
+    assert data['name'] == 'Regime'
+    assert len(parse_count) == 1
+    load_yaml(yaml_file, loader=PrettySafeLoader)  # the cache file was replaced
+    assert len(parse_count) == 1
@@ -0,0 +1,131 @@
+###############################################################
+#
+# Tests of the Converter class
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# imports from system libraries if necessary
+import warnings
+
+# Python imports
+import numpy as np
+import pytest
+import yaml
+
+from data_hub.library.regimes.Regime import Regime
+from data_hub.library.regimes.Table import Table
+from data_hub.library.tool.Converter import Converter
+
+
+def test_npz_dev_values_follow_the_keys(tmp_path):
+    value = {0.1: 1., 0.2: 2., 0.3: 3.}
+    dev_value = {0.3: 0.03, 0.1: 0.01, 0.2: 0.02}  # ordered differently
+    file_name = str(tmp_path / 'table.yaml')
+    Converter.create_yaml(file_name, 'density', value=value, dev_pdf='Gauss', dev_value=dev_value, storage='npz')
+
+    with np.load(tmp_path / 'table.density.npz') as data:
+        np.testing.assert_allclose(data['keys'], [0.1, 0.2, 0.3])
+        np.testing.assert_allclose(data['dev'], [0.01, 0.02, 0.03])
+    regime = Regime(file_name=file_name)
+    regime.resolve_tabulated('density')
+    assert regime.prop_to_dict('density')['dev_value'] == {0.1: 0.01, 0.2: 0.02, 0.3: 0.03}
+
+
+def test_iter_file_reads_all_chunks_without_warnings(tmp_path):
+    file_name = tmp_path / 'data.txt'
+    data = np.arange(20.).reshape(10, 2)
+    np.savetxt(file_name, data, header='depth density', comments='')
+
+    for chunk_rows in (3, 5, 10, 20):  # with and without a shorter last chunk
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            chunks = list(Converter().iter_file(str(file_name), chunk_rows=chunk_rows))
+        assert [len(chunk) for chunk in chunks][:-1] == [chunk_rows] * (len(chunks) - 1)
+        np.testing.assert_array_equal(np.concatenate(chunks), data)
+
+
+FILE1 = """# properties of the regime
+name: Regime
+density:  # measured
+  type: scalar
+  value: 917.0
+porosity:
+  type: scalar
+  value: 0.3
+"""
+FILE2 = """name: Other
+temperature:
+  type: scalar
+  value: 250.0
+porosity:
+  type: scalar
+  value: 0.1
+"""
+
+
+def test_merge_appends_and_keeps_comments(tmp_path):
+    file1, file2 = tmp_path / 'file1.yaml', tmp_path / 'file2.yaml'
+    file1.write_text(FILE1)
+    file2.write_text('temperature:\n  type: scalar\n  value: 250.0\n')
+    Converter.merge(str(file1), str(file2))
+    assert file1.read_text() == FILE1 + '\ntemperature:\n  type: scalar\n  value: 250.0\n'
+
+
+def test_merge_creates_missing_file(tmp_path):
+    file1, file2 = tmp_path / 'file1.yaml', tmp_path / 'file2.yaml'
+    file2.write_text(FILE1)
+    Converter.merge(str(file1), str(file2))
+    assert yaml.safe_load(file1.read_text()) == yaml.safe_load(FILE1)
+
+
+def test_merge_duplicates_raise_or_replace(tmp_path):
+    file1, file2 = tmp_path / 'file1.yaml', tmp_path / 'file2.yaml'
+    file1.write_text(FILE1)
+    file2.write_text(FILE2)
+    with pytest.raises(ValueError, match='porosity'):
+        Converter.merge(str(file1), str(file2))
+    assert file1.read_text() == FILE1
+
+    Converter.merge(str(file1), str(file2), overwrite=True)
+    text = file1.read_text()
+    assert text.startswith('# properties of the regime\nname: Regime\ndensity:  # measured\n')
+    assert yaml.safe_load(text) == {'name': 'Regime', 'density': {'type': 'scalar', 'value': 917.},
+                                    'temperature': {'type': 'scalar', 'value': 250.},
+                                    'porosity': {'type': 'scalar', 'value': 0.1}}
+
+
+def test_merge_relocates_npz_files(tmp_path):
+    (tmp_path / 'tables').mkdir()
+    file1, file2 = str(tmp_path / 'file1.yaml'), str(tmp_path / 'tables' / 'file2.yaml')
+    Converter.create_yaml(file2, 'density', value={0.: 900., 100.: 920.}, variable='depth', storage='npz')
+    with open(file1, 'w') as file:
+        file.write(FILE1.replace('density', 'density_ice'))
+    Converter.merge(file1, file2)
+    regime = Regime(file_name=file1)
+    assert regime.props['density']['value'] == 'tables/file2.density.npz'
+    assert regime.get_scalar_prop_value('density', 50., interpolation_type='linear') == 910.
+
+
+def test_create_yaml_from_txt_file_in_chunks(tmp_path):
+    txt_file = tmp_path / 'data.txt'
+    rng = np.random.default_rng(0)
+    data = np.column_stack([rng.permutation(10).astype(float), rng.random(10), rng.random(10), rng.random(10)])
+    np.savetxt(txt_file, data, header='x y value dev', comments='')
+
+    file_name = str(tmp_path / 'table.yaml')
+    Converter.create_yaml(file_name, 'density', txt_file=str(txt_file), value_column=2, dev_column=3, chunk_rows=3,
+                          dev_pdf='Gauss', storage='npz')
+    regime = Regime(file_name=file_name)
+    regime.resolve_tabulated('density')
+    table = regime.props['density']['value']
+    order = np.argsort(data[:, 0])
+    np.testing.assert_array_equal(table.keys, data[order, 0])
+    np.testing.assert_array_equal(table.values, data[order, 2])
+    np.testing.assert_array_equal(table.dev, data[order, 3])
+
+    # coordinate tuples as keys, written into the yaml file
+    Converter.create_yaml(file_name, 'temperature', txt_file=str(txt_file), key_columns=(0, 1), value_column=2,
+                          chunk_rows=4)
+    regime = Regime(file_name=file_name)
+    assert regime.props['temperature']['value'] == Table(data[:, :2], data[:, 2])
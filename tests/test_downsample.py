@@ -0,0 +1,65 @@
+###############################################################
+#
+# Tests of the downsampling of large tabulated plots
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# Python imports
+import numpy as np
+import pytest
+
+from data_hub.library.regimes.Downsample import downsample
+from data_hub.library.regimes.Regime import Regime
+
+N = 10000
+
+
+@pytest.fixture
+def series():
+    x = np.linspace(0., 100., N)
+    y = np.sin(x / 10.)
+    y[4321] = 5.  # a peak which has to be kept
+    y[7654] = -5.
+    return x, y
+
+
+@pytest.mark.parametrize('method', ['lttb', 'minmax'])
+def test_downsampling_keeps_the_shape(series, method):
+    x, y = series
+    indices = downsample(x, y, 200, method)
+    assert len(indices) <= 200
+    assert np.all(np.diff(indices) > 0)
+    assert {4321, 7654} <= set(indices.tolist())
+    if method == 'lttb':
+        assert len(indices) == 200 and indices[0] == 0 and indices[-1] == N - 1
+    np.testing.assert_array_equal(downsample(x, y, 0, method), np.arange(N))
+    np.testing.assert_array_equal(downsample(x[:100], y[:100], 200, method), np.arange(100))
+
+
+def test_unknown_method(series):
+    with pytest.raises(ValueError, match='Unknown downsampling method'):
+        downsample(*series, 200, 'random')
+
+
+class WebGLRegime(Regime):
+    PLOT_MAX_POINTS = 500
+    WEBGL_THRESHOLD = 100
+
+
+def test_plot_data_of_large_tables(series, write_yaml):
+    x, y = series
+    props = {'density': {'type': 'tabulated', 'value': dict(zip(x.tolist(), y.tolist())),
+                         'dev_value': dict.fromkeys(x.tolist(), 0.1), 'variable': 'depth'}}
+    regime = WebGLRegime(file_name=write_yaml(props))
+    plot_x, plot_y, dev = regime.get_plot_data('density')
+    assert len(plot_x) == len(plot_y) == len(dev) == 500
+    # the full resolution of a zoomed range
+    plot_x, plot_y, dev = regime.get_plot_data('density', 10., 20., max_points=0)
+    np.testing.assert_array_equal(plot_x, x[(x >= 10.) & (x <= 20.)])
+    np.testing.assert_array_equal(plot_y, y[(x >= 10.) & (x <= 20.)])
+
+    fig = regime.plot_property('density', use_plotly=True, gui=True)
+    assert fig.data[0].type == 'scattergl'
+    assert len(fig.data[0].x) == 500
+    assert len(regime.plot_property('density', use_plotly=True, gui=True, max_points=50).data[0].x) == 50
@@ -0,0 +1,46 @@
+###############################################################
+#
+# Tests of the expression engine
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# Python imports
+import numpy as np
+import pytest
+
+from data_hub.library.regimes.Expression import Expression, sort_dependencies
+
+
+@pytest.mark.parametrize('source', [
+    'x.__class__',  # attribute access
+    '().__class__.__bases__[0].__subclasses__()',
+    "__import__('os').system('true')",
+    'lambda: 0',
+    '(lambda x: x)(1)',
+    'x[0]',
+    '[y for y in x]',
+    'open("props.yaml")',
+    'exp(x=1)',
+])
+def test_expressions_outside_of_the_whitelist_are_rejected(source):
+    with pytest.raises(ValueError, match='Invalid expression'):
+        Expression(source)
+
+
+def test_evaluate_scalars_and_arrays():
+    expression = Expression('1.e3*(2636.77 + 1.65924*x - 0.0034135*pow(x,2)) + 0*y')
+    assert expression.variables == ['x', 'y']
+    assert expression.evaluate(x=0., y=1.) == pytest.approx(2636770.)
+    np.testing.assert_allclose(expression.evaluate(x=np.array([0., 10.]), y=1.),
+                               1.e3 * (2636.77 + 1.65924 * np.array([0., 10.]) - 0.0034135 * np.array([0., 100.])))
+    assert Expression('2').evaluate(x=[1., 2., 3.]).shape == (3,)
+    with pytest.raises(ValueError, match='needs a value for: y'):
+        expression.evaluate(x=1.)
+
+
+def test_sort_dependencies():
+    order = sort_dependencies({'c': ['b'], 'b': ['a'], 'a': []})
+    assert order == ['a', 'b', 'c']
+    with pytest.raises(ValueError, match='a -> b -> a'):
+        sort_dependencies({'a': ['b'], 'b': ['a']})
@@ -0,0 +1,59 @@
+###############################################################
+#
+# Tests of the interpolation of tables with coordinate tuples as keys
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# Python imports
+import numpy as np
+import pytest
+
+from data_hub.library.regimes.Interpolator import NDInterpolator
+from data_hub.library.regimes.Regime import Regime
+
+GRID = [(x, y) for x in (0., 1., 2.) for y in (0., 10.)]
+SCATTERED = [(0., 0.), (1., 0.), (0., 1.), (1., 1.), (0.3, 0.6)]
+
+
+def _plane(points):
+    return [x + 0.1 * y for x, y in points]
+
+
+@pytest.mark.parametrize('points, kind, used', [
+    (GRID, 'grid', 'grid'),
+    (GRID, 'cubic', 'grid'),
+    (GRID, 3, 'grid'),
+    (SCATTERED, 'quadratic', 'linear'),
+    (SCATTERED, 'linear', 'linear'),
+])
+def test_linear_kinds(points, kind, used):
+    interpolator = NDInterpolator(points, _plane(points), kind=kind)
+    assert interpolator.kind == used
+    assert interpolator((0.5, 0.5)) == pytest.approx(0.55)
+    np.testing.assert_allclose(interpolator([(0.5, 0.5), (0.25, 0.75)]), [0.55, 0.325])
+    assert np.isnan(interpolator((5., 5.)))
+
+
+def test_nearest():
+    interpolator = NDInterpolator(SCATTERED, _plane(SCATTERED), kind='nearest')
+    assert interpolator((0.9, 0.1)) == pytest.approx(1.)
+    assert interpolator((5., 5.)) == pytest.approx(1.1)
+
+
+def test_unknown_kind_and_invalid_points():
+    with pytest.raises(ValueError, match='Unknown kind'):
+        NDInterpolator(GRID, _plane(GRID), kind='spline')
+    with pytest.raises(ValueError, match='regular grid'):
+        NDInterpolator(SCATTERED, _plane(SCATTERED), kind='grid')
+    with pytest.raises(ValueError, match='dimension 2'):
+        NDInterpolator(GRID, _plane(GRID))((1., 2., 3.))
+
+
+def test_regime_with_coordinates_as_keys(write_yaml):
+    props = {'temperature': {'type': 'tabulated', 'value': dict(zip(GRID, _plane(GRID))), 'variable': 'position'}}
+    regime = Regime(file_name=write_yaml(props))
+    # the default interpolation_type 'cubic' is interpolated linearly on the grid
+    assert regime.get_scalar_prop_value('temperature', (0.5, 5.)) == pytest.approx(1.)
+    np.testing.assert_allclose(regime.get_prop_values('temperature', np.array([(0.5, 5.), (2., 10.)]),
+                                                      as_dataframe=False)[:, 0], [1., 3.])
@@ -0,0 +1,84 @@
+###############################################################
+#
+# Tests of the lookup of properties through a regime and its default regimes
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# imports from system libraries if necessary
+import os
+
+# Python imports
+import numpy as np
+import pytest
+
+from data_hub.library.regimes.LayeredRegime import LayeredRegime, clear_default_regimes, get_default_regime
+from data_hub.library.regimes.Regime import Regime
+
+DEFAULTS = {
+    'density_ice': {'type': 'scalar', 'value': 917., 'unit_str': 'kg/m^3'},
+    'bulk_modulus_drained_ice': {'type': 'expression', 'value': '1e7 * density_ice', 'unit_str': 'Pa'},
+    'porosity': {'type': 'tabulated', 'value': {0.: 0.4, 100.: 0.2}, 'variable': 'depth'},
+}
+
+
+class OtherRegime(Regime):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_default_regimes()
+    yield
+    clear_default_regimes()
+
+
+def test_default_expressions_use_the_properties_of_the_regime(write_yaml):
+    defaults = write_yaml(DEFAULTS, name='defaults.yaml')
+    regime = Regime(file_name=write_yaml({'density_ice': {'type': 'expression', 'value': '900. + 100. * porosity'}}))
+    layered = LayeredRegime(regime, [defaults])
+    assert layered.owner('bulk_modulus_drained_ice') is get_default_regime(defaults)
+    # density_ice of the regime, which in turn uses porosity of the defaults
+    assert layered.get_scalar_prop_value('density_ice', 50., interpolation_type='linear') == pytest.approx(930.)
+    assert layered.get_scalar_prop_value('bulk_modulus_drained_ice', 50., interpolation_type='linear') == \
+        pytest.approx(9.3e9)
+    values = layered.get_prop_values(['bulk_modulus_drained_ice', 'density_ice'], np.array([0., 100.]),
+                                     interpolation_type='linear', as_dataframe=False)
+    np.testing.assert_allclose(values, [[9.4e9, 940.], [9.2e9, 920.]])
+    # a value given as variable is used by all layers
+    assert layered.get_scalar_prop_value('bulk_modulus_drained_ice', density_ice=1000.) == pytest.approx(1e10)
+    assert LayeredRegime(None, [defaults]).get_scalar_prop_value('bulk_modulus_drained_ice') == \
+        pytest.approx(9.17e9)
+
+
+def test_circular_dependency_through_layers(write_yaml):
+    defaults = write_yaml(DEFAULTS, name='defaults.yaml')
+    circular = {'density_ice': {'type': 'expression', 'value': '1e-7 * bulk_modulus_drained_ice'}}
+    regime = Regime(file_name=write_yaml(circular))
+    with pytest.raises(ValueError, match='Circular dependency'):
+        LayeredRegime(regime, [defaults]).get_scalar_prop_value('bulk_modulus_drained_ice')
+
+
+def test_default_files_are_loaded_when_needed(write_yaml):
+    first = write_yaml({'density_ice': DEFAULTS['density_ice']}, name='first.yaml')
+    second = write_yaml(DEFAULTS, name='second.yaml')
+    layered = LayeredRegime(Regime(file_name=write_yaml({'name': 'Regime'})), [first, second])
+    assert layered.owner('density_ice') is get_default_regime(first)
+    assert len(layered.layers) == 2
+    assert 'porosity' in layered and len(layered.layers) == 3
+    assert 'thickness_ice' not in layered
+    with pytest.raises(ValueError, match='thickness_ice was not found'):
+        layered.prop_to_dict('thickness_ice')
+
+
+def test_default_regimes_are_cached_per_file_and_class(write_yaml):
+    defaults = write_yaml(DEFAULTS, name='defaults.yaml')
+    regime = get_default_regime(defaults)
+    assert regime.frozen
+    assert get_default_regime(os.path.relpath(defaults)) is regime
+    other = get_default_regime(defaults, regime_class=OtherRegime)
+    assert isinstance(other, OtherRegime)
+    assert get_default_regime(defaults, regime_class=OtherRegime) is other
+    assert type(get_default_regime(defaults)) is Regime
+    write_yaml({'density_ice': {'type': 'scalar', 'value': 920.}}, name='defaults.yaml')  # the file is reloaded
+    assert get_default_regime(defaults).get_scalar_prop_value('density_ice') == 920.
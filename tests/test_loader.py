@@ -0,0 +1,67 @@
+###############################################################
+#
+# Tests of the bulk loading of Regime files
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# Python imports
+import numpy as np
+
+from data_hub.library.regimes.Loader import load_regimes
+from data_hub.library.regimes.Profile import HEADER_LINES, PROFILE_COUNT_LINE
+from data_hub.library.regimes.Regime import Regime
+
+
+class MappedRegime(Regime):
+    PROFILE_MEMMAP = True
+
+
+def _write_db(tmp_path, write_yaml):
+    header = [f'# line {i}' for i in range(HEADER_LINES)]
+    header[PROFILE_COUNT_LINE] = '# number of profiles: 2'
+    profile_file = tmp_path / 'profiles.txt'
+    np.savetxt(profile_file, np.arange(24.).reshape(6, 4), header='\n'.join(header), comments='')
+    for i in range(4):
+        write_yaml({'name': f'Regime {i}',
+                    'density': {'type': 'scalar', 'value': 900. + i, 'unit_str': 'kg/m^3'},
+                    'porosity': {'type': 'tabulated', 'value': {0.: 0.3, 50.: 0.2 + i / 100.}, 'variable': 'depth'}},
+                   name=f'regime_{i}.yaml')
+    write_yaml({'name': 'Profiles', 'properties_distribution': {'type': 'file', 'value': str(profile_file)}},
+               name='profiles.yaml')
+    write_yaml(['not', 'a', 'mapping'], name='list.yaml')
+    return str(tmp_path)
+
+
+def test_regimes_created_by_processes(tmp_path, write_yaml):
+    folder = _write_db(tmp_path, write_yaml)
+    serial = load_regimes(folder, workers=1)
+    regimes = load_regimes(folder, workers=2)
+    assert list(regimes) == list(serial)
+    assert len(regimes) == 5
+    assert list(regimes.errors) == [str(tmp_path / 'list.yaml')]
+    for file_name, regime in regimes.items():
+        assert regime.name == serial[file_name].name
+        assert regime.units == serial[file_name].units
+        if regime.name == 'Profiles':
+            np.testing.assert_array_equal(regime.profile_data, serial[file_name].profile_data)
+        else:
+            assert regime.get_scalar_prop_value('porosity', 25., interpolation_type='linear') == \
+                serial[file_name].get_scalar_prop_value('porosity', 25., interpolation_type='linear')
+
+
+def test_memory_mapped_profiles_are_mapped_again(tmp_path, write_yaml):
+    regimes = load_regimes(_write_db(tmp_path, write_yaml), workers=2, regime_class=MappedRegime)
+    regime = regimes[str(tmp_path / 'profiles.yaml')]
+    assert isinstance(regime, MappedRegime)
+    assert isinstance(regime.profile_data, np.memmap)
+    np.testing.assert_array_equal(regime.profile_data[1, :4, 0], [4., 5., 6., 7.])
+
+
+def test_regime_class_which_cannot_be_pickled(tmp_path, write_yaml):
+    class LocalRegime(Regime):  # not importable by the processes
+        pass
+
+    regimes = load_regimes(_write_db(tmp_path, write_yaml), workers=2, regime_class=LocalRegime)
+    assert len(regimes) == 5
+    assert all(isinstance(regime, LocalRegime) for regime in regimes.values())
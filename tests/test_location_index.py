@@ -0,0 +1,27 @@
+###############################################################
+#
+# Tests of the spatial index over locations
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# Python imports
+import numpy as np
+
+from data_hub.library.map.LocationIndex import LocationIndex
+
+
+def test_nearest_with_more_neighbours_than_locations():
+    index = LocationIndex.from_coordinates([0., 0.], [0., 90.])
+    distances, indices = index.nearest(0., 0., k=3)
+    np.testing.assert_allclose(distances[:2], [0., np.pi / 2. * LocationIndex.EARTH_RADIUS])
+    assert np.isinf(distances[2])
+    assert indices[2] == len(index)
+
+
+def test_nearest_within_max_distance():
+    index = LocationIndex.from_coordinates([0., 0.], [0., 90.])
+    distances, indices = index.nearest(0., 1., k=2, max_distance=1000.)
+    assert indices[0] == 0
+    assert np.isinf(distances[1])
+    assert indices[1] == len(index)
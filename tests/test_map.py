@@ -0,0 +1,81 @@
+###############################################################
+#
+# Tests of the Map class
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# imports from system libraries if necessary
+import concurrent.futures
+import os
+import re
+
+# Python imports
+from cartopy.mpl.geoaxes import GeoAxes
+import numpy as np
+import pytest
+
+from data_hub.library.map.Map import Map
+from data_hub.library.regimes.Cache import LRUCache
+from data_hub.library.regimes.Regime import Regime
+
+
+@pytest.fixture
+def offline_cartopy(monkeypatch):
+    monkeypatch.setattr(GeoAxes, 'coastlines', lambda self, *args, **kwargs: None)  # no download of Natural Earth
+    monkeypatch.setattr(Map, 'BASE_MAP_CACHE', LRUCache(maxsize=Map.BASE_MAP_CACHE_SIZE))
+    monkeypatch.setattr(Map, 'OVERLAY_FIGURES', LRUCache(maxsize=Map.OVERLAY_FIGURES_SIZE))
+
+
+def _overlay(latitudes):
+    location_map = Map(projection='AzimuthalEquidistant')
+    location_map.location_latitude_list = latitudes
+    location_map.location_longitude_list = [0.] * len(latitudes)
+    return location_map._render_locations()
+
+
+def test_base_maps_and_overlays_are_bounded(offline_cartopy, monkeypatch, tmp_path):
+    monkeypatch.setattr(Map, 'BASE_MAP_CACHE', LRUCache(maxsize=2))
+    monkeypatch.setattr(Map, 'OVERLAY_FIGURES', LRUCache(maxsize=1))
+    for i in range(3):  # three projection centers
+        location_map = Map(projection='AzimuthalEquidistant')
+        location_map.latitude_center = 10. * i
+        location_map.location_latitude_list = [10. * i]
+        location_map.location_longitude_list = [0.]
+        location_map.show_map(filename_png=str(tmp_path / 'map.png'))
+    assert len(Map.BASE_MAP_CACHE) == 2
+    assert len(Map.OVERLAY_FIGURES) == 1
+    assert (tmp_path / 'map.png').exists()
+
+
+def test_overlays_of_concurrent_maps(offline_cartopy):
+    location_sets = [[-60., -30.], [0., 30., 60.]]
+    expected = [_overlay(latitudes) for latitudes in location_sets]
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        overlays = list(executor.map(_overlay, location_sets * 10))
+    for i, overlay in enumerate(overlays):
+        np.testing.assert_array_equal(overlay, expected[i % 2])
+
+
+def test_base_map_cache_file(offline_cartopy, tmp_path):
+    location_map = Map(projection='AzimuthalEquidistant', base_map_cache_dir=str(tmp_path))
+    base_map = location_map.get_base_map()
+    assert [os.path.splitext(name)[1] for name in os.listdir(tmp_path)] == ['.png']  # no temporary file is left
+    Map.BASE_MAP_CACHE.clear()
+    np.testing.assert_array_equal(location_map.get_base_map(), base_map)  # read from the file
+
+
+@pytest.mark.parametrize('render_mode', Map.RENDER_MODES)
+def test_render_modes_style_the_locations_alike(render_mode, write_yaml, tmp_path):
+    locations = [Regime(file_name=write_yaml({'name': f'Site {i}', 'location': {'type': 'location',
+                                                                                'value': {'N': 10. * i, 'E': 5. * i}}},
+                                             name=f'site_{i}.yaml')) for i in range(2)]
+    location_map = Map(locations, render_mode=render_mode)
+    location_map.load_map()
+    filename_html = tmp_path / 'map.html'
+    location_map.show_map(filename_html=str(filename_html))
+    html = filename_html.read_text()
+    # options of the circle markers, in the JSON of Folium or in the JavaScript of the cluster callback
+    assert re.search(r'"?radius"?: 7\b', html)
+    assert re.search(r'"?fillOpacity"?: 0.4\b', html)
+    assert re.search(r'"?fillColor"?: [\'"]red[\'"]', html)
@@ -0,0 +1,85 @@
+###############################################################
+#
+# Tests of the export to NEXD with a stand-in for porodisp
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# imports from system libraries if necessary
+import sys
+import threading
+
+# Python imports
+import pytest
+
+from data_hub.export.nexd import matprop_batch, matprop_layers
+from data_hub.library.regimes.Regime import Regime
+from . import DEFAULT_PROPS
+
+# porodisp is not a requirement of the data hub, the materials of the stand-in keep their parameters
+MATERIAL = '''
+class _Material:
+    def __init__(self, *args, **kwargs):
+        self.args, self.kwargs = args, kwargs
+
+
+class Elastic(_Material):
+    pass
+
+
+class Viscoelastic(_Material):
+    pass
+
+
+class PoroelasticSaturated(_Material):
+    pass
+
+
+class PoroelasticUnsaturated(_Material):
+    pass
+'''
+TRANSLATION = {'rho': 'density_ice', 'mu': 'shear_modulus_ice', 'k': 'bulk_modulus_drained_ice'}
+PROPS = {
+    'density_ice': {'type': 'tabulated', 'value': {0.: 900., 100.: 920.}, 'variable': 'depth'},
+    'shear_modulus_ice': {'type': 'scalar', 'value': 3.5e9, 'unit_str': 'Pa'},
+    'bulk_modulus_drained_ice': {'type': 'expression', 'value': '1e7 * density_ice', 'unit_str': 'Pa'},
+}
+
+
+@pytest.fixture
+def porodisp(tmp_path, monkeypatch):
+    package = tmp_path / 'stub' / 'porodisp'
+    package.mkdir(parents=True)
+    (package / '__init__.py').write_text('')
+    (package / 'material.py').write_text(MATERIAL)
+    monkeypatch.syspath_prepend(str(package.parent))  # also found by the processes of matprop_batch
+    for name in ('porodisp', 'porodisp.material'):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+
+
+def test_matprop_batch_in_processes(porodisp, write_yaml):
+    file_name = write_yaml(PROPS)
+    unpicklable = Regime(file_name=file_name)
+    unpicklable.lock = threading.Lock()
+    regimes = {
+        'regime': Regime(file_name=file_name),
+        'file': file_name,
+        'default': Regime(file_name=DEFAULT_PROPS),  # has units, but no density_ice
+        'unpicklable': unpicklable,
+    }
+    materials = matprop_batch(regimes, workers=2, poroelastic=False, translation=TRANSLATION)
+    assert sorted(materials) == ['file', 'regime']
+    assert sorted(materials.errors) == ['default', 'unpicklable']
+    assert 'density_ice' in materials.errors['default']
+    assert type(materials['regime']).__name__ == 'Viscoelastic'
+    assert materials['regime'].kwargs['mu'] == 3.5e9
+
+
+def test_matprop_layers(porodisp, write_yaml):
+    regime = Regime(file_name=write_yaml(PROPS))
+    materials = matprop_layers(regime, grid=[0., 50., 100.], poroelastic=False, translation=TRANSLATION,
+                               q_p=[10., 20., 30.])
+    assert [material.args[0] for material in materials] == pytest.approx([900., 910., 920.])
+    assert [material.kwargs['k'] for material in materials] == pytest.approx([9e9, 9.1e9, 9.2e9])
+    assert [material.kwargs['q_p'] for material in materials] == [10., 20., 30.]
+    assert all(type(material).__name__ == 'Viscoelastic' for material in materials)
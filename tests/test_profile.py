@@ -0,0 +1,66 @@
+###############################################################
+#
+# Tests of the streaming loader for 2D profile files
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# imports from system libraries if necessary
+import os
+
+# Python imports
+import numpy as np
+import pytest
+
+from data_hub.library.regimes.Profile import HEADER_LINES, PROFILE_COUNT_LINE, load_profiles, read_profile_header
+
+
+def _write_profiles(file_name, data, nprofiles):
+    header = [f'# line {i}' for i in range(HEADER_LINES)]
+    header[PROFILE_COUNT_LINE] = f'# number of profiles: {nprofiles}'
+    np.savetxt(file_name, data, header='\n'.join(header), comments='')
+    return str(file_name)
+
+
+def _expected(data, nprofiles):
+    # radius and angle appended, profile i consists of the rows i, i + nprofiles, ...
+    radius = np.hypot(data[:, 0] * 1000, data[:, 1] * 1000)
+    angle = np.arctan2(data[:, 0] * 1000, data[:, 1] * 1000)
+    full = np.column_stack([data, radius, angle])
+    return np.stack([full[i::nprofiles].T for i in range(nprofiles)])
+
+
+@pytest.fixture
+def data():
+    return np.random.default_rng(1).uniform(-1., 1., (12, 4))
+
+
+def test_profiles_are_read_in_chunks(tmp_path, data):
+    file_name = _write_profiles(tmp_path / 'profiles.txt', data, 3)
+    assert read_profile_header(file_name)[1] == 3
+    profiles = load_profiles(file_name, chunk_rows=5)
+    assert profiles.shape == (3, 6, 4)
+    np.testing.assert_allclose(profiles, _expected(data, 3))
+
+
+def test_memory_mapped_profiles(tmp_path, data):
+    file_name = _write_profiles(tmp_path / 'profiles.txt', data, 3)
+    cache_dir = str(tmp_path / 'cache')
+    profiles = load_profiles(file_name, memmap=True, chunk_rows=5, cache_dir=cache_dir)
+    assert isinstance(profiles.base, np.memmap) and not profiles.flags.writeable
+    np.testing.assert_allclose(profiles, _expected(data, 3))
+    binary_file = os.path.join(cache_dir, 'profiles.txt.npy')
+    converted = os.stat(binary_file).st_mtime_ns
+    load_profiles(file_name, memmap=True, cache_dir=cache_dir)  # the binary file is reused
+    assert os.stat(binary_file).st_mtime_ns == converted
+
+    _write_profiles(file_name, data[:6], 2)  # the binary file is rebuilt for the changed file
+    np.testing.assert_allclose(load_profiles(file_name, memmap=True, cache_dir=cache_dir), _expected(data[:6], 2))
+
+
+def test_invalid_files(tmp_path, data):
+    with pytest.raises(ValueError, match='cannot be separated into 5 profiles'):
+        load_profiles(_write_profiles(tmp_path / 'profiles.txt', data, 5))
+    (tmp_path / 'short.txt').write_text('# header\n')
+    with pytest.raises(ValueError, match='no valid header'):
+        load_profiles(str(tmp_path / 'short.txt'))
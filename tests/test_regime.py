@@ -0,0 +1,132 @@
+###############################################################
+#
+# Tests of the Regime class
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# imports from system libraries if necessary
+import concurrent.futures
+
+# Python imports
+import numpy as np
+import pytest
+
+from data_hub.library.regimes.Regime import Regime
+from data_hub.library.tool.Converter import Converter
+
+PROPS = {
+    'density': {'type': 'tabulated', 'value': {0.: 900., 50.: 910., 100.: 930.}, 'unit_str': 'kg/m^3',
+                'variable': 'depth'},
+    'porosity': {'type': 'tabulated', 'value': {0.: 0.3, 50.: 0.2, 100.: 0.1}, 'variable': 'depth'},
+}
+
+
+def test_figure_cache_hit_after_unrelated_query(write_yaml):
+    regime = Regime(file_name=write_yaml(PROPS), store_interpolated=True)
+    for i in range(3):
+        regime.plot_property('density', 0., 100., use_plotly=True, gui=True)
+        regime.get_scalar_prop_value('porosity', 10. * (i + 1), interpolation_type='linear')
+    info = regime.cache_info()['figures']
+    assert info['hits'] == 2
+    assert info['misses'] == 1
+
+
+def test_figure_cache_miss_after_query_of_plotted_property(write_yaml):
+    regime = Regime(file_name=write_yaml(PROPS), store_interpolated=True)
+    regime.plot_property('density', 0., 100., use_plotly=True, gui=True)
+    regime.get_scalar_prop_value('density', 25., interpolation_type='linear')
+    regime.plot_property('density', 0., 100., use_plotly=True, gui=True)
+    regime.get_scalar_prop_value('density', 25., interpolation_type='linear')  # the same value, same figure
+    regime.plot_property('density', 0., 100., use_plotly=True, gui=True)
+    assert regime.cache_info()['figures']['misses'] == 2
+
+
+def test_plot_property_returns_copies(write_yaml):
+    regime = Regime(file_name=write_yaml(PROPS))
+    for use_plotly in (False, True):
+        fig = regime.plot_property('density', 0., 100., use_plotly=use_plotly, gui=True)
+        again = regime.plot_property('density', 0., 100., use_plotly=use_plotly, gui=True)
+        assert fig is not again
+        if use_plotly:
+            fig.update_layout(title='changed')
+            assert again.layout.title.text != 'changed'
+        else:
+            fig.axes[0].set_title('changed')
+            assert again.axes[0].get_title() == 'density'
+            assert fig.canvas.manager is None  # not kept open by pyplot
+    assert regime.cache_info()['figures']['hits'] == 2
+
+
+def test_frozen_regime_is_read_only(tmp_path, write_yaml):
+    npz_file = str(tmp_path / 'table.yaml')
+    Converter.create_yaml(npz_file, 'porosity', value={0.: 0.3, 50.: 0.2, 100.: 0.1}, variable='depth',
+                          storage='npz')
+    regime = Regime(file_name=npz_file).freeze()
+    assert regime.frozen and regime.freeze() is regime
+    table = regime.props['porosity']['value']  # loaded from the .npz file when freezing
+    assert not table.keys.flags.writeable and not table.values.flags.writeable
+    with pytest.raises(ValueError):
+        table.values[0] = 1.
+
+    for action in (lambda: regime.set_props({}), lambda: regime.load_props(npz_file), regime.load_profile_data,
+                   lambda: regime.load_site(npz_file)):
+        with pytest.raises(RuntimeError, match='frozen'):
+            action()
+    # queries still work, the interpolated values are returned but not stored
+    assert regime.interpolation('porosity', [25.], kind='linear') == {25.: pytest.approx(0.25)}
+    assert not regime.props['porosity']['_interpolated']
+    with concurrent.futures.ThreadPoolExecutor(4) as executor:
+        values = list(executor.map(lambda x: regime.get_scalar_prop_value('porosity', x, interpolation_type='linear'),
+                                   np.linspace(0., 100., 20)))
+    np.testing.assert_allclose(values, np.interp(np.linspace(0., 100., 20), [0., 50., 100.], [0.3, 0.2, 0.1]))
+
+
+def test_prop_values_of_many_points(write_yaml):
+    props = dict(PROPS, gravity={'type': 'scalar', 'value': 9.81, 'unit_str': 'm/s^2'},
+                 weight={'type': 'expression', 'value': 'density * gravity * thickness', 'unit_str': 'Pa'})
+    regime = Regime(file_name=write_yaml(props), store_interpolated=False)
+    depth = np.linspace(0., 100., 7)
+    names = ['weight', 'gravity', 'density', 'porosity']
+    values = regime.get_prop_values(names, depth, interpolation_type='linear', thickness=2.)
+    assert list(values.columns) == names
+    for i, point in enumerate(depth):
+        assert list(values.iloc[i]) == pytest.approx(
+            [regime.get_scalar_prop_value(name, point, interpolation_type='linear', thickness=2.) for name in names])
+    # variables of the expressions as arrays, results as array in other units
+    array = regime.get_prop_values(['weight', 'density'], depth, interpolation_type='linear', as_dataframe=False,
+                                   units={'density': 'g/cm^3'}, thickness=np.arange(7.))
+    assert array.shape == (7, 2)
+    np.testing.assert_allclose(array[:, 0], values['density'] * 9.81 * np.arange(7.))
+    np.testing.assert_allclose(array[:, 1], values['density'] / 1000.)
+    assert all(len(regime.props.at['_interpolated', name]) == 0 for name in ('density', 'porosity'))
+
+
+def test_expressions_refer_to_properties(write_yaml, monkeypatch):
+    props = dict(PROPS,
+                 density_ice={'type': 'expression', 'value': 'density * (1 - porosity)'},
+                 bulk_modulus_drained_ice={'type': 'expression', 'value': '1e7 * density_ice'},
+                 weight={'type': 'expression', 'value': 'density_ice * 9.81'})
+    regime = Regime(file_name=write_yaml(props))
+    assert regime.dependencies['density_ice'] == ['density', 'porosity']
+    order = regime.evaluation_order
+    assert order.index('density_ice') < order.index('bulk_modulus_drained_ice')
+    assert regime.get_scalar_prop_value('bulk_modulus_drained_ice', 50., interpolation_type='linear') == \
+        pytest.approx(1e7 * 910. * 0.8)
+    assert regime.get_scalar_prop_value('bulk_modulus_drained_ice', 50., density_ice=900.) == pytest.approx(9e9)
+
+    # shared intermediate properties are evaluated once per query
+    evaluated = []
+    get_interpolator = regime.get_interpolator
+    monkeypatch.setattr(regime, 'get_interpolator', lambda name_props, kind: evaluated.append(name_props) or
+                        get_interpolator(name_props=name_props, kind=kind))
+    values = regime.get_prop_values(['bulk_modulus_drained_ice', 'weight', 'density'], np.array([0., 100.]),
+                                    interpolation_type='linear', as_dataframe=False)
+    np.testing.assert_allclose(values[:, 1], 9.81 * np.array([900. * 0.7, 930. * 0.9]))
+    assert sorted(evaluated) == ['density', 'porosity']
+
+
+def test_circular_references_of_properties(write_yaml):
+    props = {'a': {'type': 'expression', 'value': '2 * b'}, 'b': {'type': 'expression', 'value': 'a + x'}}
+    with pytest.raises(ValueError, match='Circular'):
+        Regime(file_name=write_yaml(props))
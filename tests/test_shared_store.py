@@ -0,0 +1,48 @@
+###############################################################
+#
+# Tests of the SharedStore class
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# imports from system libraries if necessary
+import concurrent.futures
+import mmap
+import multiprocessing
+
+from data_hub.library.regimes.Regime import Regime
+from data_hub.library.regimes.SharedStore import SharedStore
+from . import DEFAULT_PROPS
+
+
+def _mapped(array):
+    # follows the bases of an array to the memory it is created on
+    base = array
+    while isinstance(base, type(array)):
+        base = base.base
+    return isinstance(base, memoryview) and isinstance(base.obj, mmap.mmap)
+
+
+def _attach(file_name):
+    store = SharedStore(file_name)
+    regime = store[DEFAULT_PROPS]
+    table = regime.props['density_firn']['value']
+    return (regime.get_scalar_prop_value('density_firn', 42., interpolation_type='linear'),
+            regime.get_scalar_prop_value('latent_heat_sublimation_ice', 250.),
+            [array.flags.writeable for array in (table.keys, table.values)],
+            [_mapped(array) for array in (table.keys, table.values)])
+
+
+def test_store_of_yaml_db_attached_from_another_process(tmp_path):
+    regime = Regime(file_name=DEFAULT_PROPS)
+    expected = (regime.get_scalar_prop_value('density_firn', 42., interpolation_type='linear'),
+                regime.get_scalar_prop_value('latent_heat_sublimation_ice', 250.))
+    file_name = str(tmp_path / 'regimes.store')
+    # the shipped tables are small, they are only shared with min_shared_bytes=0
+    SharedStore.create({DEFAULT_PROPS: regime}, file_name, min_shared_bytes=0)
+
+    with concurrent.futures.ProcessPoolExecutor(1, mp_context=multiprocessing.get_context('spawn')) as executor:
+        density, latent_heat, writeable, mapped = executor.submit(_attach, file_name).result()
+    assert (density, latent_heat) == expected
+    assert writeable == [False, False]
+    assert mapped == [True, True]
@@ -0,0 +1,70 @@
+###############################################################
+#
+# Tests of the array-backed tables of tabulated properties
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# Python imports
+import numpy as np
+import pytest
+import yaml
+
+from data_hub.library.regimes.Regime import Regime
+from data_hub.library.regimes.Table import Table, to_table
+
+
+def test_tables_are_sorted_arrays():
+    table = Table.from_dict({50.: 910., 0.: 900., 100.: 930.}, {50.: 2., 0.: 1., 100.: 3.})
+    assert len(table) == 3 and table.dimension == 1
+    np.testing.assert_array_equal(table.keys, [0., 50., 100.])
+    np.testing.assert_array_equal(table.values, [900., 910., 930.])
+    np.testing.assert_array_equal(table.dev, [1., 2., 3.])
+    assert all(array.flags.c_contiguous for array in (table.keys, table.values, table.dev))
+    assert table.to_dict() == {0.: 900., 50.: 910., 100.: 930.}
+    assert table.dev_to_dict() == {0.: 1., 50.: 2., 100.: 3.}
+
+
+def test_coordinates_as_keys():
+    table = Table.from_dict({(1., 0.): 3., (0., 1.): 2., (0., 0.): 1.})
+    assert table.dimension == 2
+    np.testing.assert_array_equal(table.keys, [[0., 0.], [0., 1.], [1., 0.]])
+    assert table.to_dict() == {(0., 0.): 1., (0., 1.): 2., (1., 0.): 3.}
+    assert table.dev_to_dict() is None
+
+
+def test_invalid_tables():
+    with pytest.raises(ValueError, match='one value per key'):
+        Table([0., 1.], [1.])
+    with pytest.raises(ValueError, match='one dev_value per key'):
+        Table([0., 1.], [1., 2.], dev=[1.])
+    table = Table([0., 1.], [1., 2.]).set_readonly()
+    with pytest.raises(ValueError):
+        table.values[0] = 3.
+
+
+def test_to_table():
+    prop = {'type': 'tabulated', 'value': {10: 0.39, 0: 0.65}, 'dev_value': {0: 0.1, 10: 0.2}}
+    assert to_table(prop)
+    assert isinstance(prop['value'], Table)
+    assert prop['dev_value'] is prop['value'].dev
+    np.testing.assert_array_equal(prop['dev_value'], [0.1, 0.2])
+    # tables which cannot be converted stay dictionaries
+    for prop in ({'type': 'tabulated', 'value': {'a': 'b'}}, {'type': 'tabulated', 'value': {}},
+                 {'type': 'scalar', 'value': 1.}):
+        value = prop['value']
+        assert not to_table(prop)
+        assert prop['value'] is value
+
+
+def test_regime_writes_tables_as_dictionaries(write_yaml, tmp_path):
+    props = {'density': {'type': 'tabulated', 'value': {50.: 910., 0.: 900.}, 'dev_value': {0.: 1., 50.: 2.},
+                         'variable': 'depth'}}
+    regime = Regime(file_name=write_yaml(props))
+    assert isinstance(regime.props['density']['value'], Table)
+    assert regime.prop_to_dict('density')['dev_value'] == {0.: 1., 50.: 2.}
+    regime.save_regime(str(tmp_path / 'saved.yaml'))
+    with open(tmp_path / 'saved.yaml') as file:
+        saved = yaml.safe_load(file)
+    assert saved['density']['value'] == {0.: 900., 50.: 910.}
+    assert saved['density']['dev_value'] == {0.: 1., 50.: 2.}
@@ -0,0 +1,52 @@
+###############################################################
+#
+# Tests of the tile pyramids and the tile server
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# imports from system libraries if necessary
+import os
+import urllib.error
+import urllib.request
+
+# Python imports
+import numpy as np
+import pytest
+from PIL import Image
+
+from data_hub.library.map.Map import Map
+from data_hub.library.map.Tiles import TileServer, build_tile_pyramid
+
+
+def _get(url):
+    with urllib.request.urlopen(url) as response:
+        return response.read()
+
+
+def test_tile_server_serves_tiles_built_later(tmp_path):
+    tile_dir = tmp_path / 'Europa' / '0' / '0'
+    server = TileServer(str(tmp_path), port=0).start()
+    try:
+        url = server.url('Europa').format(z=0, x=0, y=0)
+        with pytest.raises(urllib.error.HTTPError):  # not built yet
+            _get(url)
+        os.makedirs(tile_dir)
+        (tile_dir / '0.png').write_bytes(b'first')
+        assert _get(url) == b'first'
+        (tile_dir / '0.png').write_bytes(b'second version')  # rebuilt while the server runs
+        assert _get(url) == b'second version'
+    finally:
+        server.stop()
+
+
+def test_offline_map_uses_the_lowest_built_zoom_level(tmp_path):
+    source_file = tmp_path / 'europa.png'
+    Image.fromarray(np.full((32, 64, 4), 200, dtype=np.uint8), 'RGBA').save(source_file)
+    build_tile_pyramid(str(source_file), str(tmp_path), 'Europa', zoom_min=2, zoom_max=3, tile_size=16)
+
+    location_map = Map(map_offline=True, map_name='Europa')
+    location_map.load_map(data_file_path=str(tmp_path))
+    assert location_map.tiles_zoom_min == 2
+    location_map.show_map(filename_html=str(tmp_path / 'map.html'))
+    assert '"minZoom": 2' in (tmp_path / 'map.html').read_text()
@@ -0,0 +1,79 @@
+###############################################################
+#
+# Tests of the Monte Carlo propagation of uncertainties
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# Python imports
+import numpy as np
+import pytest
+
+from data_hub.library.regimes.Regime import Regime
+from data_hub.library.regimes.Uncertainty import MonteCarlo
+
+PROPS = {
+    'density': {'type': 'scalar', 'value': 1000., 'dev_pdf': 'Gauss', 'dev_value': 10.},
+    'gravity': {'type': 'scalar', 'value': 9.81},
+    'pressure': {'type': 'expression', 'value': 'density*gravity*x', 'variable': 'depth'},
+    'density_firn': {'type': 'tabulated', 'value': {0.: 400., 50.: 600., 100.: 800.}, 'dev_pdf': 'Gauss',
+                     'dev_value': {0.: 20., 50.: 20., 100.: 20.}, 'variable': 'depth'},
+    'pressure_firn': {'type': 'expression', 'value': 'density_firn*gravity*x', 'dev_pdf': 'Gauss', 'dev_value': 100.,
+                      'variable': 'depth'},
+}
+
+
+def test_std_of_expression_from_scalar(write_yaml):
+    regime = Regime(file_name=write_yaml(PROPS))
+    depth = np.array([1., 10., 100.])
+    result = MonteCarlo(regime, n_samples=200000, seed=1).propagate('pressure', depth)['pressure']
+    np.testing.assert_allclose(result['mean'], 1000. * 9.81 * depth, rtol=1e-3)
+    np.testing.assert_allclose(result['std'], 10. * 9.81 * depth, rtol=1e-2)
+
+
+def test_std_of_expression_from_table(write_yaml):
+    regime = Regime(file_name=write_yaml(PROPS))
+    depth = np.array([50., 25.])
+    result = MonteCarlo(regime, n_samples=200000, seed=1).propagate('pressure_firn', depth)['pressure_firn']
+    # at 25 m the two entries (dev 20 each) are weighted by 0.5, the expression adds its own dev of 100
+    dev_table = np.array([20., 20. * np.sqrt(0.5)])
+    np.testing.assert_allclose(result['std'], np.sqrt((dev_table * 9.81 * depth) ** 2 + 100. ** 2), rtol=1e-2)
+
+
+@pytest.mark.parametrize('kind', ['linear', 'nearest', 'previous', 'quadratic', 'cubic'])
+def test_tables_are_sampled_with_the_interpolation_of_the_regime(write_yaml, kind):
+    keys = [0., 10., 30., 60., 100.]
+    props = {'density_firn': {'type': 'tabulated', 'value': dict(zip(keys, [400., 450., 600., 650., 800.])),
+                              'dev_pdf': 'Gauss', 'dev_value': dict.fromkeys(keys, 10.), 'variable': 'depth'}}
+    regime = Regime(file_name=write_yaml(props))
+    depth = np.array([0., 17., 42., 99.])
+    result = MonteCarlo(regime, n_samples=100000, seed=1, interpolation_type=kind).propagate('density_firn', depth)
+    expected = regime.get_prop_values('density_firn', depth, interpolation_type=kind, as_dataframe=False)[:, 0]
+    np.testing.assert_allclose(result['density_firn']['mean'], expected, atol=0.2)
+
+
+@pytest.mark.parametrize('kind', ['grid', 'cubic', 'nearest'])
+def test_coordinate_tables_are_sampled_with_the_interpolation_of_the_regime(write_yaml, kind):
+    points = [(x, y) for x in (0., 1., 3.) for y in (0., 2.)]
+    values = [100. * x + y ** 2 for x, y in points]
+    props = {'temperature': {'type': 'tabulated', 'value': dict(zip(points, values)),
+                             'dev_value': dict.fromkeys(points, 0.), 'variable': 'position'}}
+    regime = Regime(file_name=write_yaml(props))
+    position = np.array([(0.5, 0.5), (2., 1.5), (0.9, 0.1)])
+    result = MonteCarlo(regime, n_samples=10, interpolation_type=kind).propagate('temperature', position)
+    expected = regime.get_prop_values('temperature', position, interpolation_type=kind, as_dataframe=False)[:, 0]
+    np.testing.assert_allclose(result['temperature']['mean'], expected)
+    with pytest.raises(ValueError, match='Unknown kind'):
+        MonteCarlo(regime, n_samples=10, interpolation_type='spline').propagate('temperature', position)
+
+
+def test_histograms_are_widened_for_later_chunks():
+    rng = np.random.default_rng(1)
+    chunks = [np.full((100, 2), np.nan), rng.uniform(0., 1., (1000, 2)), rng.uniform(0., 100., (9000, 2))]
+    chunks[0][:, 1] = 50.  # the first point has no values in the first chunk
+    samples = np.concatenate(chunks)
+    result = MonteCarlo(bins=1000)._statistics(iter(chunks), (5., 50., 95.))
+    for percentile in (5., 50., 95.):
+        np.testing.assert_allclose(result[f'p{percentile:g}'], np.nanpercentile(samples, percentile, axis=0),
+                                   atol=0.3)
+    np.testing.assert_allclose(result['mean'], np.nanmean(samples, axis=0))
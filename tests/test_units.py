@@ -0,0 +1,67 @@
+###############################################################
+#
+# Tests of the unit parser and the conversion of units
+# MBD @ RWTH, October 2026
+#
+################################################################
+
+# imports from system libraries if necessary
+import copy
+import pickle
+
+# Python imports
+import numpy as np
+import pytest
+
+from data_hub.library.regimes.Regime import Regime
+from data_hub.library.regimes.Units import Unit, convert, parse_unit
+from . import DEFAULT_PROPS
+
+
+def test_unit_pickle_and_deepcopy_round_trip():
+    unit = parse_unit('degC')
+    for restored in (pickle.loads(pickle.dumps(unit)), copy.deepcopy(unit)):
+        assert isinstance(restored, Unit)
+        assert restored == unit
+        assert restored.offset == 273.15
+
+
+def test_regime_with_units_can_be_copied():
+    regime = Regime(file_name=DEFAULT_PROPS)
+    assert any(unit is not None for unit in regime.units.values())
+    copied = copy.deepcopy(regime)
+    assert copied.units == regime.units
+    assert pickle.loads(pickle.dumps(regime)).units == regime.units
+
+
+@pytest.mark.parametrize('unit_str, factor, exponents', [
+    ('km', 1e3, (0, 1, 0, 0, 0, 0, 0)),
+    ('MPa', 1e6, (1, -1, -2, 0, 0, 0, 0)),
+    ('g/cm^3', 1e3, (1, -3, 0, 0, 0, 0, 0)),
+    ('km h^-1', 1 / 3.6, (0, 1, -1, 0, 0, 0, 0)),
+    ('W/(m K)', 1., (1, 1, -3, -1, 0, 0, 0)),
+])
+def test_parse_unit_with_prefixes(unit_str, factor, exponents):
+    unit = parse_unit(unit_str)
+    assert unit.factor == pytest.approx(factor)
+    assert unit.exponents == exponents
+
+
+def test_convert_offset_units():
+    assert convert(0., 'degC', 'K') == pytest.approx(273.15)
+    assert convert(212., 'degF', 'degC') == pytest.approx(100.)
+    np.testing.assert_allclose(convert([273.15, 373.15], 'K', '°C'), [0., 100.])
+
+
+def test_convert_incompatible_units_raises():
+    with pytest.raises(ValueError, match='not compatible'):
+        convert(1., 'kg/m^3', 'Pa')
+    with pytest.raises(ValueError, match='Unknown unit'):
+        parse_unit('furlong')
+
+
+def test_unit_mismatch_warns_when_loading(write_yaml):
+    props = {'density': {'type': 'scalar', 'value': 917., 'unit_str': 'kg/m^3', 'unit': ['1 -1 -2 0 0 0 0']}}
+    with pytest.warns(UserWarning, match='does not match'):
+        regime = Regime(file_name=write_yaml(props))
+    assert regime.units['density'] == parse_unit('kg/m^3')